@@ -0,0 +1,133 @@
+import tkinter as tk
+
+# Fill color of a disc for each value of a board cell
+DISC_COLORS = {' ': 'white', 'red': 'red', 'yellow': 'yellow'}
+
+
+class BoardCanvas(tk.Canvas):
+    """The Connect Four board drawn on a single canvas.
+
+    The 42 discs are created once as oval items. A disc is only recolored when its cell changes, and reset() reuses
+    the same items for the next game, so the number of widgets and canvas items stays the same however many games
+    are played.
+
+    Attributes:
+        on_click (callable): Called with the column index when the board is clicked while it is enabled.
+        enabled (bool): Whether clicks are passed on to on_click.
+        cells (list): The color shown for each cell, top row first.
+        discs (list): The canvas item of each cell, top row first.
+        highlighted (tuple): The row and column of the highlighted disc, or None.
+    """
+
+    CELL_SIZE = 60
+    PADDING = 5
+
+    def __init__(self, master, on_click):
+        """Create the board with 42 empty discs.
+
+        Args:
+            master (tk.Widget): The parent widget.
+            on_click (callable): Called with the column index when the board is clicked.
+
+        Returns:
+            None
+        """
+        super().__init__(master, width=7 * self.CELL_SIZE, height=6 * self.CELL_SIZE, bg='blue',
+                         highlightthickness=0)
+        self.on_click = on_click
+        self.enabled = True
+        self.cells = [[' '] * 7 for _ in range(6)]
+        self.discs = []
+        for i in range(6):
+            row = []
+            for j in range(7):
+                x, y = j * self.CELL_SIZE, i * self.CELL_SIZE
+                row.append(self.create_oval(x + self.PADDING, y + self.PADDING, x + self.CELL_SIZE - self.PADDING,
+                                            y + self.CELL_SIZE - self.PADDING, fill=DISC_COLORS[' '], width=1))
+            self.discs.append(row)
+        self.highlighted = None
+        self.bind('<Button-1>', self.click)
+
+    def reset(self):
+        """Empty the board for a new game.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        for i in range(6):
+            for j in range(7):
+                self.set_cell(i, j, ' ')
+        self.clear_highlight()
+        self.enabled = True
+
+    def set_cell(self, row: int, column: int, color: str):
+        """Show a cell in a color, recoloring the disc only if the color changed.
+
+        Args:
+            row (int): The row index, top row first.
+            column (int): The column index.
+            color (str): ' ', 'red' or 'yellow'.
+
+        Returns:
+            None
+        """
+        if self.cells[row][column] != color:
+            self.cells[row][column] = color
+            self.itemconfigure(self.discs[row][column], fill=DISC_COLORS[color])
+
+    def update_column(self, board: list, column: int):
+        """Show the cells of a column as they are on a game board.
+
+        Args:
+            board (list): The board of a Logic object.
+            column (int): The column index.
+
+        Returns:
+            None
+        """
+        for i in range(6):
+            self.set_cell(i, column, board[i][column])
+
+    def highlight(self, row: int, column: int):
+        """Draw a thick outline around a disc, removing the previous highlight.
+
+        Args:
+            row (int): The row index, top row first.
+            column (int): The column index.
+
+        Returns:
+            None
+        """
+        self.clear_highlight()
+        self.itemconfigure(self.discs[row][column], width=4)
+        self.highlighted = (row, column)
+
+    def clear_highlight(self):
+        """Remove the highlight, if any.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.highlighted is not None:
+            row, column = self.highlighted
+            self.itemconfigure(self.discs[row][column], width=1)
+            self.highlighted = None
+
+    def click(self, event):
+        """Pass a click on the board on to on_click as a column index.
+
+        Args:
+            event (tk.Event): The click event.
+
+        Returns:
+            None
+        """
+        column = event.x // self.CELL_SIZE
+        if self.enabled and 0 <= column <= 6:
+            self.on_click(column)
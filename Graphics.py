@@ -1,10 +1,44 @@
 import tkinter as tk
-from tkmacosx import Button
-from PIL import ImageTk, Image
-import platform
-from MiniMax import *
-from Logic import *
+import os
+from engine import (Logic, MiniMax, SearchTimeout, OpeningBook, Solver, outcome, SearchWorker, AnalysisCache,
+                    CENTER_ORDER)
 from Lines import *
+from BoardCanvas import BoardCanvas
+
+# Opening book used for the AI and hints when present (build it with python -m engine build-book)
+BOOK_PATH = 'books/opening.book'
+
+# Image of Clippy, and the copy resized to CLIPPY_SIZE that is made on the first start
+CLIPPY_PATH = 'images/clippy.png'
+CLIPPY_CACHE_PATH = 'images/clippy_small.png'
+CLIPPY_SIZE = (100, 100)
+
+# Hints use the exact solver once this many pieces are on the board, if it finishes within the node limit
+SOLVER_MIN_MOVES = 12
+SOLVER_NODE_LIMIT = 100000
+
+# Milliseconds between two checks for finished searches
+POLL_INTERVAL = 20
+
+def clippy_image() -> tk.PhotoImage:
+    """Load the image of Clippy at CLIPPY_SIZE.
+
+    The resized image is saved to CLIPPY_CACHE_PATH, so Pillow is only imported and the image only resized when the
+    cache is missing or older than the original.
+
+    Args:
+        None
+
+    Returns:
+        tk.PhotoImage: The resized image.
+    """
+    # Check if the cache is missing or out of date
+    if not os.path.exists(CLIPPY_CACHE_PATH) or os.path.getmtime(CLIPPY_CACHE_PATH) < os.path.getmtime(CLIPPY_PATH):
+        from PIL import Image
+        with Image.open(CLIPPY_PATH) as image:
+            image.resize(CLIPPY_SIZE, Image.LANCZOS).save(CLIPPY_CACHE_PATH)
+    return tk.PhotoImage(file=CLIPPY_CACHE_PATH)
+
 
 class Graphics:
     """A class representing the graphics for the Connect Four game.
@@ -16,11 +50,18 @@ class Graphics:
     Attributes:
         root (tk.Tk): The root window for the game.
         mm (MiniMax): A MiniMax object used for determining the AI's moves.
+        analysis (AnalysisCache): The cache in front of mm that hints, feedback and AI moves are searched through.
         ai_depth (int): The depth of the MiniMax algorithm used by the AI.
         suggestion_move (int): The column index of the suggested move for the player.
-        game_frame (tk.Frame): The frame containing the game board and buttons.
+        suggestion_key (int): The key of the position suggestion_move was found for.
+        game_frame (tk.Frame): The frame containing the game board and buttons, or the settings menu.
+        board_frame (tk.Frame): The frame containing the game board and buttons, hidden while the settings are shown.
+        board (BoardCanvas): The game board.
         ai_frame (tk.Frame): The frame containing the AI menu.
         lines (Lines): A Lines object containing Clippy's suggestion and feedback lines.
+        worker (SearchWorker): Runs all engine searches in a background thread, so the window never freezes.
+        thinking (bool): Whether the computer is searching for its move; clicks on the board are ignored meanwhile.
+        pondering (bool): Whether the computer is analysing the player's possible moves while the player thinks.
     """
 
     def __init__(self):
@@ -39,16 +80,27 @@ class Graphics:
         self.root.title("Connect Four")
         self.root.resizable(False, False)
 
-        # Create MiniMax object
-        self.mm = MiniMax()
+        # Create MiniMax object, with the opening book if one was built
+        book = OpeningBook(BOOK_PATH) if os.path.exists(BOOK_PATH) else None
+        self.mm = MiniMax(book=book)
+        self.analysis = AnalysisCache(self.mm)
+        self.solver = Solver()
+
+        # Search in the background and check for results from the event loop
+        self.worker = SearchWorker(self.mm)
+        self.thinking = False
+        self.pondering = False
+        self.root.after(POLL_INTERVAL, self.poll_worker)
         self.ai_depth = 3
         self.suggestion_move = -1
+        self.suggestion_key = None
         self.move_count = 0
         self.style = "Play against the computer"
 
         # Create the game board frame and buttons
         self.game_frame = tk.Frame(self.root)
         self.game_frame.pack(side="left")
+        self.create_board()
         self.start_game()
 
         # Create the AI menu
@@ -64,12 +116,11 @@ class Graphics:
         # Start the main event loop
         self.root.mainloop()
 
-    def start_game(self):
-        """Start a new Connect 4 game.
+    def create_board(self):
+        """Create the game board, the turn label and the menu buttons.
 
-        This method initializes a new game board with 6 rows and 7 columns, as well as a label to display
-        the current player's turn. It also creates buttons for starting a new game, adjusting settings, and
-        getting a hint. When a button is clicked, it calls the corresponding method.
+        These widgets are created once and reused for every game. When the board is clicked, it calls make_move, and
+        when a menu button is clicked, it calls the corresponding method.
 
         Args:
             None
@@ -77,57 +128,67 @@ class Graphics:
         Returns:
             None
         """
-        # Create a new game logic object
-        self.game = Logic()
+        self.board_frame = tk.Frame(self.game_frame)
+        self.board_frame.pack(side="left")
 
-        # Destroy the turn label if it already exists
-        try:
-            self.turn_label.destroy()
-        except:
-            pass
-
-        # Set button size based on OS
-        w, h = 5, 3
-        os_windows = True
-        if platform.system() == 'Darwin':
-            os_windows = False
-
-        # Create the game board as a grid of buttons
-        self.buttons = []
-        for i in range(6):
-            row = []
-            for j in range(7):
-                if os_windows:
-                    button = tk.Button(self.game_frame, width=w, height=h, bg='white',
-                                        command=lambda column=j: self.make_move(column))
-                else:
-                    button = Button(self.game_frame, width=50, height=50, bg='white',
-                                    command=lambda column=j: self.make_move(column))
-                button.grid(row=i, column=j, padx=2, pady=2)
-                row.append(button)
-            self.buttons.append(row)
+        # Create the game board as a canvas of discs
+        self.board = BoardCanvas(self.board_frame, self.make_move)
+        self.board.grid(row=0, columnspan=7, padx=2, pady=2)
 
         # Create a label to display the current player's turn
-        self.turn_label = tk.Label(self.game_frame, text="", font=("Arial", 16))
+        self.turn_label = tk.Label(self.board_frame, text="", font=("Arial", 16))
         self.turn_label.grid(row=6, columnspan=7)
 
         # Create the menu buttons
-        start_game_button = tk.Button(self.game_frame, text="New Game", command=self.start_game)
+        start_game_button = tk.Button(self.board_frame, text="New Game", command=self.start_game)
         start_game_button.grid(row=7, columnspan=7)
 
-        settings_button = tk.Button(self.game_frame, text="Settings", command=self.settings)
+        settings_button = tk.Button(self.board_frame, text="Settings", command=self.settings)
         settings_button.grid(row=8, columnspan=7)
 
-        hint_button = tk.Button(self.game_frame, text="Hint", command=self.set_suggestion)
+        hint_button = tk.Button(self.board_frame, text="Hint", command=self.set_suggestion)
         hint_button.grid(row=9, columnspan=7)
 
+    def start_game(self):
+        """Start a new Connect 4 game.
+
+        This method creates a new game logic object, empties the game board and clears the turn label.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        # Stop searching the old game and create a new game logic object
+        self.worker.cancel()
+        self.thinking = False
+        self.pondering = False
+        self.game = Logic()
+        self.worker.submit(lambda result: None, self.new_analysis)
+
+        # Reuse the board and label of the previous game
+        self.board.reset()
+        self.turn_label.config(text="")
+
+    def new_analysis(self):
+        """Forget the analysis of the previous game. This method runs on the background worker.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.mm.new_game()
+        self.analysis.clear()
 
     def make_move(self, column: int):
         """Make a move in the Connect 4 game.
 
         This method takes a column number as input, updates the game logic, and updates the graphics of the game board
-        to reflect the new move. It then checks for a winner and, if there is none, makes a move for the AI player using
-        the MiniMax algorithm.
+        to reflect the new move. It then checks for a winner and, if there is none, asks the background worker for a
+        move of the AI player using the MiniMax algorithm. Clicks are ignored while the AI is thinking.
 
         Args:
             column (int): The column number in which to make the move.
@@ -135,28 +196,116 @@ class Graphics:
         Returns:
             None
         """
+        if self.thinking:
+            return
+
+        # Stop pondering, the analysis it finished stays in the cache
+        if self.pondering:
+            self.worker.cancel()
+            self.pondering = False
+        self.board.clear_highlight()
+
         self.move_count += 1
         # Update the game logic and graphics for the player's move
+        # The feedback search runs first and leaves the analysis of the AI's position in the transposition table
         if self.move_count > 1:
-            self.set_feedback(column)
+            self.set_feedback(column, self.game.copy())
 
         move_made = self.game.make_move(column)
         self.update_graphics(column)
         win = self.check_winner()
-        if win:
-            return
-        
-        if self.style != "Play against yourself" and move_made:
-            # Make a move for the AI player
-            ai_move, score = self.mm.get_best_move(self.game, self.ai_depth)
-            self.game.make_move(ai_move)
-            self.update_graphics(ai_move)
-            self.check_winner()
+
+        if self.style != "Play against yourself" and move_made and not win:
+            # Let the AI player search for a move in the background
+            self.thinking = True
+            self.turn_label.config(text="Thinking...")
+            self.worker.submit(self.finish_ai_move, self.analysis.get_best_move, self.game.copy(), self.ai_depth,
+                               errback=self.ai_move_failed)
+
+    def finish_ai_move(self, result: tuple):
+        """Play the move the AI player found.
+
+        This method is called by the background worker when the AI search is done.
+
+        Args:
+            result (tuple): The column and score returned by MiniMax.get_best_move.
+
+        Returns:
+            None
+        """
+        ai_move, score = result
+        self.thinking = False
+        self.turn_label.config(text="")
+        self.game.make_move(ai_move)
+        self.update_graphics(ai_move)
+        if not self.check_winner():
+            self.pondering = True
+            self.worker.submit(self.finish_pondering, self.ponder, self.game.copy(), self.ai_depth)
+
+    def ai_move_failed(self, error: Exception):
+        """Give the turn back to the player. This method is called by the background worker when the AI search fails.
+
+        Args:
+            error (Exception): The exception the search raised.
+
+        Returns:
+            None
+        """
+        self.thinking = False
+        self.turn_label.config(text="")
+        raise error
+
+    def ponder(self, game: Logic, depth: int):
+        """Analyse the player's possible moves while the player thinks. This method runs on the background worker.
+
+        The AI's reply to each move of the player is searched, most central move first, and the results are kept in
+        the analysis cache, so the AI can answer the actual move at once. The feedback search of the position comes
+        last; it is cheap by then, because the replies have filled the transposition table.
+
+        Args:
+            game (Logic): The position in which the player is to move.
+            depth (int): The depth of the AI's search.
+
+        Returns:
+            None
+        """
+        for column in CENTER_ORDER:
+            if game.make_move(column):
+                if not game.check_last_move():
+                    self.analysis.get_best_move(game, depth)
+                game.unmake_move(column)
+        self.analysis.get_best_move(game, depth + 1)
+
+    def finish_pondering(self, result):
+        """Note that pondering is done. This method is called by the background worker.
+
+        Args:
+            result (None): The return value of ponder.
+
+        Returns:
+            None
+        """
+        self.pondering = False
+
+    def poll_worker(self):
+        """Handle the searches the background worker has finished, and check again after POLL_INTERVAL.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        # Keep polling even if a callback fails
+        try:
+            self.worker.poll()
+        finally:
+            self.root.after(POLL_INTERVAL, self.poll_worker)
 
     def update_graphics(self, column: int):
         """Update the graphics of the game board to reflect a move.
 
-        This method takes a column number as input and updates the color of the button(s) in that column to reflect the
+        This method takes a column number as input and updates the color of the disc(s) in that column to reflect the
         player who made the most recent move.
 
         Args:
@@ -165,18 +314,14 @@ class Graphics:
         Returns:
             None
         """
-        for i in range(6):
-            if self.game.board[i][column] == 'red':
-                self.buttons[i][column].config(bg='red')
-            elif self.game.board[i][column] == 'yellow':
-                self.buttons[i][column].config(bg='yellow')
+        self.board.update_column(self.game.board, column)
 
     def check_winner(self):
         """Check if there is a winner and update the game state accordingly.
 
         This method takes a column number as input, checks if there is a winner in the game, and updates the game state and
-        graphics accordingly. If there is a winner, it displays a message declaring the winner and disables the buttons on
-        the game board.
+        graphics accordingly. If there is a winner, it displays a message declaring the winner and disables the game
+        board.
 
         Args:
             None
@@ -184,20 +329,13 @@ class Graphics:
         Returns:
             None
         """
-        winner = self.game.check_win()
+        winner = self.game.check_last_move()
         if winner:
             if winner == 'yellow':
                 self.turn_label.config(text="Computer wins!")
             else:
                 self.turn_label.config(text="You win!")
-            for i in range(6):
-                for j in range(7):
-                    color = self.game.board[i][j]
-                    if color != ' ':
-                        self.buttons[i][j]['state'] = tk.DISABLED
-                        self.buttons[i][j].config(bg=color)
-                    else:
-                        self.buttons[i][j].config(state='disabled')
+            self.board.enabled = False
         return winner != None
 
     def create_ai_frame(self):
@@ -210,8 +348,8 @@ class Graphics:
             None
 
         """
-        # Create an object of tkinter ImageTk
-        self.img = ImageTk.PhotoImage(Image.open("images/clippy.png").resize((100, 100), Image.ANTIALIAS))
+        # Load the resized image of Clippy
+        self.img = clippy_image()
 
         # Create a label to display the image
         self.img_label = tk.Label(self.ai_frame, image=self.img)
@@ -229,7 +367,9 @@ class Graphics:
     def set_suggestion(self):
         """Set suggestion for the next move.
 
-        This method uses the MiniMax algorithm to determine the best move for the AI player and sets it as a suggestion. It also updates Clippy's text label with a random suggestion line.
+        This method asks the background worker for the best move for the player and shows it as a suggestion when the
+        search is done (see show_suggestion). Hints are ignored while the AI is thinking. Pondering is interrupted so
+        the hint does not wait for it, and starts again after the hint; what it finished stays in the cache.
 
         Args:
             None
@@ -237,47 +377,150 @@ class Graphics:
         Returns:
             None
         """
-        # Get best move using MiniMax algorithm
-        move, _ = self.mm.get_best_move(self.game, self.ai_depth + 1)
+        if self.thinking:
+            return
+        pondering = self.pondering
+        if pondering:
+            self.worker.cancel()
+        self.clippy_text_label.config(text="Hmm, let me think...")
+        key = self.game.key
+        self.worker.submit(lambda suggestion: self.show_suggestion(suggestion, key), self.find_suggestion,
+                           self.game.copy(), self.ai_depth + 1, errback=self.suggestion_failed)
+        if pondering:
+            self.worker.submit(self.finish_pondering, self.ponder, self.game.copy(), self.ai_depth)
+
+    def find_suggestion(self, game: Logic, depth: int) -> tuple:
+        """Find the best move for the player. This method runs on the background worker.
+
+        This method uses the MiniMax algorithm to determine the best move. Later in the game it asks the exact solver
+        instead, which also tells how the game ends with perfect play.
+
+        Args:
+            game (Logic): A copy of the position.
+            depth (int): The MiniMax depth.
+
+        Returns:
+            tuple: The best column and the solver's (result, moves) outcome, or None if MiniMax was used.
+        """
+        # Solve the position exactly if it is late enough in the game
+        if game.move_count >= SOLVER_MIN_MOVES:
+            try:
+                move, score = self.solver.best_move(game, SOLVER_NODE_LIMIT)
+                return move, outcome(score, game.move_count)
+            except SearchTimeout:
+                pass
+
+        # Otherwise get best move using MiniMax algorithm
+        move, _ = self.analysis.get_best_move(game, depth)
+        return move, None
+
+    def show_suggestion(self, suggestion: tuple, key: int):
+        """Show a suggested move found by find_suggestion.
+
+        This method sets the suggestion move, highlights the cell where it would land and updates Clippy's text label with
+        a random suggestion line. A suggestion for a position that is no longer on the board is dropped.
+
+        Args:
+            suggestion (tuple): The column and outcome returned by find_suggestion.
+            key (int): The key of the position the suggestion was searched for.
+
+        Returns:
+            None
+        """
+        # Check if a move was made since the hint was asked for
+        if key != self.game.key:
+            return
+        move, result = suggestion
 
         # Set suggestion move
         self.suggestion_move = move
+        self.suggestion_key = key
+
+        # Highlight the lowest empty cell of the column
+        if self.game.board[0][move] == ' ':
+            row = max(i for i in range(6) if self.game.board[i][move] == ' ')
+            self.board.highlight(row, move)
 
-        nrows = len(self.game.board)
-        for i in range(nrows):
-            if self.game.board[i][move] != ' ':
-                self.buttons[i-1][move].focus_set()
-                break
-            elif i == nrows-1:
-                self.buttons[nrows-1][move].focus_set()
-                break
-        
-        #self.game.board
-        
         # Get random suggestion line from Clippy lines
         line = self.lines.get_random_suggestion(move+1)
+        if result is not None:
+            line += " " + self.outcome_line(*result)
         
         # Update Clippy text label with suggestion line
         self.clippy_text_label.config(text=line)
 
-    def set_feedback(self, player_move: int):
+    def suggestion_failed(self, error: Exception):
+        """Tell the player there is no hint. This method is called by the background worker when find_suggestion fails.
+
+        Args:
+            error (Exception): The exception find_suggestion raised.
+
+        Returns:
+            None
+        """
+        self.clippy_text_label.config(text="I've got nothing. Not that you'd have listened anyway.")
+
+    def outcome_line(self, result: str, moves: int) -> str:
+        """Return Clippy's comment on how the game ends with perfect play.
+
+        Args:
+            result (str): 'win', 'loss' or 'draw' for the player to move, as returned by Solver.outcome.
+            moves (int): The number of moves of the winner until the game is won.
+
+        Returns:
+            str: The comment.
+        """
+        if result == 'win':
+            if moves == 1:
+                return "You can win right now. Even you can't miss this one."
+            return f"Play it right and you win in {moves} moves. Big if."
+        if result == 'loss':
+            return f"Not that it matters, a perfect opponent wins in {moves} moves anyway."
+        return "With perfect play this ends in a draw. Thrilling."
+
+    def set_feedback(self, player_move: int, position: Logic):
         """Set feedback for the player's move.
 
         This method compares the player's move with the suggested move and updates Clippy's text label with a random feedback line if they are different. It also resets the suggestion move.
+        If no suggestion was made for the position, the best move is searched by the background worker first; the
+        feedback is dropped if another move was made by the time the search is done.
 
         Args:
             player_move (int): The column index of the player's move.
+            position (Logic): A copy of the position before the player's move.
 
         Returns:
             None
         """
         
-        # If no suggestion was made previously,
+        # If no suggestion was made for this position,
         # get best move using MiniMax algorithm
-        if self.suggestion_move == -1:
-            move, _ = self.mm.get_best_move(self.game, self.ai_depth + 1)
+        move_count = position.move_count + 1
+        if self.suggestion_key != position.key:
+            self.worker.submit(lambda result: self.show_feedback(result[0], player_move, move_count),
+                               self.analysis.get_best_move, position, self.ai_depth + 1)
         else:
-            move = self.suggestion_move
+            self.show_feedback(self.suggestion_move, player_move, move_count)
+
+        # Reset suggestion move
+        self.suggestion_move = -1
+        self.suggestion_key = None
+
+    def show_feedback(self, move: int, player_move: int, move_count: int):
+        """Show Clippy's feedback on the player's move.
+
+        Args:
+            move (int): The best move in the position before the player's move.
+            player_move (int): The column index of the player's move.
+            move_count (int): The number of pieces on the board after the player's move.
+
+        Returns:
+            None
+        """
+
+        # Check if another move was made since, then the feedback is too late
+        if self.game.move_count != move_count:
+            return
 
         # If suggested and actual moves are different,
         # update Clippy text label with feedback line
@@ -287,13 +530,10 @@ class Graphics:
         else:
             self.clippy_text_label.config(text="")
 
-        # Reset suggestion move
-        self.suggestion_move = -1
-
     def settings(self):
         """Display the settings menu.
 
-        This method clears the current game frame and creates a new frame for the settings menu. It allows the user to select the AI difficulty using a dropdown menu and includes a 'return' button to return to the game.
+        This method hides the game board and creates a new frame for the settings menu. It allows the user to select the AI difficulty using a dropdown menu and includes a 'return' button to return to the game.
 
         Args:
             None
@@ -302,9 +542,11 @@ class Graphics:
             None
         """
         
-        # Clear the current game frame
-        for widget in self.game_frame.winfo_children():
-            widget.destroy()
+        # Stop searching and hide the game board, it is shown again by return_to_game
+        self.worker.cancel()
+        self.thinking = False
+        self.pondering = False
+        self.board_frame.pack_forget()
 
         # Create a new frame for the settings menu
         settings_frame = tk.Frame(self.game_frame)
@@ -360,6 +602,7 @@ class Graphics:
         
         # Destroy settings frame and return to game
         settings_frame.destroy()
+        self.board_frame.pack(side="left")
 
         # Remove any text from 
         self.clippy_text_label.config(text="\"Oh great, another game of Connect Four. Hi, I'm Clippy - your paperclip assistant. I guess I'm here to provide you with hints and suggestions as you play against the computer or yourself. Not like I have anything better to do. Let's just get this over with.\"")
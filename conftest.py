@@ -0,0 +1,2 @@
+# Lets a plain "pytest" from the root of the repository import the engine package: pytest puts the directory of
+# this file on sys.path before it collects the tests
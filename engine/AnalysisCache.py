@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from .TranspositionTable import EXACT
+
+
+class AnalysisCache:
+    """A bounded cache of analysed positions in front of a MiniMax object.
+
+    Hints, feedback and the AI reply often ask for the same or closely related positions. This class answers a
+    get_best_move request from earlier work when it can, and only searches when it cannot:
+
+    - A position analysed before to at least the requested depth is answered from the cache.
+    - A position that was a node of an earlier search may have an exact result in the transposition table. A node
+      searched by minimax to depth + 1 looks exactly as far ahead as get_best_move to depth, so such an entry with
+      a best move answers the request.
+
+    Both break ties between equal moves like get_best_move, in favour of the most central column, so an answer from
+    earlier work is the move a search would have found. Only the mirror image of a stored position needs a check:
+    the tie-break prefers the left one of two columns at the same distance from the centre, so a stored move right
+    of the centre may be the mirror of a left move that is just as good (see resolve_mirror).
+
+    The least recently used entries are dropped when the cache is full.
+
+    Attributes:
+        mm (MiniMax): The engine used for searches.
+        max_entries (int): The maximum number of cached positions.
+        entries (OrderedDict): Maps the canonical key of a position (see Logic.canonical_key) to (depth, move, score),
+            least recently used first. A position and its mirror image share an entry; its move is for the position
+            with that key.
+        hits (int): The number of requests answered from the cache or the transposition table.
+        misses (int): The number of requests that needed a search.
+    """
+
+    def __init__(self, mm, max_entries: int = 4096):
+        """Initialize an empty cache.
+
+        Args:
+            mm (MiniMax): The engine used for searches.
+            max_entries (int): The maximum number of cached positions.
+
+        Returns:
+            None
+        """
+        self.mm = mm
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Remove all cached positions.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.entries.clear()
+
+    def lookup(self, logic, depth: int):
+        """Look up a position, without searching it other than for the check of resolve_mirror.
+
+        Args:
+            logic (Logic): The position.
+            depth (int): The requested get_best_move depth.
+
+        Returns:
+            tuple: The best column and its score, or None if no result of at least that depth is known.
+        """
+        key, mirrored = logic.canonical_key()
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < depth:
+            entry = None
+
+            # The position may have been a node of an earlier search
+            tt = self.mm.tt
+            if tt is not None:
+                stored = tt.probe(key)
+                if stored is not None and stored[2] == EXACT and stored[1] >= depth + 1 and stored[4] >= 0:
+                    entry = (stored[1] - 1, stored[4], stored[3])
+                    self.store(key, *entry)
+            if entry is None:
+                return None
+
+        self.entries.move_to_end(key)
+        move = 6 - entry[1] if mirrored else entry[1]
+        return self.resolve_mirror(logic, entry[0], move, entry[2]), entry[2]
+
+    def resolve_mirror(self, logic, depth: int, move: int, score) -> int:
+        """Apply the tie-break of get_best_move to a stored move right of the centre.
+
+        A stored move was the best one of the position it was searched in, which may have been the mirror image of
+        this one. A move left of the centre or in it is then still the best, but one right of it is not if the
+        column at the same distance left of the centre scores the same. That column is searched with the null
+        window [score, score], whose result equals score only if the column scores exactly that.
+
+        Args:
+            logic (Logic): The position.
+            depth (int): The get_best_move depth of the stored result.
+            move (int): The stored best column, for this position.
+            score (int): Its score.
+
+        Returns:
+            int: The column get_best_move would choose.
+        """
+        mirror = 6 - move
+        if move <= 3 or logic.board[0][mirror] != ' ':
+            return move
+        board = self.mm.copy_board(logic)
+        board.make_move(mirror)
+        if self.mm.minimax(board, depth, score, score, board.player) == score:
+            return mirror
+        return move
+
+    def store(self, key: int, depth: int, move: int, score):
+        """Add a result to the cache, dropping the least recently used entry if the cache is full.
+
+        Args:
+            key (int): The canonical key of the position.
+            depth (int): The get_best_move depth of the result.
+            move (int): The best column of the position with that key.
+            score (int): The score of the best column.
+
+        Returns:
+            None
+        """
+        old = self.entries.get(key)
+        if old is not None and old[0] > depth:
+            return
+        self.entries[key] = (depth, move, score)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get_best_move(self, logic, depth: int) -> tuple:
+        """Return the best move of a position, like MiniMax.get_best_move, reusing earlier work when possible.
+
+        Args:
+            logic (Logic): The position.
+            depth (int): The search depth.
+
+        Returns:
+            tuple: The best column and its score. The result may come from a deeper search than requested.
+        """
+        answer = self.lookup(logic, depth)
+        if answer is not None:
+            self.hits += 1
+            return answer
+
+        self.misses += 1
+        move, score = self.mm.get_best_move(logic, depth)
+        key, mirrored = logic.canonical_key()
+        self.store(key, depth, 6 - move if mirrored else move, score)
+        return move, score
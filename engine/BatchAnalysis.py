@@ -0,0 +1,146 @@
+import argparse
+import collections
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from .Protocol import handle_request, worker_engine
+from .SharedTranspositionTable import SharedTranspositionTable
+
+# The engine of a worker process, created by _init_worker
+_mm = None
+
+
+def _init_worker(tt_mb: float, shared_tt: str = None):
+    """Create the engine of a worker process of the pool; the arguments are those of worker_engine()."""
+    global _mm
+    _mm = worker_engine(tt_mb, shared_tt=shared_tt)
+
+
+def _analyse(request: dict) -> dict:
+    """Answer a request of Protocol.handle_request in a worker process."""
+    return handle_request(request, _mm)
+
+
+def resume_point(path: str) -> int:
+    """Count the complete results of an earlier run and drop a partly written last line.
+
+    Args:
+        path (str): The output file, which need not exist.
+
+    Returns:
+        int: The number of input lines that were already analysed.
+    """
+    if not os.path.exists(path):
+        return 0
+
+    count = 0
+    end = 0
+    with open(path, 'rb+') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            count += 1
+            end += len(line)
+        f.truncate(end)
+    return count
+
+
+def analyse_lines(lines, out, depth: int = None, time_limit: float = None, workers: int = 1, window: int = None,
+                  skip: int = 0, tt_mb: float = 32, shared_tt: SharedTranspositionTable = None) -> int:
+    """Analyse one position per line and write one JSON result per line, in the order of the input.
+
+    Every line is a string of columns (0-6) played from the empty board. At most window positions are in the pool at
+    a time, so memory does not grow with the size of the input. Results are flushed as soon as they are in order, so
+    an interrupted run can be resumed by skipping the lines that have a result.
+
+    Args:
+        lines (iterable): The input lines.
+        out (file): The text file the results are written to.
+        depth (int): The search depth, or the maximum depth if time_limit is given.
+        time_limit (float): The time budget of each position in seconds, or None for a fixed depth search.
+        workers (int): The number of worker processes.
+        window (int): The maximum number of positions being analysed at a time, by default 4 per worker.
+        skip (int): The number of input lines to skip, as returned by resume_point.
+        tt_mb (float): The memory cap of the transposition table of each worker in megabytes.
+        shared_tt (SharedTranspositionTable): A table all workers share instead of a table each, or None.
+
+    Returns:
+        int: The number of results written.
+    """
+    window = window or 4 * workers
+    pending = collections.deque()
+    written = 0
+
+    def write_oldest():
+        line_number, moves, future = pending.popleft()
+        result = {'line': line_number, 'moves': moves}
+        result.update(future.result())
+        out.write(json.dumps(result) + '\n')
+        out.flush()
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(tt_mb, getattr(shared_tt, 'name', None))) as pool:
+        for line_number, line in enumerate(lines, 1):
+            if line_number <= skip:
+                continue
+            moves = line.strip()
+            request = {'moves': moves}
+            if time_limit is not None:
+                request['time'] = time_limit
+                if depth is not None:
+                    request['depth'] = depth
+            else:
+                request['depth'] = depth
+            pending.append((line_number, moves, pool.submit(_analyse, request)))
+
+            # Wait for the oldest position before reading further
+            if len(pending) >= window:
+                write_oldest()
+                written += 1
+
+        while pending:
+            write_oldest()
+            written += 1
+    return written
+
+
+def main(args):
+    """Run the batch analysis from the command line.
+
+    Usage: python -m engine analyse-file [INPUT] [--out PATH] [--depth N | --time S] [--workers N] [--window N]
+
+    Args:
+        args (list): The command line arguments after the command name.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(prog='python -m engine analyse-file',
+                                     description="Analyse positions given as one string of columns per line.")
+    parser.add_argument('input', nargs='?', default='-', help="file with one position per line, or - for stdin")
+    parser.add_argument('--out', help="JSONL file to write; an existing file is resumed (default stdout)")
+    parser.add_argument('--depth', type=int, help="search depth (default 5), or maximum depth with --time")
+    parser.add_argument('--time', type=float, help="seconds per position for an iterative deepening search")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="search processes")
+    parser.add_argument('--window', type=int, help="positions in progress at a time (default 4 per worker)")
+    parser.add_argument('--shared-tt', type=float, default=0, help="megabytes of a transposition table shared by "
+                                                                   "the workers (default: one table per worker)")
+    parser.add_argument('--tt-file', help="file the shared table is loaded from at start and saved to at exit")
+    args = parser.parse_args(args)
+    depth = args.depth if args.depth is not None or args.time is not None else 5
+
+    skip = resume_point(args.out) if args.out else 0
+    source = sys.stdin if args.input == '-' else open(args.input)
+    out = open(args.out, 'a') if args.out else sys.stdout
+    shared_tt = SharedTranspositionTable.create(args.shared_tt, path=args.tt_file) if args.shared_tt > 0 else None
+    try:
+        written = analyse_lines(source, out, depth, args.time, args.workers, args.window, skip, shared_tt=shared_tt)
+    finally:
+        if shared_tt is not None:
+            shared_tt.shutdown(args.tt_file)
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    print(f"Analysed {written} positions, skipped {skip}", file=sys.stderr)
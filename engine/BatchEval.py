@@ -0,0 +1,78 @@
+import numpy as np
+from .Logic import WINDOWS, WINDOW_SCORES, RED_WEIGHT, YELLOW_WEIGHT
+
+# Cell values of a board array
+EMPTY = 0
+RED = 1
+YELLOW = 2
+
+# Terminal states returned by evaluate_batch, matching the results of Logic.check_win
+NOT_OVER = 0
+RED_WINS = 1
+YELLOW_WINS = 2
+DRAW = 3
+
+# Flat cell indices (row * 7 + column) of every window, in the order Logic.check_win scans them
+WINDOW_CELLS = np.array([[i * 7 + j for i, j in window] for window in WINDOWS], dtype=np.intp)
+
+# Window state contributed by each cell value, and the score of each window state
+CELL_WEIGHTS = np.array([0, RED_WEIGHT, YELLOW_WEIGHT], dtype=np.int8)
+STATE_SCORES = np.array(WINDOW_SCORES, dtype=np.int32)
+
+
+def boards_from_logic(logics) -> np.ndarray:
+    """Convert game logic objects into a board array for evaluate_batch.
+
+    Args:
+        logics (iterable): Logic or BitLogic objects.
+
+    Returns:
+        np.ndarray: An (N, 6, 7) int8 array with EMPTY, RED or YELLOW for every cell, top row first.
+    """
+    values = {' ': EMPTY, 'red': RED, 'yellow': YELLOW}
+    return np.array([[[values[cell] for cell in row] for row in logic.board] for logic in logics],
+                    dtype=np.int8).reshape(-1, 6, 7)
+
+
+def evaluate_batch(boards, chunk_size: int = 65536) -> tuple:
+    """Evaluate many positions at once.
+
+    The scores are the same as MiniMax.evaluate_board and the terminal states the same as Logic.check_win, but all
+    69 windows of all positions are reduced with array operations instead of a Python loop per window.
+
+    Args:
+        boards (array_like): An (N, 6, 7) integer array with EMPTY, RED or YELLOW for every cell, top row first.
+        chunk_size (int): The number of positions processed at a time, which bounds the temporary memory used.
+
+    Returns:
+        tuple: An (N,) int32 array of scores (positive is good for red) and an (N,) int8 array of terminal states
+        (NOT_OVER, RED_WINS, YELLOW_WINS or DRAW).
+    """
+    boards = np.asarray(boards)
+    if boards.ndim != 3 or boards.shape[1:] != (6, 7):
+        raise ValueError("Boards must have shape (N, 6, 7)")
+
+    n = boards.shape[0]
+    cells = boards.reshape(n, 42)
+    scores = np.empty(n, dtype=np.int32)
+    terminal = np.empty(n, dtype=np.int8)
+
+    for start in range(0, n, chunk_size):
+        chunk = cells[start:start + chunk_size]
+
+        # State of every window: red pieces + 5 * yellow pieces
+        states = CELL_WEIGHTS[chunk][:, WINDOW_CELLS].sum(axis=2, dtype=np.int8)
+        scores[start:start + chunk_size] = STATE_SCORES[states].sum(axis=1)
+
+        # The first window with four of a kind decides the winner, as in check_win
+        red_four = states == 4 * RED_WEIGHT
+        four = red_four | (states == 4 * YELLOW_WEIGHT)
+        first = four.argmax(axis=1)
+        red_first = red_four[np.arange(len(chunk)), first]
+        full = (chunk != EMPTY).all(axis=1)
+        terminal[start:start + chunk_size] = np.where(
+            four.any(axis=1),
+            np.where(red_first, RED_WINS, YELLOW_WINS),
+            np.where(full, DRAW, NOT_OVER))
+
+    return scores, terminal
@@ -0,0 +1,335 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from .BitLogic import BitLogic
+from .Logic import Logic
+from .MiniMax import MiniMax
+from .Positions import load_suite
+
+# Version of the JSON format written by run_benchmarks
+FORMAT_VERSION = 1
+
+# The suites of Positions.py the benchmarks use, in order
+BENCH_SUITES = ('opening', 'midgame', 'endgame')
+
+# Board classes by name
+BACKENDS = {'logic': Logic, 'bitlogic': BitLogic}
+
+# A board operation is repeated until it has taken at least this many seconds, so short runs are not lost in the
+# resolution of the clock; the time of one run is the total divided by the number of loops
+MIN_SECONDS = 0.05
+
+# Searches faster than this in the baseline are not compared, as the noise of a single run is too large
+MIN_COMPARE_SECONDS = 0.001
+
+# Allowed increase of time or nodes before compare() reports a regression
+DEFAULT_THRESHOLD = 0.10
+
+
+def best_time(run, repeat: int, min_seconds: float = MIN_SECONDS) -> float:
+    """Time a run several times and return the fastest.
+
+    Args:
+        run (callable): Does the work once and returns the seconds spent on the part that is measured.
+        repeat (int): The number of measurements to take the fastest of.
+        min_seconds (float): The time a measurement takes at least; the run is repeated as often as needed.
+
+    Returns:
+        float: The seconds of one run.
+    """
+    loops = 1
+    while True:
+        seconds = sum(run() for _ in range(loops))
+        if seconds >= min_seconds:
+            break
+        loops *= 2
+
+    best = seconds / loops
+    for _ in range(repeat - 1):
+        best = min(best, sum(run() for _ in range(loops)) / loops)
+    return best
+
+
+def peak_memory(run) -> int:
+    """Measure the memory a run allocates on top of what was allocated before it, at its peak.
+
+    Args:
+        run (callable): Does the work once.
+
+    Returns:
+        int: The peak in bytes, as traced by tracemalloc.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        run()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def operation_benchmarks(boards: list, repeat: int) -> dict:
+    """Time the board operations the search spends its time in.
+
+    Every operation is applied to every board, and make_move and unmake_move to every legal column of every board,
+    so one operation is one call (one call of each for make_unmake).
+
+    Args:
+        boards (list): The positions, as objects of the backend that is measured.
+        repeat (int): The number of measurements to take the fastest of.
+
+    Returns:
+        dict: For every operation its number of calls per run, nanoseconds per call, seconds per run and peak memory
+        in kilobytes.
+    """
+    mm = MiniMax(tt_mb=0)
+    moves = [(board, [j for j in range(7) if board.board[0][j] == ' ']) for board in boards]
+
+    def make_unmake():
+        started = time.perf_counter()
+        for board, columns in moves:
+            for j in columns:
+                board.make_move(j)
+                board.unmake_move(j)
+        return time.perf_counter() - started
+
+    def timed_calls(function):
+        def run():
+            started = time.perf_counter()
+            for board in boards:
+                function(board)
+            return time.perf_counter() - started
+        return run
+
+    operations = {
+        'make_unmake': (make_unmake, sum(len(columns) for _, columns in moves)),
+        'check_win': (timed_calls(lambda board: board.check_win()), len(boards)),
+        'check_last_move': (timed_calls(lambda board: board.check_last_move()), len(boards)),
+        'evaluate_board': (timed_calls(mm.evaluate_board), len(boards)),
+        'scan_board': (timed_calls(mm.scan_board), len(boards)),
+    }
+
+    results = {}
+    for name, (run, ops) in operations.items():
+        seconds = best_time(run, repeat)
+        results[name] = {
+            'ops': ops,
+            'ns_per_op': round(seconds / ops * 1e9, 1),
+            'seconds': seconds,
+            'peak_kb': round(peak_memory(run) / 1024, 1),
+        }
+    return results
+
+
+def search_benchmark(positions: list, depth: int, backend, algorithm: str, repeat: int) -> dict:
+    """Time get_best_move on a set of positions, every position starting with an empty transposition table.
+
+    Args:
+        positions (list): The positions, as Logic objects.
+        depth (int): The search depth.
+        backend (type): The board class to search with, or None for Logic.
+        algorithm (str): The search algorithm of MiniMax, 'alphabeta' or 'pvs'.
+        repeat (int): The number of measurements to take the fastest of.
+
+    Returns:
+        dict: The number of nodes searched, seconds per run over all positions, nodes per second, nanoseconds per
+        node and the peak memory of the largest search in kilobytes.
+    """
+    mm = MiniMax(backend, algorithm=algorithm)
+    nodes = 0
+
+    def run():
+        nonlocal nodes
+        nodes = 0
+        seconds = 0.0
+        for logic in positions:
+            mm.new_game()
+            started = time.perf_counter()
+            mm.get_best_move(logic, depth)
+            seconds += time.perf_counter() - started
+            nodes += mm.nodes
+        return seconds
+
+    # Every run starts with new_game(), which costs more than a short search, so searches are not looped
+    seconds = best_time(run, repeat, 0)
+
+    def traced():
+        peak = 0
+        for logic in positions:
+            mm.new_game()
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            mm.get_best_move(logic, depth)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+        return peak
+
+    tracemalloc.start()
+    try:
+        peak = traced()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'nodes': nodes,
+        'seconds': seconds,
+        'nodes_per_second': round(nodes / seconds) if seconds > 0 else 0,
+        'ns_per_node': round(seconds / nodes * 1e9, 1) if nodes else 0.0,
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(depths=range(1, 8), backend: str = 'logic', algorithm: str = 'alphabeta', repeat: int = 3,
+                   progress=None) -> dict:
+    """Run the whole benchmark suite.
+
+    Args:
+        depths (iterable): The search depths of get_best_move.
+        backend (str): The board class to measure, 'logic' or 'bitlogic'.
+        algorithm (str): The search algorithm of MiniMax, 'alphabeta' or 'pvs'.
+        repeat (int): The number of measurements of every benchmark to take the fastest of.
+        progress (callable): Called with the name and result of every benchmark when it is done, or None.
+
+    Returns:
+        dict: 'meta' describes the run and the machine; 'results' maps the name of every benchmark to its
+        measurements. Operations are named after the method, searches 'get_best_move/<suite>/<depth>'.
+    """
+    board_class = BACKENDS[backend]
+    positions = {suite: load_suite(suite) for suite in BENCH_SUITES}
+    results = {}
+
+    boards = [board_class.from_logic(logic) if board_class is not Logic else logic.copy()
+              for suite in BENCH_SUITES for logic in positions[suite]]
+    for name, result in operation_benchmarks(boards, repeat).items():
+        results[name] = result
+        if progress is not None:
+            progress(name, result)
+
+    for suite in BENCH_SUITES:
+        for depth in depths:
+            name = f'get_best_move/{suite}/{depth}'
+            results[name] = search_benchmark(positions[suite], depth, board_class if board_class is not Logic
+                                             else None, algorithm, repeat)
+            if progress is not None:
+                progress(name, results[name])
+
+    return {
+        'meta': {
+            'version': FORMAT_VERSION,
+            'backend': backend,
+            'algorithm': algorithm,
+            'repeat': repeat,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'system': platform.system(),
+        },
+        'results': results,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """Compare a report of run_benchmarks with an earlier one.
+
+    Benchmarks are compared on the seconds of one run, so a search that visits more nodes counts as slower even if
+    every node is as fast as before. Searches are also compared on their number of nodes, which does not depend on
+    the machine, so a baseline from another machine still catches a search that got worse. Benchmarks that are
+    missing from either report are skipped, and so are the times of searches that took less than
+    MIN_COMPARE_SECONDS in the baseline.
+
+    Args:
+        report (dict): The new report.
+        baseline (dict): The earlier report.
+        threshold (float): The allowed increase, e.g. 0.1 for 10%.
+
+    Returns:
+        list: (name, measurement, baseline value, new value, relative change) tuples of the benchmarks that
+        increased by more than the threshold; the measurement is 'seconds' or 'nodes'.
+    """
+    regressions = []
+    for name, result in report['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            continue
+        for key in ('seconds', 'nodes'):
+            if key not in result or key not in old or old[key] <= 0:
+                continue
+            if key == 'seconds' and 'nodes' in old and old['seconds'] < MIN_COMPARE_SECONDS:
+                continue
+            change = result[key] / old[key] - 1
+            if change > threshold:
+                regressions.append((name, key, old[key], result[key], change))
+    return regressions
+
+
+def format_result(name: str, result: dict) -> str:
+    """Return one line of the table printed while the benchmarks run."""
+    if 'nodes' in result:
+        return (f"{name:<28}{result['nodes']:>10} nodes{result['nodes_per_second']:>10} nodes/s"
+                f"{result['ns_per_node']:>10} ns/node{result['peak_kb']:>10} kB")
+    return f"{name:<28}{result['ops']:>10} ops  {result['ns_per_op']:>10} ns/op  {'':>10}{result['peak_kb']:>10} kB"
+
+
+def parse_depths(text: str) -> list:
+    """Parse a depth ('5') or a range of depths ('1-7')."""
+    first, _, last = text.partition('-')
+    return list(range(int(first), int(last or first) + 1))
+
+
+def main(args):
+    """Run the benchmarks from the command line, without any GUI.
+
+    Usage: python -m engine bench [--depths 1-7] [--backend logic|bitlogic] [--algorithm alphabeta|pvs]
+    [--repeat N] [--out PATH] [--baseline PATH] [--threshold 0.1]
+
+    The table is printed to stderr and the JSON report to stdout, or to --out. With --baseline the exit status is 1
+    if a benchmark became slower than the baseline, or a search visited more nodes, by more than the threshold.
+
+    Args:
+        args (list): The command line arguments after the command name.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(prog='python -m engine bench',
+                                     description="Time the board operations and the search on fixed positions.")
+    parser.add_argument('--depths', type=parse_depths, default=list(range(1, 8)),
+                        help="search depth or range of depths of get_best_move (default 1-7)")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='logic', help="board class to measure")
+    parser.add_argument('--algorithm', choices=MiniMax.ALGORITHMS, default='alphabeta', help="search algorithm")
+    parser.add_argument('--repeat', type=int, default=3, help="measurements to take the fastest of (default 3)")
+    parser.add_argument('--out', help="file to write the JSON report to (default stdout)")
+    parser.add_argument('--baseline', help="JSON report of an earlier run to compare with")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed increase of time or nodes against the baseline (default 0.1 for 10%%)")
+    args = parser.parse_args(args)
+
+    report = run_benchmarks(args.depths, args.backend, args.algorithm, args.repeat,
+                            lambda name, result: print(format_result(name, result), file=sys.stderr))
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for key in ('backend', 'algorithm'):
+            if baseline['meta'].get(key) != report['meta'][key]:
+                print(f"Warning: the baseline used {key} {baseline['meta'].get(key)}, this run "
+                      f"{report['meta'][key]}", file=sys.stderr)
+        regressions = compare(report, baseline, args.threshold)
+        for name, key, old, new, change in regressions:
+            if key == 'seconds':
+                old, new = f"{1000 * old:.3f} ms", f"{1000 * new:.3f} ms"
+            else:
+                old, new = f"{old} nodes", f"{new} nodes"
+            print(f"Regression: {name} {old} -> {new} ({100 * change:+.1f}%)", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (threshold {100 * args.threshold:.0f}%)", file=sys.stderr)
@@ -0,0 +1,391 @@
+from .Logic import ZOBRIST, WINDOWS, CELL_WINDOWS, WINDOW_SCORES, RED_WEIGHT, YELLOW_WEIGHT
+
+
+class BitLogic:
+    """A bitboard implementation of the game logic for Connect 4.
+
+    This class offers the same interface as Logic (make_move, unmake_move, check_win, check_node and board), but
+    stores the position as two integers instead of a 2D list of strings. Each column takes 7 bits: 6 for the rows
+    (bottom row first) and one empty sentinel bit that keeps lines from wrapping into the next column. A win is
+    detected with a few shifts and ANDs per direction instead of scanning every window.
+
+    Attributes:
+        bitboards (list): Two integers holding the pieces of red (index 0) and yellow (index 1).
+        heights (list): For each column, the bit index of its lowest free cell.
+        move_count (int): The number of pieces on the board.
+        player (int): The current player (1 or 2).
+        key (int): The Zobrist key of the position, equal to the key Logic has for the same position.
+        mirror_key (int): The Zobrist key of the left-right mirror image of the position.
+        windows (list): The state of each window in Logic.WINDOWS, kept up to date by make_move and unmake_move.
+        score (int): The sum of the window scores, which is the evaluation MiniMax uses.
+    """
+
+    # Number of bits per column (6 rows and a sentinel)
+    COLUMN_BITS = 7
+
+    # Bit shifts for the vertical, horizontal and both diagonal directions
+    DIRECTIONS = (1, 7, 6, 8)
+
+    # The bottom cell of every column
+    BOTTOM = sum(1 << (column * 7) for column in range(7))
+
+    # Every cell of the board (all bits but the sentinels)
+    BOARD = BOTTOM * 0x3F
+
+    # For every bit index, the Logic.WINDOWS that contain its cell (empty for sentinel bits)
+    BIT_WINDOWS = [CELL_WINDOWS[5 - bit % 7][bit // 7] if bit % 7 < 6 else () for bit in range(49)]
+
+    def __init__(self):
+        """Initialize the game logic.
+
+        This method initializes two empty bitboards and sets the current player to 1.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        # Initialize empty bitboards and column heights
+        self.bitboards = [0, 0]
+        self.heights = [column * self.COLUMN_BITS for column in range(7)]
+        self.move_count = 0
+        self.key = 0
+        self.mirror_key = 0
+        self.windows = [0] * len(WINDOWS)
+        self.score = 0
+
+        # Set current player to 1
+        self.player = 1
+
+    @classmethod
+    def from_logic(cls, logic) -> 'BitLogic':
+        """Create a bitboard copy of a Logic object.
+
+        Args:
+            logic (Logic): The game logic to convert.
+
+        Returns:
+            BitLogic: A new object holding the same position and player to move.
+        """
+        bit_logic = cls()
+        board = logic.board
+
+        # Fill each column from the bottom row upwards
+        for column in range(7):
+            for i in range(5, -1, -1):
+                if board[i][column] == ' ':
+                    break
+                index = 0 if board[i][column] == 'red' else 1
+                bit_logic.bitboards[index] |= 1 << bit_logic.heights[column]
+                bit_logic.heights[column] += 1
+                bit_logic.move_count += 1
+
+        bit_logic.player = logic.player
+        bit_logic.key = logic.key
+        bit_logic.mirror_key = logic.mirror_key
+        bit_logic.windows = list(logic.windows)
+        bit_logic.score = logic.score
+        return bit_logic
+
+    def copy(self) -> 'BitLogic':
+        """Return an independent copy of the game logic.
+
+        Args:
+            None
+
+        Returns:
+            BitLogic: A new object with the same position and player to move.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.bitboards = self.bitboards[:]
+        clone.heights = self.heights[:]
+        clone.move_count = self.move_count
+        clone.player = self.player
+        clone.key = self.key
+        clone.mirror_key = self.mirror_key
+        clone.windows = self.windows[:]
+        clone.score = self.score
+        return clone
+
+    @property
+    def board(self) -> list:
+        """list: A 2D list of the position in the same format as Logic.board (top row first)."""
+        red, yellow = self.bitboards
+        board = [[' ' for j in range(7)] for i in range(6)]
+        for column in range(7):
+            for r in range(6):
+                bit = 1 << (column * self.COLUMN_BITS + r)
+                if red & bit:
+                    board[5 - r][column] = 'red'
+                elif yellow & bit:
+                    board[5 - r][column] = 'yellow'
+        return board
+
+    def print_board(self):
+        """Print the game board.
+
+        This method prints the current state of the game board to the console.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        # Print each row of the game board
+        for row in self.board:
+            print("|".join(row))
+        print('')
+
+    def make_move(self, column: int) -> bool:
+        """Make a move on the game board.
+
+        This method places a piece on the specified column of the game board. It returns True if successful and False if unsuccessful (e.g. if column is full).
+
+        Args:
+            column (int): The column index where to place a piece.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+
+        # Check if column index is valid
+        if not 0 <= column <= 6:
+            raise ValueError("Column must be between 0 and 6")
+
+        # Column is full; move unsuccessful
+        if self.heights[column] == column * self.COLUMN_BITS + 6:
+            return False
+
+        # Place piece on lowest free cell of the column
+        height = self.heights[column]
+        self.bitboards[self.player - 1] |= 1 << height
+        row = 5 - height + column * self.COLUMN_BITS
+        self.key ^= ZOBRIST[self.player - 1][row][column]
+        self.mirror_key ^= ZOBRIST[self.player - 1][row][6 - column]
+        self.update_windows(height, RED_WEIGHT if self.player == 1 else YELLOW_WEIGHT)
+        self.heights[column] = height + 1
+        self.move_count += 1
+        self.player = 2 if self.player == 1 else 1
+        return True
+
+    def unmake_move(self, column: int):
+        """Unmake a move on the game board.
+
+        This method removes the top piece from specified column of the game board. It raises an error if unsuccessful (e.g. if column is empty).
+
+        Args:
+            column (int): The column index from where to remove a piece.
+
+        Returns:
+            None
+        """
+
+        # Check if column index is valid
+        if not 0 <= column <= 6:
+            raise ValueError("Column must be between 0 and 6")
+
+        # Column is empty; move unsuccessful
+        if self.heights[column] == column * self.COLUMN_BITS:
+            raise ValueError("Column is empty")
+
+        # Remove piece from highest occupied cell of the column
+        height = self.heights[column] - 1
+        bit = 1 << height
+        index = 0 if self.bitboards[0] & bit else 1
+        self.bitboards[index] &= ~bit
+        row = 5 - height + column * self.COLUMN_BITS
+        self.key ^= ZOBRIST[index][row][column]
+        self.mirror_key ^= ZOBRIST[index][row][6 - column]
+        self.update_windows(height, -RED_WEIGHT if index == 0 else -YELLOW_WEIGHT)
+        self.heights[column] = height
+        self.move_count -= 1
+        self.player = 2 if self.player == 1 else 1
+
+    def update_windows(self, bit: int, weight: int):
+        """Update the windows through a cell after a piece was placed on or removed from it.
+
+        Args:
+            bit (int): The bit index of the cell.
+            weight (int): The weight of the piece, negative if the piece was removed.
+
+        Returns:
+            None
+        """
+        windows = self.windows
+        score = self.score
+        for w in self.BIT_WINDOWS[bit]:
+            state = windows[w]
+            score += WINDOW_SCORES[state + weight] - WINDOW_SCORES[state]
+            windows[w] = state + weight
+        self.score = score
+
+    def check_node(self, i: int, column: int) -> bool:
+        """Check if a node is occupied by a specific player.
+
+        This method checks if the node at the specified row and column is occupied by the opposite player of the current player.
+
+        Args:
+            i (int): The row index of the node to be checked (0 is the top row).
+            column (int): The column index of the node to be checked.
+
+        Returns:
+            bool: True if node is occupied by opposite player, False otherwise.
+        """
+
+        # Check if node is occupied by opposite player
+        bit = 1 << (column * self.COLUMN_BITS + 5 - i)
+        opponent = 1 if self.player == 1 else 0
+        return bool(self.bitboards[opponent] & bit)
+
+    def canonical_key(self) -> tuple:
+        """Return the key a position shares with its mirror image, for tables that store both as one entry.
+
+        Args:
+            None
+
+        Returns:
+            tuple: The smaller of key and mirror_key, and whether it is mirror_key. In that case a column stored with
+            the key belongs to the mirror image and must be mirrored (6 - column) for this position.
+        """
+        if self.mirror_key < self.key:
+            return self.mirror_key, True
+        return self.key, False
+
+    def position_key(self) -> int:
+        """Return a key that identifies the position exactly.
+
+        In every 7 bit column group, the red pieces are kept and a marker bit is set just above the top piece. Unlike
+        the Zobrist key, two different positions can never get the same key, and the key never changes between
+        versions, so it can be stored in files.
+
+        Args:
+            None
+
+        Returns:
+            int: A 49 bit key.
+        """
+        red, yellow = self.bitboards
+        return red + (red | yellow) + self.BOTTOM
+
+    @classmethod
+    def mirror_position_key(cls, key: int) -> int:
+        """Return the position key of the left-right mirror image of a position.
+
+        Args:
+            key (int): A key returned by position_key().
+
+        Returns:
+            int: The key of the mirrored position.
+        """
+        mirrored = 0
+        for column in range(7):
+            mirrored |= ((key >> (column * cls.COLUMN_BITS)) & 0x7F) << ((6 - column) * cls.COLUMN_BITS)
+        return mirrored
+
+    @classmethod
+    def has_four(cls, bitboard: int) -> bool:
+        """Check if a bitboard contains four pieces in a row.
+
+        Args:
+            bitboard (int): The pieces of one player.
+
+        Returns:
+            bool: True if the pieces contain a horizontal, vertical or diagonal line of four, False otherwise.
+        """
+        for shift in cls.DIRECTIONS:
+            pairs = bitboard & (bitboard >> shift)
+            if pairs & (pairs >> 2 * shift):
+                return True
+        return False
+
+    @classmethod
+    def winning_cells(cls, position: int, mask: int) -> int:
+        """Return the empty cells that would complete a line of four for a player.
+
+        Args:
+            position (int): The pieces of the player.
+            mask (int): All pieces on the board.
+
+        Returns:
+            int: A bitboard of the empty cells (playable or not) that would win for the player.
+        """
+        # Vertical
+        cells = (position << 1) & (position << 2) & (position << 3)
+
+        # Horizontal and both diagonals
+        for shift in (7, 6, 8):
+            pair = (position << shift) & (position << 2 * shift)
+            cells |= pair & (position << 3 * shift)
+            cells |= pair & (position >> shift)
+            pair = (position >> shift) & (position >> 2 * shift)
+            cells |= pair & (position << shift)
+            cells |= pair & (position >> 3 * shift)
+
+        return cells & (cls.BOARD ^ mask)
+
+    def immediate_wins(self, player: int) -> list:
+        """Return the columns in which a player would complete a line of four with their next piece.
+
+        Args:
+            player (int): The player (1 or 2), who need not be the player to move.
+
+        Returns:
+            list: The winning columns, from left to right.
+        """
+        red, yellow = self.bitboards
+        mask = red | yellow
+        cells = self.winning_cells(red if player == 1 else yellow, mask) & (mask + self.BOTTOM)
+        if not cells:
+            return []
+        return [column for column in range(7) if (cells >> (column * self.COLUMN_BITS)) & 0x3F]
+
+    def check_win(self):
+        """
+        Check if there is a winner in the game.
+
+        This method checks both bitboards for four consecutive pieces. If a
+        winner is found, it returns the color of the winner. If there is no
+        winner but the board is full, it returns 'draw'. Otherwise, it returns
+        None.
+
+        Returns:
+            str: The color of the winner ('red' or 'yellow'), 'draw' if there is a draw,
+            or None if there is no winner yet.
+        """
+        if self.has_four(self.bitboards[0]):
+            return 'red'
+        if self.has_four(self.bitboards[1]):
+            return 'yellow'
+
+        # check if board is full
+        if self.move_count == 42:
+            return 'draw'
+        return None
+
+    def check_last_move(self):
+        """
+        Check if the last move ended the game.
+
+        Only the player who moved last can have completed a new four, so this
+        method only tests that player's bitboard.
+
+        Returns:
+            str: The color of the winner ('red' or 'yellow'), 'draw' if there is a draw,
+            or None if there is no winner yet.
+        """
+
+        # The previous player made the last move
+        if self.player == 2:
+            if self.has_four(self.bitboards[0]):
+                return 'red'
+        elif self.has_four(self.bitboards[1]):
+            return 'yellow'
+
+        # check if board is full
+        if self.move_count == 42:
+            return 'draw'
+        return None
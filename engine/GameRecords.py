@@ -0,0 +1,431 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+from .BitLogic import BitLogic
+from .Logic import Logic
+
+# File layout: header, records, index, footer. The index holds the offset of every INDEX_STRIDE-th record, so it
+# costs a fraction of a byte per game; a record in between is found by skipping at most INDEX_STRIDE - 1 records.
+# File header: magic, version, index stride
+HEADER = struct.Struct('<4sHH')
+# Record header: number of moves, result, search depth of red and of yellow (0 for a human player)
+RECORD = struct.Struct('<BBBB')
+# Index entry: offset of a record
+INDEX_ENTRY = struct.Struct('<Q')
+# Footer: offset of the index, number of records, magic
+FOOTER = struct.Struct('<QQ4s')
+MAGIC = b'C4GR'
+VERSION = 1
+INDEX_STRIDE = 64
+
+# Results of a game, as returned by result_code
+NOT_OVER = 0
+RED_WINS = 1
+YELLOW_WINS = 2
+DRAW = 3
+RESULT_NAMES = ['not over', 'red wins', 'yellow wins', 'draw']
+
+
+def pack_moves(moves) -> bytes:
+    """Pack columns into 3 bits each, first move in the lowest bits.
+
+    Args:
+        moves (list): The columns played (0-6).
+
+    Returns:
+        bytes: ceil(3 * len(moves) / 8) bytes, at most 16 for a full game.
+    """
+    value = 0
+    for i, column in enumerate(moves):
+        value |= column << (3 * i)
+    return value.to_bytes((3 * len(moves) + 7) // 8, 'little')
+
+
+def unpack_moves(packed: bytes, length: int) -> list:
+    """Unpack columns packed by pack_moves.
+
+    Args:
+        packed (bytes): The packed moves.
+        length (int): The number of moves.
+
+    Returns:
+        list: The columns played.
+    """
+    value = int.from_bytes(packed, 'little')
+    return [(value >> (3 * i)) & 7 for i in range(length)]
+
+
+def result_code(result) -> int:
+    """Translate the return value of Logic.check_win or check_last_move into a result.
+
+    Args:
+        result (str): 'red', 'yellow', 'draw' or None.
+
+    Returns:
+        int: NOT_OVER, RED_WINS, YELLOW_WINS or DRAW.
+    """
+    return {None: NOT_OVER, 'red': RED_WINS, 'yellow': YELLOW_WINS, 'draw': DRAW}[result]
+
+
+def replay_result(moves) -> int:
+    """Check that moves form a legal game and return its result.
+
+    Args:
+        moves (list): The columns played.
+
+    Returns:
+        int: NOT_OVER, RED_WINS, YELLOW_WINS or DRAW.
+
+    Raises:
+        ValueError: If a column is not 0-6, a column is full or a move is played after the game has ended.
+    """
+    board = BitLogic()
+    result = None
+    for column in moves:
+        if result is not None:
+            raise ValueError("Move after the end of the game")
+        if not board.make_move(column):
+            raise ValueError(f"Column {column} is full")
+        result = board.check_last_move()
+    return result_code(result)
+
+
+class GameRecord:
+    """One game of a record file.
+
+    The moves stay packed until they are needed, and positions are built by replaying the moves into a single Logic
+    object, so scanning a file does not create a board for every move of every game.
+
+    Attributes:
+        length (int): The number of moves.
+        result (int): NOT_OVER, RED_WINS, YELLOW_WINS or DRAW.
+        red_depth (int): The search depth of red, or 0 for a human player.
+        yellow_depth (int): The search depth of yellow, or 0 for a human player.
+        packed (bytes): The moves packed by pack_moves.
+    """
+
+    def __init__(self, length: int, result: int, red_depth: int, yellow_depth: int, packed: bytes):
+        self.length = length
+        self.result = result
+        self.red_depth = red_depth
+        self.yellow_depth = yellow_depth
+        self.packed = packed
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def moves(self) -> list:
+        """list: The columns played."""
+        return unpack_moves(self.packed, self.length)
+
+    def position(self, ply: int = None) -> Logic:
+        """Build the position after a number of moves.
+
+        Args:
+            ply (int): The number of moves to play, or None for all of them.
+
+        Returns:
+            Logic: The position.
+        """
+        logic = Logic()
+        for column in self.moves[:ply]:
+            logic.make_move(column)
+        return logic
+
+    def positions(self):
+        """Yield the position before the first move and after every move.
+
+        The same Logic object is yielded every time, with one more move played; copy it to keep a position.
+
+        Args:
+            None
+
+        Yields:
+            Logic: The position.
+        """
+        logic = Logic()
+        yield logic
+        for column in self.moves:
+            logic.make_move(column)
+            yield logic
+
+    def __repr__(self) -> str:
+        return (f"GameRecord(moves='{''.join(map(str, self.moves))}', result='{RESULT_NAMES[self.result]}', "
+                f"red_depth={self.red_depth}, yellow_depth={self.yellow_depth})")
+
+
+class GameWriter:
+    """Writes games to a record file.
+
+    The file is written under a temporary name and renamed when the writer is closed, so readers never see a half
+    written file. Use it as a context manager, or call close().
+
+    Attributes:
+        path (str): The path of the record file.
+        count (int): The number of games written.
+    """
+
+    def __init__(self, path: str):
+        """Start a new record file.
+
+        Args:
+            path (str): The path of the record file.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.count = 0
+        self.index = []
+        self.file = open(path + '.tmp', 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, INDEX_STRIDE))
+        self.offset = HEADER.size
+
+    def write(self, moves, result: int = NOT_OVER, red_depth: int = 0, yellow_depth: int = 0):
+        """Add a game.
+
+        Args:
+            moves (list): The columns played. Only their range is checked, not whether they form a legal game; see
+                replay_result.
+            result (int): NOT_OVER, RED_WINS, YELLOW_WINS or DRAW.
+            red_depth (int): The search depth of red, or 0 for a human player.
+            yellow_depth (int): The search depth of yellow, or 0 for a human player.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a column is not 0-6 or there are more than 42 moves, which the record cannot hold.
+        """
+        # Check if the moves fit in the record, 3 bits per column
+        if len(moves) > 42:
+            raise ValueError(f"A game has at most 42 moves, not {len(moves)}")
+        for column in moves:
+            if not 0 <= column <= 6:
+                raise ValueError("Column must be between 0 and 6")
+
+        if self.count % INDEX_STRIDE == 0:
+            self.index.append(self.offset)
+        data = RECORD.pack(len(moves), result, red_depth, yellow_depth) + pack_moves(moves)
+        self.file.write(data)
+        self.offset += len(data)
+        self.count += 1
+
+    def write_logic(self, logic, red_depth: int = 0, yellow_depth: int = 0):
+        """Add the game played on a Logic object.
+
+        Args:
+            logic (Logic): The game.
+            red_depth (int): The search depth of red, or 0 for a human player.
+            yellow_depth (int): The search depth of yellow, or 0 for a human player.
+
+        Returns:
+            None
+        """
+        self.write([column for _, column in logic.moves], result_code(logic.check_last_move()), red_depth,
+                   yellow_depth)
+
+    def close(self):
+        """Write the index and move the file into place.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.file.closed:
+            return
+        for offset in self.index:
+            self.file.write(INDEX_ENTRY.pack(offset))
+        self.file.write(FOOTER.pack(self.offset, self.count, MAGIC))
+        self.file.close()
+        os.replace(self.path + '.tmp', self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Leave no temporary file behind after an error
+            self.file.close()
+            os.remove(self.path + '.tmp')
+
+
+class GameReader:
+    """Reads games from a record file.
+
+    The file is memory-mapped, so only the pages that are read are loaded. Games can be read in order by iterating, or
+    by number with reader[i].
+
+    Attributes:
+        count (int): The number of games.
+    """
+
+    def __init__(self, path: str):
+        """Open a record file.
+
+        Args:
+            path (str): The path of the record file.
+
+        Returns:
+            None
+        """
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size + FOOTER.size:
+            raise ValueError(f"{path} is not a game record file")
+        magic, version, self.stride = HEADER.unpack_from(self.data, 0)
+        self.index_offset, self.count, end_magic = FOOTER.unpack_from(self.data, len(self.data) - FOOTER.size)
+        if magic != MAGIC or end_magic != MAGIC:
+            raise ValueError(f"{path} is not a complete game record file")
+        if version != VERSION:
+            raise ValueError(f"{path} has version {version}, expected {VERSION}")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def read_at(self, offset: int) -> tuple:
+        """Read the record at an offset.
+
+        Args:
+            offset (int): The offset of the record in the file.
+
+        Returns:
+            tuple: The GameRecord and the offset of the next record.
+        """
+        length, result, red_depth, yellow_depth = RECORD.unpack_from(self.data, offset)
+        start = offset + RECORD.size
+        end = start + (3 * length + 7) // 8
+        return GameRecord(length, result, red_depth, yellow_depth, self.data[start:end]), end
+
+    def __getitem__(self, i: int) -> GameRecord:
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("Game number out of range")
+
+        # Start at the nearest indexed record and skip over the records in between
+        offset = INDEX_ENTRY.unpack_from(self.data, self.index_offset + (i // self.stride) * INDEX_ENTRY.size)[0]
+        for _ in range(i % self.stride):
+            offset += RECORD.size + (3 * self.data[offset] + 7) // 8
+        return self.read_at(offset)[0]
+
+    def __iter__(self):
+        offset = HEADER.size
+        for _ in range(self.count):
+            record, offset = self.read_at(offset)
+            yield record
+
+    def close(self):
+        """Close the file.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def import_games(lines, path: str, check: bool = True) -> int:
+    """Write games given as strings of columns, one per line, to a record file.
+
+    Args:
+        lines (iterable): The games, e.g. '3342' for columns 3, 3, 4 and 2. Blank lines are skipped.
+        path (str): The path of the record file.
+        check (bool): Replay every game to check it and store its result; without this the result is NOT_OVER.
+
+    Returns:
+        int: The number of games written.
+
+    Raises:
+        ValueError: If a line is not a legal game, with its line number.
+    """
+    with GameWriter(path) as writer:
+        for line_number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                moves = [int(column) for column in line]
+                result = replay_result(moves) if check else NOT_OVER
+                writer.write(moves, result)
+            except ValueError as e:
+                raise ValueError(f"Line {line_number}: {e}") from None
+        return writer.count
+
+
+def export_games(path: str, out):
+    """Write the games of a record file as strings of columns, one per line.
+
+    Args:
+        path (str): The path of the record file.
+        out (file): The text file to write to.
+
+    Returns:
+        None
+    """
+    with GameReader(path) as reader:
+        for record in reader:
+            out.write(''.join(map(str, record.moves)) + '\n')
+
+
+def main(args):
+    """Convert between text files of games and record files from the command line.
+
+    Usage: python -m engine records import GAMES.txt GAMES.c4g | export GAMES.c4g [OUT.txt] | info GAMES.c4g
+
+    Args:
+        args (list): The command line arguments after the command name.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(prog='python -m engine records', description="Convert game record files.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    command = commands.add_parser('import', help="text file of games (one string of columns per line) to records")
+    command.add_argument('input', help="text file, or - for stdin")
+    command.add_argument('output', help="record file to write")
+    command.add_argument('--no-check', action='store_true', help="do not replay the games to check them")
+    command = commands.add_parser('export', help="records to a text file of games")
+    command.add_argument('input', help="record file")
+    command.add_argument('output', nargs='?', default='-', help="text file to write, or - for stdout")
+    command = commands.add_parser('info', help="count the games and results of a record file")
+    command.add_argument('input', help="record file")
+    args = parser.parse_args(args)
+
+    if args.command == 'import':
+        source = sys.stdin if args.input == '-' else open(args.input)
+        try:
+            count = import_games(source, args.output, not args.no_check)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+        print(f"Wrote {count} games to {args.output}", file=sys.stderr)
+    elif args.command == 'export':
+        out = sys.stdout if args.output == '-' else open(args.output, 'w')
+        try:
+            export_games(args.input, out)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+    else:
+        results = [0] * len(RESULT_NAMES)
+        with GameReader(args.input) as reader:
+            for record in reader:
+                results[record.result] += 1
+        print(f"{len(reader)} games, " + ', '.join(f"{name}: {n}" for name, n in zip(RESULT_NAMES, results)))
@@ -0,0 +1,163 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+async def http_request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str,
+                       body: dict = None) -> tuple:
+    """Send a request over an open keep-alive connection and read the response.
+
+    Args:
+        reader (asyncio.StreamReader): The incoming stream of the connection.
+        writer (asyncio.StreamWriter): The outgoing stream of the connection.
+        method (str): The HTTP method.
+        path (str): The path.
+        body (dict): The JSON body, or None.
+
+    Returns:
+        tuple: The HTTP status and the decoded JSON response.
+    """
+    data = json.dumps(body).encode() if body is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode('latin-1') + data)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+class LoadGenerator:
+    """Plays many random games against a GameServer at the same time and measures the response times.
+
+    Every game opens its own connection and plays random legal moves until the game ends. A move refused with 503 is
+    retried after a short pause; a move that timed out with 504 is retried at once.
+
+    Attributes:
+        host (str): The address of the server.
+        port (int): The port of the server.
+        depth (int): The search depth of the engine in each game.
+        latencies (list): The seconds taken by every move request that was answered with 200.
+        statuses (dict): The number of responses of each HTTP status.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, depth: int = 4, seed: int = None):
+        self.host = host
+        self.port = port
+        self.depth = depth
+        self.random = random.Random(seed)
+        self.latencies = []
+        self.statuses = {}
+
+    async def play_game(self):
+        """Play one game with random moves until it ends.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            status, state = await http_request(reader, writer, 'POST', '/games', {'depth': self.depth})
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            while state.get('winner') is None:
+                column = self.random.choice([j for j in range(7) if state['board'][0][j] == '.'])
+                start = time.perf_counter()
+                status, response = await http_request(reader, writer, 'POST', f"/games/{state['id']}/moves",
+                                                      {'column': column})
+                self.statuses[status] = self.statuses.get(status, 0) + 1
+                if status == 200:
+                    self.latencies.append(time.perf_counter() - start)
+                    state = response
+                elif status == 503:
+                    await asyncio.sleep(0.05 + 0.05 * self.random.random())
+                elif status != 504:
+                    raise RuntimeError(f"Unexpected response {status}: {response}")
+            await http_request(reader, writer, 'DELETE', f"/games/{state['id']}")
+        finally:
+            writer.close()
+
+    async def run(self, games: int, concurrency: int) -> dict:
+        """Play games, at most concurrency of them at the same time.
+
+        Args:
+            games (int): The number of games to play.
+            concurrency (int): The number of games played at the same time.
+
+        Returns:
+            dict: The report (see report).
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited():
+            async with semaphore:
+                await self.play_game()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(limited() for _ in range(games)))
+        return self.report(games, time.perf_counter() - start)
+
+    def report(self, games: int, seconds: float) -> dict:
+        """Summarize the measurements.
+
+        Args:
+            games (int): The number of games played.
+            seconds (float): The wall-clock time of the run.
+
+        Returns:
+            dict: The number of games and moves, moves per second, response time percentiles in milliseconds and the
+            number of responses of each HTTP status.
+        """
+        latencies = sorted(self.latencies)
+
+        def percentile(p):
+            return round(1000 * latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))], 1) if latencies \
+                else None
+
+        return {
+            'games': games,
+            'moves': len(latencies),
+            'seconds': round(seconds, 2),
+            'moves_per_second': round(len(latencies) / seconds, 1) if seconds > 0 else 0.0,
+            'p50_ms': percentile(50),
+            'p95_ms': percentile(95),
+            'p99_ms': percentile(99),
+            'max_ms': round(1000 * latencies[-1], 1) if latencies else None,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+        }
+
+
+def main(args):
+    """Run the load generator from the command line and print its report as JSON.
+
+    Usage: python -m engine load [--host HOST] [--port PORT] [--games N] [--concurrency N] [--depth N] [--seed N]
+
+    Args:
+        args (list): The command line arguments after the command name.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(prog='python -m engine load',
+                                     description="Play random games against a running game server.")
+    parser.add_argument('--host', default='127.0.0.1', help="address of the server")
+    parser.add_argument('--port', type=int, default=8765, help="port of the server")
+    parser.add_argument('--games', type=int, default=100, help="games to play")
+    parser.add_argument('--concurrency', type=int, default=20, help="games played at the same time")
+    parser.add_argument('--depth', type=int, default=4, help="search depth of the engine")
+    parser.add_argument('--seed', type=int, help="seed of the random moves")
+    args = parser.parse_args(args)
+
+    generator = LoadGenerator(args.host, args.port, args.depth, args.seed)
+    print(json.dumps(asyncio.run(generator.run(args.games, args.concurrency)), indent=2))
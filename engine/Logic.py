@@ -0,0 +1,347 @@
+
+import random
+
+# Zobrist keys for every color (red, yellow), row and column. The generator is
+# seeded so the same position gets the same key in every process.
+_zobrist_random = random.Random(20230601)
+ZOBRIST = [[[_zobrist_random.getrandbits(64) for j in range(7)] for i in range(6)] for color in range(2)]
+
+# All 69 lines of four cells, in the order check_win() scans them:
+# rows, columns, diagonals going down-right and diagonals going up-right
+WINDOWS = ([tuple((i, j + k) for k in range(4)) for i in range(6) for j in range(4)] +
+           [tuple((i + k, j) for k in range(4)) for i in range(3) for j in range(7)] +
+           [tuple((i + k, j + k) for k in range(4)) for i in range(3) for j in range(4)] +
+           [tuple((i - k, j + k) for k in range(4)) for i in range(3, 6) for j in range(4)])
+
+# For every cell, the indices of the windows it is part of (at most 13)
+CELL_WINDOWS = [[tuple(w for w, window in enumerate(WINDOWS) if (i, j) in window) for j in range(7)] for i in range(6)]
+
+# A window's state is (red pieces) + 5 * (yellow pieces); adding a piece adds its weight to the state
+RED_WEIGHT = 1
+YELLOW_WEIGHT = 5
+
+
+def _window_score(red: int, yellow: int) -> int:
+    """Return the score MiniMax.evaluate_window gives a window with the given number of pieces."""
+    if yellow == 0:
+        return (0, 2, 5, 10, 0)[red]
+    if red == 0:
+        return (0, -2, -5, -10, 0)[yellow]
+    return 0
+
+
+# Score of every window state, indexed by state
+WINDOW_SCORES = [_window_score(state % 5, state // 5) for state in range(25)]
+
+
+class Logic:
+    """A class representing the game logic for Connect 4.
+
+    This class manages the game board and allows players to make and unmake moves. It also includes methods for printing the board and checking if a node is occupied by a specific player.
+
+    Attributes:
+        board (list): A 2D list representing the game board.
+        player (int): The current player (1 or 2).
+        moves (list): The (row, column) cells of the moves made so far, in order.
+        move_count (int): The number of pieces on the board.
+        key (int): The Zobrist key of the position, kept up to date by make_move and unmake_move.
+        mirror_key (int): The Zobrist key of the left-right mirror image of the position, kept up to date likewise.
+        windows (list): The state of each window in WINDOWS, kept up to date by make_move and unmake_move.
+        score (int): The sum of the window scores, which is the evaluation MiniMax uses.
+    """
+
+    def __init__(self):
+        """Initialize the game logic.
+
+        This method initializes the game board as an empty 6x7 grid and sets the current player to 1.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        
+        # Initialize empty game board
+        self.board = [[' ' for j in range(7)] for i in range(6)]
+        
+        # Set current player to 1
+        self.player = 1
+
+        # Start with an empty move history
+        self.moves = []
+        self.move_count = 0
+
+        # The empty board has key 0
+        self.key = 0
+        self.mirror_key = 0
+
+        # All windows are empty
+        self.windows = [0] * len(WINDOWS)
+        self.score = 0
+
+    def copy(self) -> 'Logic':
+        """Return an independent copy of the game logic.
+
+        This method copies the board rows and the bookkeeping lists directly, which is much cheaper than
+        copy.deepcopy.
+
+        Args:
+            None
+
+        Returns:
+            Logic: A new object with the same position, player to move and move history.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.board = [row[:] for row in self.board]
+        clone.player = self.player
+        clone.moves = self.moves[:]
+        clone.move_count = self.move_count
+        clone.key = self.key
+        clone.mirror_key = self.mirror_key
+        clone.windows = self.windows[:]
+        clone.score = self.score
+        return clone
+
+    def print_board(self):
+        """Print the game board.
+
+        This method prints the current state of the game board to the console.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        
+        # Print each row of the game board
+        for row in self.board:
+            print("|".join(row))
+        print('')
+
+    def make_move(self, column: int) -> bool:
+        """Make a move on the game board.
+
+        This method places a piece on the specified column of the game board. It returns True if successful and False if unsuccessful (e.g. if column is full).
+
+        Args:
+            column (int): The column index where to place a piece.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        
+        # Check if column index is valid
+        if not 0 <= column <= 6:
+            raise ValueError("Column must be between 0 and 6")
+
+        # Place piece on lowest available row in specified column
+        for i in range(5, -1, -1):
+            if self.board[i][column] == ' ':
+                self.board[i][column] = 'red' if self.player == 1 else 'yellow'
+                self.key ^= ZOBRIST[self.player - 1][i][column]
+                self.mirror_key ^= ZOBRIST[self.player - 1][i][6 - column]
+                self.update_windows(i, column, RED_WEIGHT if self.player == 1 else YELLOW_WEIGHT)
+                self.player = 2 if self.player == 1 else 1
+                self.moves.append((i, column))
+                self.move_count += 1
+                return True
+
+        # Column is full; move unsuccessful
+        return False
+
+    def unmake_move(self, column: int):
+        """Unmake a move on the game board.
+
+        This method removes a piece from specified column of the game board. It raises an error if unsuccessful (e.g. if column is empty).
+
+        Args:
+            column (int): The column index from where to remove a piece.
+
+        Returns:
+            None
+        """
+            
+        # Check if column index is valid
+        if not 0 <= column <= 6:
+                raise ValueError("Column must be between 0 and 6")
+
+        # Remove piece from highest occupied row in specified column
+        for i in range(6):
+                if self.check_node(i ,column):
+                    index = 0 if self.board[i][column] == 'red' else 1
+                    self.key ^= ZOBRIST[index][i][column]
+                    self.mirror_key ^= ZOBRIST[index][i][6 - column]
+                    self.update_windows(i, column, -RED_WEIGHT if self.board[i][column] == 'red' else -YELLOW_WEIGHT)
+                    self.board[i][column] = ' '
+                    self.player = 2 if self.player==1 else 1 
+                    self.moves.pop()
+                    self.move_count -= 1
+                    return
+        
+        # Column is empty; move unsuccessful 
+        raise ValueError("Column is empty")
+
+    def canonical_key(self) -> tuple:
+        """Return the key a position shares with its mirror image, for tables that store both as one entry.
+
+        Args:
+            None
+
+        Returns:
+            tuple: The smaller of key and mirror_key, and whether it is mirror_key. In that case a column stored with
+            the key belongs to the mirror image and must be mirrored (6 - column) for this position.
+        """
+        if self.mirror_key < self.key:
+            return self.mirror_key, True
+        return self.key, False
+
+    def update_windows(self, i: int, column: int, weight: int):
+        """Update the windows through a cell after a piece was placed on or removed from it.
+
+        Args:
+            i (int): The row index of the cell.
+            column (int): The column index of the cell.
+            weight (int): The weight of the piece, negative if the piece was removed.
+
+        Returns:
+            None
+        """
+        windows = self.windows
+        score = self.score
+        for w in CELL_WINDOWS[i][column]:
+            state = windows[w]
+            score += WINDOW_SCORES[state + weight] - WINDOW_SCORES[state]
+            windows[w] = state + weight
+        self.score = score
+
+    def immediate_wins(self, player: int) -> list:
+        """Return the columns in which a player would complete a line of four with their next piece.
+
+        A column wins when one of the windows through its lowest free cell holds three pieces of the player and
+        none of the other, which the window states tell without looking at the board.
+
+        Args:
+            player (int): The player (1 or 2), who need not be the player to move.
+
+        Returns:
+            list: The winning columns, from left to right.
+        """
+        three = 3 * (RED_WEIGHT if player == 1 else YELLOW_WEIGHT)
+        board = self.board
+        windows = self.windows
+        wins = []
+        for column in range(7):
+            # Find the lowest free cell of the column
+            for i in range(5, -1, -1):
+                if board[i][column] == ' ':
+                    for w in CELL_WINDOWS[i][column]:
+                        if windows[w] == three:
+                            wins.append(column)
+                            break
+                    break
+        return wins
+
+    def check_node(self, i: int, column: int) -> bool:
+        """Check if a node is occupied by a specific player.
+
+        This method checks if the node at the specified row and column is occupied by the opposite player of the current player.
+
+        Args:
+            i (int): The row index of the node to be checked.
+            j (int): The column index of the node to be checked.
+
+        Returns:
+            bool: True if node is occupied by opposite player, False otherwise.
+        """
+        
+        # Check if node is occupied by opposite player
+        return ((self.player == 2 and self.board[i][column] == 'red') or
+                (self.player == 1 and self.board[i][column] == 'yellow'))
+    
+    def check_win(self):
+        """
+        Check if there is a winner in the game.
+
+        This method checks rows, columns and diagonals for four consecutive
+        pieces of the same color. If a winner is found, it returns the color
+        of the winner. If there is no winner but the board is full, it returns
+        'draw'. Otherwise, it returns None.
+
+        Returns:
+            str: The color of the winner ('R' or 'Y'), 'draw' if there is a draw,
+            or None if there is no winner yet.
+        """
+        
+        # check rows
+        for i in range(6):
+            for j in range(4):
+                if self.board[i][j] == self.board[i][j+1] == \
+                self.board[i][j+2] == self.board[i][j+3] != ' ':
+                    return self.board[i][j]
+
+        # check columns
+        for i in range(3):
+            for j in range(7):
+                if self.board[i][j] == self.board[i+1][j] == \
+                self.board[i+2][j] == self.board[i+3][j] != ' ':
+                    return self.board[i][j]
+
+        # check diagonals
+        for i in range(3):
+            for j in range(4):
+                if self.board[i][j] == self.board[i+1][j+1] == \
+                self.board[i+2][j+2] == self.board[i+3][j+3] != ' ':
+                    return self.board[i][j]
+                    
+        for i in range(3, 6):
+            for j in range(4):
+                if self.board[i][j] == self.board[i-1][j+1] == \
+                self.board[i-2][j+2] ==self.board[i-3][j+3] != ' ': 
+                    return self.board[i][j]
+
+        #check if board is full 
+        if self.move_count < 42:
+            return None
+
+        print('draw')
+        return'draw'
+
+    def check_last_move(self):
+        """
+        Check if the last move ended the game.
+
+        Only the piece placed last can have completed a new four, so this
+        method only checks the row, column and diagonals through that cell
+        instead of rescanning the whole board. It returns the same values as
+        check_win() as long as the game was not already decided before the
+        last move.
+
+        Returns:
+            str: The color of the winner ('red' or 'yellow'), 'draw' if there is a draw,
+            or None if there is no winner yet.
+        """
+
+        # No moves made yet
+        if not self.moves:
+            return None
+
+        row, column = self.moves[-1]
+        color = self.board[row][column]
+
+        # Count pieces of the same color on both sides of the last move
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            count = 1
+            for sign in (1, -1):
+                i, j = row + sign * dr, column + sign * dc
+                while 0 <= i < 6 and 0 <= j < 7 and self.board[i][j] == color:
+                    count += 1
+                    i, j = i + sign * dr, j + sign * dc
+            if count >= 4:
+                return color
+
+        # check if board is full
+        if self.move_count == 42:
+            return 'draw'
+        return None
@@ -0,0 +1,697 @@
+from .Logic import Logic
+import random
+import math
+import time
+from .TranspositionTable import TranspositionTable, EXACT, LOWER, UPPER
+from .MoveOrdering import MoveOrdering, CENTER_ORDER, CENTER_RANK
+from .SearchStats import SearchStats
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when its time or node budget has run out
+    """
+
+
+class MiniMax:
+    def __init__(self, backend=None, tt_mb=32, tt_replacement='depth', ordering=None, workers=1, book=None,
+                 stats=False, stats_hook=None, tt=None, algorithm='alphabeta') -> None:
+        """
+        backend is an optional board class (e.g. BitLogic) with a from_logic() constructor
+        When given, the search runs on a copy of the position in that representation
+        tt_mb is the memory cap of the transposition table in megabytes (0 disables it)
+        and tt_replacement its replacement policy ('depth' or 'always')
+        The table is kept between calls to get_best_move until new_game() is called
+        tt is an optional table to use instead, e.g. a SharedTranspositionTable; tt_mb is then ignored
+        The parallel workers attach to a shared table, so they share it with each other and with this object
+        ordering is the MoveOrdering deciding in which order columns are tried (all heuristics on by default)
+        nodes counts the positions visited by the last call to get_best_move
+        workers > 1 searches the root moves in parallel in that many processes (see search_root_parallel())
+        book is an optional OpeningBook; positions in it are answered without searching
+        when the book holds the requested depth, so it never plays stronger or weaker than asked
+        With stats=True every search leaves a SearchStats in last_stats; a stats_hook is called with it
+        When both are off only plain counters are kept, and no timing or principal variation is collected
+        algorithm is 'alphabeta' or 'pvs' (principal variation search, with aspiration windows in search())
+        Both give the same moves and values; 'pvs' usually visits fewer nodes
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError("Algorithm must be one of " + ", ".join(self.ALGORITHMS))
+
+        self.backend = backend
+        self.algorithm = algorithm
+        self.tt_mb = tt_mb
+        self.tt_replacement = tt_replacement
+        if tt is not None:
+            self.tt = tt
+        else:
+            self.tt = TranspositionTable(tt_mb, tt_replacement) if tt_mb > 0 else None
+        self.ordering = ordering if ordering is not None else MoveOrdering()
+        self.workers = workers
+        self.pool = None
+        self.book = book
+
+        # Budget of the running timed search; checked every BUDGET_INTERVAL nodes
+        self.deadline = math.inf
+        self.node_limit = math.inf
+        self.check_at = math.inf
+        self.cancelled = False
+
+        # Counters of the last search and the statistics built from them
+        self.collect_stats = stats or stats_hook is not None
+        self.stats_hook = stats_hook
+        self.last_stats = None
+        self.reset_counters()
+
+    # Number of nodes searched between two looks at the clock
+    BUDGET_INTERVAL = 128
+
+    # Search algorithms to choose from
+    ALGORITHMS = ('alphabeta', 'pvs')
+
+    # Half the width of the window search() puts around the value of the previous depth with 'pvs'
+    ASPIRATION_WINDOW = 40
+
+    def new_game(self):
+        """
+        Forgets everything remembered from the previous game
+        """
+        if self.tt is not None:
+            self.tt.clear()
+        self.ordering.clear()
+    
+    def reset_counters(self):
+        """
+        Sets the counters of the search statistics to zero
+        A budget set before, e.g. by a caller of get_best_move, is checked again at the next node,
+        as its next check was counted in nodes of the previous search
+        """
+        if self.check_at != math.inf:
+            self.check_at = 0
+        self.nodes = 0
+        self.evaluations = 0
+        self.cutoffs = 0
+        self.tt_hits = 0
+        self.root_nodes = {}
+        self.root_seconds = {}
+
+    def publish_stats(self, board, move, score, depth, started, source='search'):
+        """
+        Builds the SearchStats of the search that just finished, stores it in last_stats and passes it to the hook
+        board is the root position; the principal variation is followed through the transposition table from there
+        """
+        stats = SearchStats(move, score, depth, source)
+        stats.nodes = self.nodes
+        stats.evaluations = self.evaluations
+        stats.cutoffs = self.cutoffs
+        stats.tt_hits = self.tt_hits
+        stats.seconds = time.perf_counter() - started
+        stats.root_nodes = self.root_nodes
+        stats.root_seconds = self.root_seconds
+        if source == 'search':
+            stats.pv = self.principal_variation(board, move, depth)
+        self.last_stats = stats
+        if self.stats_hook is not None:
+            self.stats_hook(stats)
+
+    def principal_variation(self, board, move, depth):
+        """
+        Returns the best move followed by the best replies stored in the transposition table, at most depth + 1 moves
+        """
+        board = board.copy()
+        pv = []
+        while move >= 0 and len(pv) <= depth and board.make_move(move):
+            pv.append(move)
+            if board.check_last_move() is not None or self.tt is None:
+                break
+            key, mirrored = board.canonical_key()
+            entry = self.tt.probe(key)
+            move = entry[4] if entry is not None else -1
+            if mirrored and move >= 0:
+                move = 6 - move
+        return pv
+
+    def copy_board(self, logic : Logic):
+        """
+        Returns the copy of the position the search works on
+        The search makes and unmakes moves on the copy, so the caller's game is never touched
+        """
+        if self.backend is not None:
+            return self.backend.from_logic(logic)
+        return logic.copy()
+
+    def make_move(self, board : Logic, col):
+        bool = board.make_move(col)
+        return bool
+    
+    def unmake_move(self, board, col):
+        board.unmake_move(col)
+        
+    def get_best_move(self, logic : Logic, depth):
+        """
+        Function to find the best move using minimax with alpha beta pruning
+        It will check for each possible move what minimax value the game will have
+        returns the move with the greatest/lowest minimax value based on which player has to play
+        """
+        started = time.perf_counter()
+        self.reset_counters()
+        board = self.copy_board(logic)
+        if self.book is not None:
+            entry = self.book.lookup(logic, depth)
+            if entry is not None:
+                if self.collect_stats:
+                    self.publish_stats(board, entry[0], entry[1], depth, started, 'book')
+                return entry
+        move, value = self.search_root(board, depth)
+        if self.collect_stats:
+            self.publish_stats(board, move, value, depth, started)
+        return move, value
+
+    def search(self, logic : Logic, time_limit=None, node_limit=None, max_depth=42):
+        """
+        Iterative deepening search within a time budget (in seconds) and/or a node budget
+        Searches depth 0, 1, 2, ... with search_root(), trying the best move of the previous depth first
+        When the budget runs out the unfinished depth is thrown away
+        returns the best move and value of the deepest finished depth, and that depth
+        Depth 0 is always finished, so a move is returned even with a budget of zero
+        A position in the opening book is answered from the book, with the deepest depth of the book
+        that does not exceed max_depth
+        """
+        start = time.perf_counter()
+        self.reset_counters()
+        board = self.copy_board(logic)
+        if self.book is not None:
+            depth = min(max_depth, self.book.depths[-1])
+            entry = self.book.lookup(logic, depth)
+            if entry is not None:
+                if self.collect_stats:
+                    self.publish_stats(board, entry[0], entry[1], depth, start, 'book')
+                return entry[0], entry[1], depth
+
+        # A game has at most 42 moves, searching deeper than that is pointless
+        max_depth = min(max_depth, 41 - board.move_count)
+
+        best_i, best_v = self.search_root(board, 0)
+        reached = 0
+        try:
+            # Start watching the budget after depth 0
+            self.set_budget(start + time_limit if time_limit is not None else math.inf,
+                            node_limit if node_limit is not None else math.inf)
+
+            for depth in range(1, max_depth + 1):
+                # A forced win or loss found at a lower depth will not change
+                if abs(best_v) >= 200000:
+                    break
+                if self.algorithm == 'pvs':
+                    best_i, best_v = self.search_aspiration(board, depth, best_i, best_v)
+                else:
+                    best_i, best_v = self.search_root(board, depth, best_i)
+                reached = depth
+        except SearchTimeout:
+            pass
+        finally:
+            self.set_budget(math.inf, math.inf)
+        if self.collect_stats:
+            # An interrupted depth leaves its moves on the board, so start the principal variation from a fresh copy
+            self.publish_stats(self.copy_board(logic), best_i, best_v, reached, start)
+        return best_i, best_v, reached
+
+    def cancel(self):
+        """
+        Makes the running search raise SearchTimeout at its next node; may be called from another thread
+        The flag stays set until the caller clears self.cancelled before starting the next search
+        """
+        self.cancelled = True
+        self.check_at = 0
+
+    def set_budget(self, deadline, node_limit):
+        """
+        Makes minimax raise SearchTimeout once time.perf_counter() passes deadline
+        or self.nodes reaches node_limit; math.inf for both switches the checks off
+        """
+        self.deadline = deadline
+        self.node_limit = node_limit
+        if deadline == math.inf and node_limit == math.inf and not self.cancelled:
+            self.check_at = math.inf
+        else:
+            self.check_at = self.nodes + 1
+
+    def check_budget(self):
+        """
+        Raises SearchTimeout when the search was cancelled, the node budget is used up or the deadline has passed
+        Otherwise schedules the next check
+        """
+        if self.cancelled or self.nodes >= self.node_limit or time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+        if self.deadline == math.inf and self.node_limit == math.inf:
+            self.check_at = math.inf
+            # cancel() may have been called since the check above; its check_at = 0 was just overwritten
+            if self.cancelled:
+                raise SearchTimeout()
+        else:
+            self.check_at = min(self.nodes + self.BUDGET_INTERVAL, self.node_limit)
+
+    def search_aspiration(self, board, depth, first_move, guess):
+        """
+        Searches the root with a window of ASPIRATION_WINDOW around guess, the value of the previous depth
+        When the value falls outside the window it is only a bound, and the root is searched again
+        with the window opened on that side, so the result is the same as with a full window
+        """
+        a, b = guess - self.ASPIRATION_WINDOW, guess + self.ASPIRATION_WINDOW
+        best_i, best_v = self.search_root(board, depth, first_move, a, b)
+        if best_v < a:
+            best_i, best_v = self.search_root(board, depth, first_move, -math.inf, a)
+        elif best_v > b:
+            best_i, best_v = self.search_root(board, depth, best_i, b, math.inf)
+        return best_i, best_v
+
+    def search_root(self, board, depth, first_move=-1, a=-math.inf, b=math.inf):
+        """
+        Searches all moves of the root position to the given depth with a full window
+        first_move is tried first; without it the move stored in the transposition table is
+        Equal values are broken in favour of the most central column, so the result does not depend on the order
+        With the 'pvs' algorithm the search is narrowed to the window [a, b] (see search_root_pvs())
+        returns the best move and its value
+        """
+        tt_move = first_move
+        if self.tt is not None:
+            self.tt.new_search()
+            if tt_move < 0:
+                key, mirrored = board.canonical_key()
+                entry = self.tt.probe(key)
+                if entry is not None and entry[4] >= 0:
+                    tt_move = 6 - entry[4] if mirrored else entry[4]
+        columns = self.ordering.order(board.move_count, board.player, tt_move)
+
+        # In a symmetric position a column and its mirror image have the same value, and the tie-break prefers the
+        # left one of each pair (CENTER_RANK), so the right half does not need to be searched
+        if board.key == board.mirror_key:
+            columns = [i for i in columns if i <= 3]
+
+        if self.workers > 1:
+            return self.search_root_parallel(board, depth, columns)
+        if self.algorithm == 'pvs':
+            return self.search_root_pvs(board, depth, columns, a, b)
+
+        # Time spent below each root move, kept only for the statistics
+        timing = self.collect_stats
+        root_nodes, root_seconds = {}, {}
+
+        if board.player == 1:
+            best_i = -1
+            max_v = -math.inf
+            for i in columns:
+                if not self.make_move(board, i):#move impossible
+                    continue
+                if timing:
+                    nodes, started = self.nodes, time.perf_counter()
+                value = self.minimax(board,depth,-math.inf,math.inf,2)
+                if timing:
+                    root_nodes[i], root_seconds[i] = self.nodes - nodes, time.perf_counter() - started
+                self.unmake_move(board,i)
+                if value > max_v or (value == max_v and CENTER_RANK[i] < CENTER_RANK[best_i]):
+                    max_v = value
+                    best_i = i
+            self.root_nodes, self.root_seconds = root_nodes, root_seconds
+            return best_i, max_v
+        else:
+            best_i = -1
+            min_v = math.inf
+            for i in columns:
+                if not self.make_move(board, i):#move impossible
+                    continue
+                if timing:
+                    nodes, started = self.nodes, time.perf_counter()
+                value = self.minimax(board,depth,-math.inf,math.inf,1)
+                if timing:
+                    root_nodes[i], root_seconds[i] = self.nodes - nodes, time.perf_counter() - started
+                self.unmake_move(board,i)
+                if value < min_v or (value == min_v and CENTER_RANK[i] < CENTER_RANK[best_i]):
+                    min_v = value
+                    best_i = i
+            self.root_nodes, self.root_seconds = root_nodes, root_seconds
+            return best_i, min_v
+
+    def search_root_pvs(self, board, depth, columns, a, b):
+        """
+        Principal variation search of the root moves within the window [a, b]
+        The first move is searched with the window; every other move first with a null window at the best value
+        so far, which only tells whether it is better, equal or worse. An equal value is exact, so the tie-break
+        works as in search_root(); only a better move is searched again for its exact value
+        A best value inside [a, b] is exact and the move the same as search_root() finds; outside it is a bound
+        returns the best move and its value
+        """
+        # Values are seen from the player to move, so the same code serves both players
+        sign = 1 if board.player == 1 else -1
+        opponent = 2 if board.player == 1 else 1
+        if sign == -1:
+            a, b = -b, -a
+
+        def search_move(low, high):
+            if sign == 1:
+                return self.minimax(board, depth, low, high, opponent)
+            return -self.minimax(board, depth, -high, -low, opponent)
+
+        timing = self.collect_stats
+        root_nodes, root_seconds = {}, {}
+
+        best_i = -1
+        best_v = -math.inf
+        for i in columns:
+            if not self.make_move(board, i):#move impossible
+                continue
+            if timing:
+                nodes, started = self.nodes, time.perf_counter()
+            if best_i < 0:
+                value = search_move(a, b)
+            else:
+                bound = max(best_v, a)
+                value = search_move(bound, bound)
+                if bound < value <= b:
+                    value = search_move(bound, b)
+            if timing:
+                root_nodes[i], root_seconds[i] = self.nodes - nodes, time.perf_counter() - started
+            self.unmake_move(board, i)
+            if value > best_v or (value == best_v and CENTER_RANK[i] < CENTER_RANK[best_i]):
+                best_v = value
+                best_i = i
+
+            # The value is only a bound above the window; the caller searches again
+            if best_v > b:
+                break
+        self.root_nodes, self.root_seconds = root_nodes, root_seconds
+        return best_i, sign * best_v
+
+    def search_root_parallel(self, board, depth, columns):
+        """
+        Searches the root moves at the same time in a pool of self.workers processes
+        Every root move is searched with a full window, as in the serial search, so the values
+        and therefore the best move and value are exactly the same as those of search_root()
+        Alpha is not shared between workers, as that would turn the values into bounds;
+        instead each worker keeps its own transposition table across root moves and calls
+        A running time or node budget is handed to every worker; nodes are added up afterwards
+        Unless the table is shared, the workers' transposition tables stay in their processes,
+        so the principal variation is only the root move
+        """
+        if self.pool is None:
+            # Imported here, so processes that never search in parallel do not load multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                            initargs=(self.backend, self.tt_mb, self.tt_replacement,
+                                                      getattr(self.tt, 'name', None), self.algorithm))
+
+        time_left = self.deadline - time.perf_counter() if self.deadline != math.inf else None
+        nodes_left = self.node_limit - self.nodes if self.node_limit != math.inf else None
+        futures = []
+        for i in columns:
+            if not self.make_move(board, i):#move impossible
+                continue
+            futures.append((i, self.pool.submit(_search_move, board.copy(), depth, time_left, nodes_left)))
+            self.unmake_move(board, i)
+
+        sign = 1 if board.player == 1 else -1
+        best_i = -1
+        best_v = -math.inf
+        timed_out = False
+        root_nodes, root_seconds = {}, {}
+        for i, future in futures:
+            value, nodes, evaluations, cutoffs, tt_hits, seconds = future.result()
+            self.nodes += nodes
+            self.evaluations += evaluations
+            self.cutoffs += cutoffs
+            self.tt_hits += tt_hits
+            root_nodes[i], root_seconds[i] = nodes, seconds
+            if value is None:
+                timed_out = True
+            elif sign * value > best_v or (sign * value == best_v and CENTER_RANK[i] < CENTER_RANK[best_i]):
+                best_v = sign * value
+                best_i = i
+        if timed_out:
+            raise SearchTimeout()
+        self.root_nodes, self.root_seconds = root_nodes, root_seconds
+        return best_i, sign * best_v
+
+    def close(self):
+        """
+        Shuts down the worker processes of the parallel search, if any were started
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def minimax(self, board, depth,a,b, player):
+        """
+        Recursive minimax function with alpha beta pruning
+        Evaluates each move by playing each possible move and extracts the best possible strategy by evaluating the possible states the move will lead to
+        The function will just evaluate the value of a given state of the board
+        The window [a, b] is closed: a value inside it, a and b included, is exact, a value outside it a bound
+        With the 'pvs' algorithm only the first move gets the full window; the others are first searched
+        with the null window [a, a] (or [b, b] for yellow), which only tells whether they beat the best move so far
+        """
+        self.nodes += 1
+        if self.nodes >= self.check_at:
+            self.check_budget()
+        score = board.check_last_move()
+        if depth == 0 and score == None:
+            self.evaluations += 1
+            return self.evaluate_board(board)
+        
+        if score == 'red':
+            return 200000
+        elif score == 'yellow':
+            return -200000
+        elif score == 'draw':
+            return 0
+
+        # Use a stored result of the same position searched to the same depth
+        # Only equal depths are used, so the result of a search never depends on earlier searches
+        # A position and its mirror image have the same value and share one entry, stored under the smaller key
+        # with the move as seen from the position that has that key
+        tt = self.tt
+        tt_move = -1
+        if tt is not None:
+            key = board.key
+            mirrored = board.mirror_key < key
+            if mirrored:
+                key = board.mirror_key
+            entry = tt.probe(key)
+            if entry is not None:
+                tt_move = entry[4]
+                if mirrored and tt_move >= 0:
+                    tt_move = 6 - tt_move
+            if entry is not None and entry[1] == depth:
+                flag, stored = entry[2], entry[3]
+                if flag == EXACT:
+                    self.tt_hits += 1
+                    return stored
+                if flag == LOWER:
+                    if stored > b:
+                        self.tt_hits += 1
+                        return stored
+                    a = max(a, stored)
+                else:
+                    if stored < a:
+                        self.tt_hits += 1
+                        return stored
+                    b = min(b, stored)
+        # Threat pass: a win for the player to move ends the search here, since no move can score more
+        # Depth is at least 1 here, so the search would have found the same value one ply deeper
+        if board.immediate_wins(player):
+            return 200000 if player == 1 else -200000
+
+        ply = board.move_count
+        columns = self.ordering.order(ply, player, tt_move)
+
+        # Any move but a block of the opponent's win loses at once, so the value is that of the block alone,
+        # and with two wins to block it is lost; with depth 1 the search would not have seen the opponent's win
+        forced = False
+        if depth >= 2:
+            threats = board.immediate_wins(3 - player)
+            if threats:
+                if len(threats) > 1:
+                    return -200000 if player == 1 else 200000
+                columns = threats
+                forced = True
+        a_searched, b_searched = a, b
+
+        best_i = -1
+        pvs = self.algorithm == 'pvs'
+        if player == 1:
+            value = -math.inf
+
+            for i in columns:
+                if not self.make_move(board, i):#move impossible
+                    continue
+                if pvs and best_i >= 0:
+                    # Only a move that beats a needs its exact value
+                    child = self.minimax(board,depth-1,a,a,2)
+                    if a < child <= b:
+                        child = self.minimax(board,depth-1,a,b,2)
+                else:
+                    child = self.minimax(board,depth-1,a,b,2)
+                self.unmake_move(board,i)
+                # An equal value is exact as well, so ties are broken like in search_root()
+                if child > value or (child == value and CENTER_RANK[i] < CENTER_RANK[best_i]):
+                    value = child
+                    best_i = i
+
+                if value > b:
+                    self.cutoffs += 1
+                    self.ordering.record_cutoff(ply, player, i, depth)
+                    break
+                a = max(a, value)
+        else:
+            value = math.inf
+
+            for i in columns:
+                if not self.make_move(board, i):#move impossible
+                    continue
+                if pvs and best_i >= 0:
+                    # Only a move that beats b needs its exact value
+                    child = self.minimax(board,depth-1,b,b,1)
+                    if a <= child < b:
+                        child = self.minimax(board,depth-1,a,b,1)
+                else:
+                    child = self.minimax(board,depth-1,a,b,1)
+                self.unmake_move(board,i)
+                if child < value or (child == value and CENTER_RANK[i] < CENTER_RANK[best_i]):
+                    value = child
+                    best_i = i
+
+                if value < a:
+                    self.cutoffs += 1
+                    self.ordering.record_cutoff(ply, player, i, depth)
+                    break
+                b = min(b, value)
+
+        # When the block loses as well every move loses, and like in search_root() the most central one is best
+        if forced and value == (-200000 if player == 1 else 200000):
+            for i in CENTER_ORDER:
+                if self.make_move(board, i):
+                    self.unmake_move(board, i)
+                    best_i = i
+                    break
+
+        # Remember the result together with how it relates to the searched window
+        if tt is not None:
+            if value < a_searched:
+                flag = UPPER
+            elif value > b_searched:
+                flag = LOWER
+            else:
+                flag = EXACT
+            tt.store(key, depth, flag, value, 6 - best_i if mirrored and best_i >= 0 else best_i)
+        return value
+    
+    def evaluate_board(self, b):
+        """
+        Evaluates the given board.
+        Returns a score representing the strength of the position.
+        A positive score means 'red' is winning, a negative score means 'yellow' is winning.
+        It calculates the score by evaluating all the possible squares in lines of 4 on the board
+        All these evaluations are summed together to get the final score
+        See evaluate_window() to see how the 4 squares are evaluated
+        Logic and BitLogic keep this score up to date while moves are made and unmade,
+        so the board does not have to be scanned; scan_board() computes the same score from scratch
+        """
+        return b.score
+
+    def scan_board(self, b):
+        """
+        Evaluates the given board by scanning all lines of 4 on the board
+        Gives the same score as evaluate_board() for any board object with a board attribute
+        """
+        score = 0
+        board = b.board
+        # Check rows for wins
+        for row in range(6):
+            for col in range(4):
+                window = [board[row][col+i] for i in range(4)]
+                score += self.evaluate_window(window)
+        
+        # Check columns for wins
+        for col in range(7):
+            for row in range(3):
+                window = [board[row+i][col] for i in range(4)]
+                score += self.evaluate_window(window)
+        
+        # Check diagonals (up-right)
+        for row in range(3):
+            for col in range(4):
+                window = [board[row+i][col+i] for i in range(4)]
+                score += self.evaluate_window(window)
+        
+        # Check diagonals (up-left)
+        for row in range(3):
+            for col in range(3, 7):
+                window = [board[row+i][col-i] for i in range(4)]
+                score += self.evaluate_window(window)
+        
+        return score
+
+
+    def evaluate_window(self, window):
+        """
+        Evaluates a window of four pieces for the given player.
+        Returns a score representing the strength of the position in the window.
+        A positive score means 'red' is winning, a negative score means 'yellow' is winning.
+        It gives a value of +/- 10 if a player has 3 stones in a row
+        It gives a value of +/- 5 if a player has 3 stones in a row
+        It gives a value of +/- 2 if a player has 3 stones in a row
+        """
+        plus = window.count('red')
+        neg = window.count('yellow')
+        no = window.count(' ')
+        
+        if plus == 3 and no == 1:
+            return 10
+        elif plus == 2 and no == 2:
+            return 5
+        elif plus == 1 and no == 3:
+            return 2
+        
+        if neg == 3 and no == 1:
+            return -10
+        elif neg == 2 and no == 2:
+            return -5
+        elif neg == 1 and no == 3:
+            return -2
+        
+        return 0
+
+
+# MiniMax object of a worker process of the parallel search
+_worker = None
+
+
+def _init_worker(backend, tt_mb, tt_replacement, shared_tt=None, algorithm='alphabeta'):
+    """
+    Creates the MiniMax object of a worker process; its transposition table lives as long as the process
+    shared_tt is the name of a SharedTranspositionTable to attach to instead of creating a table of its own
+    algorithm is the search algorithm of the MiniMax object that started the pool
+    """
+    global _worker
+    tt = None
+    if shared_tt is not None:
+        from .SharedTranspositionTable import SharedTranspositionTable
+        tt = SharedTranspositionTable.attach(shared_tt, tt_replacement)
+    _worker = MiniMax(backend, tt_mb, tt_replacement, tt=tt, algorithm=algorithm)
+
+
+def _search_move(board, depth, time_left, nodes_left):
+    """
+    Searches the position after a root move in a worker process
+    returns the value (None if the budget ran out), the counters of the search and the time it took
+    """
+    mm = _worker
+    started = time.perf_counter()
+    mm.reset_counters()
+    if mm.tt is not None:
+        mm.tt.new_search()
+    mm.set_budget(time.perf_counter() + time_left if time_left is not None else math.inf,
+                  nodes_left if nodes_left is not None else math.inf)
+    try:
+        value = mm.minimax(board, depth, -math.inf, math.inf, board.player)
+    except SearchTimeout:
+        value = None
+    finally:
+        mm.set_budget(math.inf, math.inf)
+    return value, mm.nodes, mm.evaluations, mm.cutoffs, mm.tt_hits, time.perf_counter() - started
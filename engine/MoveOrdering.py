@@ -0,0 +1,160 @@
+from .Logic import Logic
+
+# Columns from the center outwards; central pieces take part in the most lines of four
+CENTER_ORDER = (3, 2, 4, 1, 5, 0, 6)
+
+# Position of each column in CENTER_ORDER; the last entry ranks the 'no move' column -1 behind all others
+CENTER_RANK = [CENTER_ORDER.index(column) for column in range(7)] + [7]
+
+
+class MoveOrdering:
+    """Decides in which order MiniMax tries the columns of a position.
+
+    Alpha-beta pruning cuts off more of the tree when good moves are tried first. This class combines four
+    heuristics, each of which can be switched off:
+
+    - center: try the columns from the center outwards instead of from left to right.
+    - tt_move: try the best move stored in the transposition table first.
+    - killers: next try the (up to two) moves that last caused a cutoff at the same ply.
+    - history: sort the remaining columns by how often they caused cutoffs for the player to move.
+
+    Attributes:
+        center (bool): Whether the static center-out order is used.
+        tt_move (bool): Whether the transposition table move is tried first.
+        killers (bool): Whether killer moves are used.
+        history (bool): Whether the history table is used.
+        killer_moves (list): For each ply, the two most recent columns that caused a cutoff.
+        history_table (list): For each player, a score per column that grows with every cutoff.
+    """
+
+    def __init__(self, center: bool = True, tt_move: bool = True, killers: bool = True, history: bool = True):
+        """Initialize the move ordering with empty killer and history tables.
+
+        Args:
+            center (bool): Use the static center-out order.
+            tt_move (bool): Try the transposition table move first.
+            killers (bool): Use killer moves.
+            history (bool): Use the history table.
+
+        Returns:
+            None
+        """
+        self.center = center
+        self.tt_move = tt_move
+        self.killers = killers
+        self.history = history
+        self.clear()
+
+    def clear(self):
+        """Forget all killer moves and history scores.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.killer_moves = [[-1, -1] for ply in range(43)]
+        self.history_table = [[0] * 7, [0] * 7]
+
+    def order(self, ply: int, player: int, tt_move: int = -1) -> list:
+        """Return the columns of a position in the order they should be searched.
+
+        Args:
+            ply (int): The number of pieces on the board.
+            player (int): The player to move (1 or 2).
+            tt_move (int): The best column stored in the transposition table, or -1 if there is none.
+
+        Returns:
+            list: All 7 columns, best candidates first. Full columns are not filtered out.
+        """
+        columns = list(CENTER_ORDER) if self.center else list(range(7))
+
+        # Sort by history score; the sort is stable, so ties keep the static order
+        if self.history:
+            scores = self.history_table[player - 1]
+            columns.sort(key=lambda column: -scores[column])
+
+        # Put the transposition table move and killer moves in front
+        first = []
+        if self.tt_move and tt_move >= 0:
+            first.append(tt_move)
+        if self.killers:
+            for column in self.killer_moves[ply]:
+                if column >= 0 and column not in first:
+                    first.append(column)
+        if not first:
+            return columns
+        return first + [column for column in columns if column not in first]
+
+    def record_cutoff(self, ply: int, player: int, column: int, depth: int):
+        """Remember a column that caused an alpha-beta cutoff.
+
+        Args:
+            ply (int): The number of pieces on the board before the move.
+            player (int): The player who played the column (1 or 2).
+            column (int): The column that caused the cutoff.
+            depth (int): The remaining search depth; deeper cutoffs weigh more in the history table.
+
+        Returns:
+            None
+        """
+        if self.killers:
+            killers = self.killer_moves[ply]
+            if killers[0] != column:
+                killers[1] = killers[0]
+                killers[0] = column
+        if self.history:
+            self.history_table[player - 1][column] += depth * depth
+
+
+# Heuristics switched on one by one for ordering_report()
+REPORT_STEPS = [
+    ('columns 0..6', {'center': False, 'tt_move': False, 'killers': False, 'history': False}),
+    ('+ center first', {'center': True, 'tt_move': False, 'killers': False, 'history': False}),
+    ('+ tt move', {'center': True, 'tt_move': True, 'killers': False, 'history': False}),
+    ('+ killers', {'center': True, 'tt_move': True, 'killers': True, 'history': False}),
+    ('+ history', {'center': True, 'tt_move': True, 'killers': True, 'history': True}),
+]
+
+
+def ordering_report(logic: Logic, depth: int) -> list:
+    """Count the nodes MiniMax searches as the ordering heuristics are switched on one by one.
+
+    Every step starts from a fresh MiniMax, so the counts show what each heuristic adds on top of the previous ones.
+
+    Args:
+        logic (Logic): The position to search.
+        depth (int): The search depth passed to get_best_move.
+
+    Returns:
+        list: (step name, node count) tuples in the order of REPORT_STEPS.
+    """
+    from .MiniMax import MiniMax
+
+    report = []
+    for name, flags in REPORT_STEPS:
+        mm = MiniMax(ordering=MoveOrdering(**flags))
+        mm.get_best_move(logic, depth)
+        report.append((name, mm.nodes))
+    return report
+
+
+def main(args):
+    """Print the ordering report of a position.
+
+    Usage: python -m engine ordering [depth] [moves], e.g. python -m engine ordering 6 3342
+
+    Args:
+        args (list): The command line arguments after the command name.
+
+    Returns:
+        None
+    """
+    depth = int(args[0]) if args else 6
+    logic = Logic()
+    for move in args[1] if len(args) > 1 else '':
+        logic.make_move(int(move))
+
+    for name, nodes in ordering_report(logic, depth):
+        print(f"{name:<16}{nodes:>12}")
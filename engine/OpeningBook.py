@@ -0,0 +1,226 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+from .BitLogic import BitLogic
+from .Logic import Logic
+
+# File layout: a header, then one fixed size record per position and depth, sorted by key and depth
+HEADER = struct.Struct('<4sHHHHI')   # magic, version, plies, lowest and highest depth, number of records
+RECORD = struct.Struct('<QBbbi')     # position key, depth, best column, best column of the mirror image, score
+MAGIC = b'C4OB'
+VERSION = 2
+
+
+def book_key(logic) -> tuple:
+    """Return the key under which a position is stored in an opening book.
+
+    A position and its mirror image share one record, stored under the smaller of their two position keys.
+
+    Args:
+        logic (Logic): The position.
+
+    Returns:
+        tuple: The key and whether the position is the mirror image of the stored one.
+    """
+    key = BitLogic.from_logic(logic).position_key()
+    mirrored = BitLogic.mirror_position_key(key)
+    if mirrored < key:
+        return mirrored, True
+    return key, False
+
+
+class OpeningBook:
+    """A read-only opening book: the engine's best move and score for the first plies of the game.
+
+    The book holds the result of get_best_move at every depth of a range, so each difficulty level gets the move it
+    would have searched itself. The book file is memory-mapped and searched with a binary search, so opening a book
+    costs nothing and the operating system shares its pages between all processes that use it.
+
+    Attributes:
+        path (str): The path of the book file.
+        plies (int): Positions with fewer pieces than this are in the book.
+        depths (range): The get_best_move depths the book was built with.
+        count (int): The number of records in the book.
+    """
+
+    def __init__(self, path: str):
+        """Open an opening book file.
+
+        Args:
+            path (str): The path of a file written by build_book().
+
+        Returns:
+            None
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Check the header
+        if len(self.data) < HEADER.size:
+            raise ValueError(f"{path} is not an opening book")
+        magic, version, self.plies, low, high, self.count = HEADER.unpack_from(self.data, 0)
+        self.depths = range(low, high + 1)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+        if len(self.data) != HEADER.size + self.count * RECORD.size:
+            raise ValueError(f"{path} is truncated")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self):
+        """Close the memory map of the book file.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.data.close()
+
+    def lookup(self, logic, depth: int):
+        """Look up the best move of a position.
+
+        Args:
+            logic (Logic): The position.
+            depth (int): The get_best_move depth.
+
+        Returns:
+            tuple: The best column and its score (positive is good for red), or None if the position or the depth is
+            not in the book.
+        """
+        if logic.move_count >= self.plies or depth not in self.depths:
+            return None
+        key, mirrored = book_key(logic)
+
+        # Binary search over the sorted records
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            stored, stored_depth, move, mirror_move, score = RECORD.unpack_from(self.data,
+                                                                                 HEADER.size + mid * RECORD.size)
+            if (stored, stored_depth) < (key, depth):
+                lo = mid + 1
+            elif (stored, stored_depth) > (key, depth):
+                hi = mid
+            else:
+                return (mirror_move if mirrored else move), score
+        return None
+
+
+def book_positions(plies: int) -> list:
+    """Return every position with fewer than plies pieces that can occur in a game, one per mirror pair.
+
+    Args:
+        plies (int): The number of plies the book covers.
+
+    Returns:
+        list: Move sequences (lists of columns) leading to the positions.
+    """
+    positions = []
+    seen = set()
+    board = BitLogic()
+    moves = []
+
+    def visit():
+        key = board.position_key()
+        key = min(key, BitLogic.mirror_position_key(key))
+        if key in seen:
+            return
+        seen.add(key)
+        positions.append(list(moves))
+        if board.move_count + 1 >= plies:
+            return
+        for column in range(7):
+            if board.make_move(column):
+                moves.append(column)
+                if board.check_last_move() is None:
+                    visit()
+                moves.pop()
+                board.unmake_move(column)
+
+    visit()
+    return positions
+
+
+def build_book(path: str, plies: int, depths, workers: int = 1, progress=None):
+    """Search the opening positions with MiniMax and write the results to a book file.
+
+    Args:
+        path (str): The path of the book file to write.
+        plies (int): Positions with fewer pieces than this are searched.
+        depths (list or range): The get_best_move depths to search every position with, consecutive and lowest first.
+        workers (int): The number of processes for the parallel root search.
+        progress (callable): Called with (done, total) after every position, or None.
+
+    Returns:
+        int: The number of records written, one per position and depth.
+    """
+    from .MiniMax import MiniMax
+
+    mm = MiniMax(workers=workers)
+    positions = book_positions(plies)
+    records = {}
+    try:
+        for n, moves in enumerate(positions):
+            logic = Logic()
+            mirror = Logic()
+            for column in moves:
+                logic.make_move(column)
+                mirror.make_move(6 - column)
+
+            # Store the moves of the position the key belongs to and of its mirror image. They are not always each
+            # other's mirror: of two equal columns at the same distance from the centre get_best_move takes the left
+            key, mirrored = book_key(logic)
+            if mirrored:
+                logic, mirror = mirror, logic
+            for depth in depths:
+                move, score = mm.get_best_move(logic, depth)
+                mirror_move = mm.get_best_move(mirror, depth)[0] if mirror.key != logic.key else move
+                records[key, depth] = (move, mirror_move, int(score))
+            if progress is not None:
+                progress(n + 1, len(positions))
+    finally:
+        mm.close()
+
+    # Write to a temporary file first, so readers never see a half written book
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, plies, depths[0], depths[-1], len(records)))
+        for key, depth in sorted(records):
+            f.write(RECORD.pack(key, depth, *records[key, depth]))
+    os.replace(temp_path, path)
+    return len(records)
+
+
+def main(args):
+    """Build an opening book from the command line.
+
+    Usage: python -m engine build-book [--plies N] [--depths 1-6] [--workers N] [--out PATH]
+
+    Args:
+        args (list): The command line arguments after the command name.
+
+    Returns:
+        None
+    """
+    from .Benchmark import parse_depths
+
+    parser = argparse.ArgumentParser(prog='python -m engine build-book',
+                                     description="Build a Connect Four opening book.")
+    parser.add_argument('--plies', type=int, default=6, help="book positions with fewer pieces than this")
+    parser.add_argument('--depths', type=parse_depths, default=list(range(1, 7)),
+                        help="get_best_move depth or range of depths to search each position with (default 1-6, "
+                             "the depths of the GUI's difficulty levels and hints)")
+    parser.add_argument('--workers', type=int, default=1, help="processes for the parallel root search")
+    parser.add_argument('--out', default='books/opening.book', help="path of the book file to write")
+    args = parser.parse_args(args)
+
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+    count = build_book(args.out, args.plies, args.depths, args.workers,
+                       lambda done, total: print(f"\r{done}/{total}", end='', file=sys.stderr))
+    print(f"\nWrote {count} records to {args.out}", file=sys.stderr)
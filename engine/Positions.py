@@ -0,0 +1,121 @@
+from .Protocol import parse_moves
+
+# Positions for the benchmarks (see Benchmark.py), made like TACTICAL below: 2-8, 14-22 and 28-36 moves played
+OPENING = (
+    '056333',
+    '3410',
+    '30003',
+    '03044',
+    '61',
+    '10511444',
+)
+MIDGAME = (
+    '350633322322255035200',
+    '0254444522224515',
+    '5364333331222210',
+    '5213333344454434211',
+    '654444555421222',
+    '1235330332222362100',
+)
+ENDGAME = (
+    '1015113330330420555531015666',
+    '06653333335551166111515066444000',
+    '421222444334234231331151055515506660',
+    '311333315231165555144222500000',
+    '4400443222224245000063553333',
+    '5562433333532222545526166661110110',
+)
+
+# Midgame positions with threats on the board, as strings of columns played from the empty board. They come from
+# games of MiniMax at depth 3 against itself, with random moves in the opening and now and then later on. In every
+# position at least one player has a cell that would complete a four, the player to move has no immediate win and
+# at most one of the opponent's to block.
+TACTICAL = (
+    '0052202230031331323620',
+    '150032333331112156556',
+    '255455362442240124',
+    '4246444222226411111',
+    '6544445554212222',
+    '400444322223423365311',
+    '2153330330321212211266',
+    '451114445155433336',
+    '24252234244331435332455556',
+    '36653445655403343441',
+    '16033333311155155522',
+    '2664333332214243444660',
+    '664333333444',
+    '0402333333444222',
+    '460222522424444000661111',
+    '244044222242040033',
+    '63053333351155111515222',
+    '4433023412144365',
+    '51603433334555141130',
+    '44266344333213',
+)
+
+# The suites by name, for the command line
+SUITES = {
+    'opening': OPENING,
+    'midgame': MIDGAME,
+    'endgame': ENDGAME,
+    'tactical': TACTICAL,
+}
+
+
+def load_suite(suite) -> list:
+    """Build the positions of a suite.
+
+    Args:
+        suite (str or iterable): The name of a suite in SUITES, or the move strings themselves.
+
+    Returns:
+        list: A Logic object for every position.
+    """
+    if isinstance(suite, str):
+        suite = SUITES[suite]
+    return [parse_moves(moves) for moves in suite]
+
+
+def node_report(suite, depth: int, backend=None, algorithm: str = 'alphabeta') -> list:
+    """Search every position of a suite with a fresh MiniMax and count the nodes.
+
+    Args:
+        suite (str or iterable): The name of a suite in SUITES, or the move strings themselves.
+        depth (int): The search depth passed to get_best_move.
+        backend (type): The board class to search with, or None for Logic.
+        algorithm (str): The search algorithm of MiniMax, 'alphabeta' or 'pvs'.
+
+    Returns:
+        list: (moves, best move, value, nodes) tuples in the order of the suite.
+    """
+    from .MiniMax import MiniMax
+
+    moves = SUITES[suite] if isinstance(suite, str) else list(suite)
+    report = []
+    for position, logic in zip(moves, load_suite(moves)):
+        mm = MiniMax(backend, algorithm=algorithm)
+        move, value = mm.get_best_move(logic, depth)
+        report.append((position, move, value, mm.nodes))
+    return report
+
+
+def main(args):
+    """Print the node report of a suite.
+
+    Usage: python -m engine nodes [depth] [suite] [algorithm], e.g. python -m engine nodes 6 tactical pvs
+
+    Args:
+        args (list): The command line arguments after the command name.
+
+    Returns:
+        None
+    """
+    depth = int(args[0]) if args else 6
+    suite = args[1] if len(args) > 1 else 'tactical'
+    algorithm = args[2] if len(args) > 2 else 'alphabeta'
+
+    total = 0
+    for moves, move, value, nodes in node_report(suite, depth, algorithm=algorithm):
+        print(f"{moves:<28}{move:>3}{value:>9}{nodes:>12}")
+        total += nodes
+    print(f"{'total':<40}{total:>12}")
@@ -0,0 +1,121 @@
+import time
+from .Logic import Logic
+from .MiniMax import MiniMax, SearchTimeout
+from .Solver import Solver, outcome
+
+# Search depth of a request that does not give one
+DEFAULT_DEPTH = 5
+
+
+def parse_moves(moves) -> Logic:
+    """Play a game from the empty board.
+
+    Args:
+        moves (str or list): The columns played, as a string of digits (0-6) or a list of integers.
+
+    Returns:
+        Logic: The position after the moves.
+
+    Raises:
+        ValueError: If a move is not a column, is played in a full column or is played after the game has ended.
+    """
+    logic = Logic()
+    for column in moves:
+        column = int(column)
+        if logic.check_last_move():
+            raise ValueError("The game is already over")
+        if not logic.make_move(column):
+            raise ValueError(f"Column {column} is full")
+    return logic
+
+
+def check_depth(depth) -> int:
+    """Check the depth of a request.
+
+    Args:
+        depth (int): The depth given in the request.
+
+    Returns:
+        int: The depth.
+
+    Raises:
+        ValueError: If the depth is not a whole number of at least 0; a negative depth would search to the end of
+            the game.
+    """
+    if type(depth) is not int or depth < 0:
+        raise ValueError("The depth must be a whole number of at least 0")
+    return depth
+
+
+def worker_engine(tt_mb: float, book_path: str = None, shared_tt: str = None) -> MiniMax:
+    """Create the engine a worker process of a pool answers requests with.
+
+    Args:
+        tt_mb (float): The memory cap of the transposition table in megabytes.
+        book_path (str): The path of an opening book, or None.
+        shared_tt (str): The name of a SharedTranspositionTable to use instead of a table of its own, or None.
+
+    Returns:
+        MiniMax: The engine.
+    """
+    from .OpeningBook import OpeningBook
+    from .SharedTranspositionTable import SharedTranspositionTable
+
+    tt = SharedTranspositionTable.attach(shared_tt) if shared_tt is not None else None
+    return MiniMax(tt_mb=tt_mb, book=OpeningBook(book_path) if book_path else None, tt=tt)
+
+
+def handle_request(request: dict, mm: MiniMax, solver: Solver = None) -> dict:
+    """Answer one request for a move.
+
+    A request is a dictionary with these keys, all optional:
+
+    - 'id': Copied to the response, to match responses with requests.
+    - 'moves': The columns played so far, as a string of digits or a list of integers. The default is the empty board.
+    - 'depth': The search depth, or the maximum depth if 'time' or 'nodes' is given.
+    - 'time', 'nodes': A time limit in seconds and/or a node limit for an iterative deepening search.
+    - 'solve': If true, the exact solver is used; 'nodes' limits it.
+
+    Args:
+        request (dict): The request.
+        mm (MiniMax): The engine used for searches.
+        solver (Solver): The solver used for 'solve' requests, or None to create one when needed.
+
+    Returns:
+        dict: The 'id' if given and either the 'move', 'score', 'depth' and 'nodes' searched, or an 'error' message.
+        A solved position has 'result' ('win', 'loss' or 'draw') and 'in' (the number of moves) instead of 'depth'.
+
+    Raises:
+        SearchTimeout: If a budget set on mm with MiniMax.set_budget, or the deadline of the solver, runs out; other
+            errors become an 'error' message.
+    """
+    response = {'id': request['id']} if 'id' in request else {}
+    try:
+        logic = parse_moves(request.get('moves', ''))
+        if logic.check_last_move():
+            raise ValueError("The game is already over")
+
+        if request.get('solve'):
+            solver = solver or Solver()
+            try:
+                move, score = solver.best_move(logic, request.get('nodes'))
+            except SearchTimeout:
+                if time.perf_counter() >= solver.deadline:
+                    raise
+                raise ValueError("The node limit was reached before the position was solved")
+            result, n = outcome(score, logic.move_count)
+            response.update(move=move, score=score, result=result, nodes=solver.nodes)
+            response['in'] = n
+        elif 'time' in request or 'nodes' in request:
+            move, score, depth = mm.search(logic, request.get('time'), request.get('nodes'),
+                                           check_depth(request.get('depth', 42)))
+            response.update(move=move, score=score, depth=depth, nodes=mm.nodes)
+        else:
+            depth = check_depth(request.get('depth', DEFAULT_DEPTH))
+            move, score = mm.get_best_move(logic, depth)
+            response.update(move=move, score=score, depth=depth, nodes=mm.nodes)
+    except SearchTimeout:
+        raise
+    except Exception as e:
+        response['error'] = str(e) or type(e).__name__
+    return response
@@ -0,0 +1,88 @@
+class SearchStats:
+    """Statistics of one MiniMax search.
+
+    MiniMax fills one of these after get_best_move or search when statistics are switched on (see the stats and
+    stats_hook arguments of MiniMax).
+
+    Attributes:
+        move (int): The best column found.
+        score (int): The value of the best column (positive is good for red).
+        depth (int): The depth of the search (the deepest finished depth for iterative deepening).
+        source (str): 'search' if the move was searched, 'book' if it came from the opening book.
+        nodes (int): The number of positions visited.
+        evaluations (int): The number of positions scored by evaluate_board at the search horizon.
+        cutoffs (int): The number of alpha-beta cutoffs.
+        tt_hits (int): The number of positions answered by the transposition table.
+        seconds (float): The wall-clock time of the search.
+        root_nodes (dict): For each root column searched, the number of nodes below it (for the last depth).
+        root_seconds (dict): For each root column searched, the time spent below it (for the last depth).
+        pv (list): The principal variation: the best column and the expected continuation, as far as the
+            transposition table remembers it.
+    """
+
+    def __init__(self, move: int, score, depth: int, source: str = 'search'):
+        """Initialize the statistics of a search with all counters at zero.
+
+        Args:
+            move (int): The best column found.
+            score (int): The value of the best column.
+            depth (int): The depth of the search.
+            source (str): 'search' or 'book'.
+
+        Returns:
+            None
+        """
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.source = source
+        self.nodes = 0
+        self.evaluations = 0
+        self.cutoffs = 0
+        self.tt_hits = 0
+        self.seconds = 0.0
+        self.root_nodes = {}
+        self.root_seconds = {}
+        self.pv = [move]
+
+    @property
+    def nodes_per_second(self) -> float:
+        """float: The number of nodes visited per second."""
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def branching_factor(self) -> float:
+        """float: The effective branching factor, the number b for which b ** (depth + 1) equals the node count."""
+        if self.nodes <= 0:
+            return 0.0
+        return self.nodes ** (1 / (self.depth + 1))
+
+    def as_dict(self) -> dict:
+        """Return the statistics as a dictionary of plain values, e.g. for JSON or a metrics pipeline.
+
+        Args:
+            None
+
+        Returns:
+            dict: All attributes and derived values.
+        """
+        return {
+            'move': self.move,
+            'score': self.score,
+            'depth': self.depth,
+            'source': self.source,
+            'nodes': self.nodes,
+            'evaluations': self.evaluations,
+            'cutoffs': self.cutoffs,
+            'tt_hits': self.tt_hits,
+            'seconds': self.seconds,
+            'nodes_per_second': self.nodes_per_second,
+            'branching_factor': self.branching_factor,
+            'root_nodes': dict(self.root_nodes),
+            'root_seconds': dict(self.root_seconds),
+            'pv': list(self.pv),
+        }
+
+    def __repr__(self) -> str:
+        return (f"SearchStats(move={self.move}, score={self.score}, depth={self.depth}, nodes={self.nodes}, "
+                f"seconds={self.seconds:.3f}, pv={self.pv})")
@@ -0,0 +1,114 @@
+import queue
+import threading
+from .MiniMax import SearchTimeout
+
+
+class SearchWorker:
+    """Runs engine searches one after another in a background thread.
+
+    Jobs are submitted with a callback. The result of a finished job is queued, and the callback is called from
+    poll(), so a GUI can call poll() from its own event loop and never run engine code or callbacks on another
+    thread. cancel() interrupts the running search and drops every job submitted before it. A job that raises is
+    reported to its errback from poll() too, or raised from poll() if it has none, and the worker goes on with the
+    next.
+
+    Attributes:
+        mm (MiniMax): The engine the jobs use; it is cancelled through its cancel() method.
+        generation (int): Increased by every cancel(); jobs and results of older generations are dropped.
+    """
+
+    def __init__(self, mm):
+        """Start the worker thread.
+
+        Args:
+            mm (MiniMax): The engine the jobs use.
+
+        Returns:
+            None
+        """
+        self.mm = mm
+        self.generation = 0
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, callback, function, *args, errback=None):
+        """Queue a job.
+
+        Args:
+            callback (callable): Called from poll() with the return value of the job.
+            function (callable): The job, called on the worker thread with args.
+            *args: The arguments of the job. Pass copies of game objects, not objects the caller keeps changing.
+            errback (callable): Called from poll() with the exception if the job raises, or None to raise it from
+                poll().
+
+        Returns:
+            None
+        """
+        self.jobs.put((self.generation, callback, errback, function, args))
+
+    def cancel(self):
+        """Interrupt the running search and drop all queued jobs and undelivered results.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.generation += 1
+        self.mm.cancel()
+
+    def run(self):
+        """Run jobs until the program ends. This is the body of the worker thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            generation, callback, errback, function, args = self.jobs.get()
+            # Clear the flag before the generation check: a cancel() after it sets the flag again, and one before it
+            # changes the generation, so no cancel() is lost
+            self.mm.cancelled = False
+            if generation != self.generation:
+                continue
+            try:
+                result = function(*args)
+            except SearchTimeout:
+                continue
+            except Exception as e:
+                # Hand the error to the GUI thread, so this thread keeps serving jobs
+                self.results.put((generation, None, errback, e))
+                continue
+            self.results.put((generation, callback, errback, result))
+
+    def poll(self):
+        """Call the callbacks of all finished jobs of the current generation. Call this from the GUI thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            Exception: The exception of a job that failed without an errback. The results after it are delivered by
+                the next poll().
+        """
+        while True:
+            try:
+                generation, callback, errback, result = self.results.get_nowait()
+            except queue.Empty:
+                return
+            if generation != self.generation:
+                continue
+            if callback is not None:
+                callback(result)
+            elif errback is not None:
+                errback(result)
+            else:
+                raise result
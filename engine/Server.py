@@ -0,0 +1,493 @@
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .Logic import Logic
+from .MiniMax import SearchTimeout
+from .Protocol import handle_request, parse_moves, worker_engine
+from .SharedTranspositionTable import SharedTranspositionTable
+from .Solver import Solver
+
+# Deepest search a game session may ask for, so a single game cannot occupy a worker for minutes
+MAX_DEPTH = 8
+
+# Largest request body accepted, in bytes
+MAX_BODY = 65536
+
+# Seconds a search result may arrive after its deadline before the server gives up waiting for the worker
+DEADLINE_GRACE = 0.5
+
+REASONS = {
+    200: 'OK',
+    201: 'Created',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+    504: 'Gateway Timeout',
+}
+
+# The engine and solver of a worker process, created by _init_worker
+_mm = None
+_solver = None
+
+
+def _init_worker(tt_mb: float, book_path: str, shared_tt: str = None):
+    """Create the engine and solver of a worker process of the pool; the arguments are those of worker_engine()."""
+    global _mm, _solver
+    _mm = worker_engine(tt_mb, book_path, shared_tt)
+    _solver = Solver()
+
+
+def _search(request: dict, deadline: float):
+    """Answer a request in a worker process, giving up at the deadline.
+
+    Args:
+        request (dict): A request for Protocol.handle_request.
+        deadline (float): The time.time() at which the search is abandoned. Time spent waiting in the queue of the
+            pool counts.
+
+    Returns:
+        dict: The response, or None if the deadline passed first.
+    """
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        return None
+
+    # A timed search sets its own budget, which must not outlast the deadline
+    if 'time' in request or 'nodes' in request:
+        time_limit = request.get('time')
+        request = dict(request, time=min(time_limit, remaining) if time_limit is not None else remaining)
+    _mm.set_budget(time.perf_counter() + remaining, math.inf)
+    _solver.deadline = time.perf_counter() + remaining
+    try:
+        return handle_request(request, _mm, _solver)
+    except SearchTimeout:
+        return None
+    finally:
+        _mm.set_budget(math.inf, math.inf)
+        _solver.deadline = math.inf
+
+
+def encode_response(status: int, response: dict, keep_alive: bool) -> bytes:
+    """Encode an HTTP response with a JSON body.
+
+    Args:
+        status (int): The HTTP status code.
+        response (dict): The body.
+        keep_alive (bool): Whether the connection stays open for another request.
+
+    Returns:
+        bytes: The response.
+    """
+    data = json.dumps(response).encode()
+    headers = [f"HTTP/1.1 {status} {REASONS[status]}",
+               "Content-Type: application/json",
+               f"Content-Length: {len(data)}",
+               f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    if status == 503:
+        headers.append("Retry-After: 1")
+    return ('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1') + data
+
+
+class HTTPError(Exception):
+    """An error that is sent to the client as an HTTP status and a JSON error message.
+
+    Attributes:
+        status (int): The HTTP status code.
+        message (str): The error message.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class GameSession:
+    """A game against the engine held in the memory of the server.
+
+    Attributes:
+        logic (Logic): The position.
+        depth (int): The search depth of the engine's replies.
+        lock (asyncio.Lock): Makes the moves of one game wait for each other.
+        last_used (float): The time.monotonic() of the last request for this game.
+    """
+
+    def __init__(self, logic: Logic, depth: int):
+        self.logic = logic
+        self.depth = depth
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+    def state(self, game_id: int) -> dict:
+        """Return the state of the game for a response.
+
+        Args:
+            game_id (int): The id of the game.
+
+        Returns:
+            dict: The 'id', 'depth', 'moves' (the columns played), 'board' (six strings of '.', 'R' and 'Y', top row
+            first), 'to_move' ('red' or 'yellow') and 'winner' ('red', 'yellow', 'draw' or None).
+        """
+        symbols = {' ': '.', 'red': 'R', 'yellow': 'Y'}
+        return {
+            'id': game_id,
+            'depth': self.depth,
+            'moves': [column for _, column in self.logic.moves],
+            'board': [''.join(symbols[cell] for cell in row) for row in self.logic.board],
+            'to_move': 'red' if self.logic.player == 1 else 'yellow',
+            'winner': self.logic.check_last_move(),
+        }
+
+
+class GameServer:
+    """An asyncio HTTP server that holds many games in memory and plays the engine's replies.
+
+    Searches run in a bounded pool of worker processes, so a deep search never blocks the event loop or the other
+    games. When max_pending searches are already waiting or running, new requests are refused at once with 503
+    instead of queueing without bound. Every search has a deadline; a search that misses it is answered with 504 and
+    the game is left as it was.
+
+    Requests and responses are JSON:
+
+    - POST /games {"depth": 5, "moves": "33"} creates a game (201); both keys are optional.
+    - GET /games/<id> returns the state of a game (see GameSession.state).
+    - POST /games/<id>/moves {"column": 3} plays a move and the engine's reply, which is returned as 'reply'.
+    - DELETE /games/<id> ends a game.
+    - POST /analyse answers a request of Protocol.handle_request without a game.
+    - GET /status returns the number of games and searches.
+
+    A request body may contain "deadline", in seconds, to shorten the deadline of its search.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        max_pending (int): The maximum number of searches waiting or running.
+        deadline (float): The default and maximum deadline of a search in seconds.
+        max_sessions (int): The maximum number of games; the least recently used game is ended to make room.
+        pending (int): The number of searches waiting or running.
+        sessions (dict): Maps a game id to its GameSession.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = None, deadline: float = 10.0, max_sessions: int = 10000,
+                 tt_mb: float = 32, book: str = None, shared_tt_mb: float = 0, tt_file: str = None):
+        """Start the worker pool.
+
+        Args:
+            workers (int): The number of worker processes.
+            max_pending (int): The maximum number of searches waiting or running, by default 4 per worker.
+            deadline (float): The default and maximum deadline of a search in seconds.
+            max_sessions (int): The maximum number of games held in memory.
+            tt_mb (float): The memory cap of the transposition table of each worker in megabytes.
+            book (str): The path of an opening book for the workers, or None.
+            shared_tt_mb (float): If more than 0, the workers share one SharedTranspositionTable of this size instead
+                of a table each.
+            tt_file (str): The file the shared table is warm-loaded from at the start and saved to by close().
+
+        Returns:
+            None
+        """
+        self.workers = workers
+        self.max_pending = max_pending or 4 * workers
+        self.deadline = deadline
+        self.max_sessions = max_sessions
+        self.pending = 0
+        self.sessions = {}
+        self.ids = itertools.count(1)
+        self.tt_file = tt_file
+        self.shared_tt = SharedTranspositionTable.create(shared_tt_mb, path=tt_file) if shared_tt_mb > 0 else None
+        self.pool = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                        initargs=(tt_mb, book, getattr(self.shared_tt, 'name', None)))
+
+    def close(self):
+        """Shut down the worker pool.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.pool.shutdown(cancel_futures=True)
+        if self.shared_tt is not None:
+            self.shared_tt.shutdown(self.tt_file)
+
+    async def search(self, request: dict, deadline: float) -> dict:
+        """Answer a request of Protocol.handle_request in the worker pool.
+
+        Args:
+            request (dict): The request.
+            deadline (float): The deadline in seconds.
+
+        Returns:
+            dict: The response.
+
+        Raises:
+            HTTPError: 503 if too many searches are pending, 504 if the deadline passed.
+        """
+        if self.pending >= self.max_pending:
+            raise HTTPError(503, "Too many searches in progress, try again later")
+
+        # The search counts as pending until a worker is done with it, also when the server stops waiting for it
+        future = self.pool.submit(_search, request, time.time() + deadline)
+        self.pending += 1
+        result = asyncio.wrap_future(future)
+        result.add_done_callback(self.search_done)
+        try:
+            response = await asyncio.wait_for(asyncio.shield(result), deadline + DEADLINE_GRACE)
+        except asyncio.TimeoutError:
+            # Drop the search if it is still waiting for a worker
+            future.cancel()
+            response = None
+
+        if response is None:
+            raise HTTPError(504, "The search did not finish before the deadline")
+        return response
+
+    def search_done(self, result: asyncio.Future):
+        """Release the place of a search in the pool when a worker is done with it or it was dropped."""
+        self.pending -= 1
+
+        # Retrieve the error of a search nobody waits for any more, so it is not reported as unhandled
+        if not result.cancelled():
+            result.exception()
+
+    def session(self, game_id: str) -> GameSession:
+        """Look up a game.
+
+        Args:
+            game_id (str): The id from the path of the request.
+
+        Returns:
+            GameSession: The game.
+
+        Raises:
+            HTTPError: 404 if there is no such game.
+        """
+        session = self.sessions.get(int(game_id)) if game_id.isdigit() else None
+        if session is None:
+            raise HTTPError(404, f"There is no game {game_id}")
+        session.last_used = time.monotonic()
+        return session
+
+    def request_deadline(self, body: dict) -> float:
+        """Return the deadline asked for in a request body, no longer than the server's deadline."""
+        deadline = body.get('deadline', self.deadline)
+        if not isinstance(deadline, (int, float)) or deadline <= 0:
+            raise HTTPError(400, "The deadline must be a positive number of seconds")
+        return min(deadline, self.deadline)
+
+    def new_game(self, body: dict) -> tuple:
+        """Create a game for POST /games."""
+        depth = body.get('depth', 5)
+        if type(depth) is not int or not 1 <= depth <= MAX_DEPTH:
+            raise HTTPError(400, f"The depth must be a whole number from 1 to {MAX_DEPTH}")
+        moves = body.get('moves', '')
+        if not isinstance(moves, (str, list)):
+            raise HTTPError(400, "The moves must be a string of columns or a list of columns")
+        logic = parse_moves(moves)
+
+        # Make room by ending the game that was used least recently
+        if len(self.sessions) >= self.max_sessions:
+            oldest = min(self.sessions, key=lambda game_id: self.sessions[game_id].last_used)
+            del self.sessions[oldest]
+
+        game_id = next(self.ids)
+        self.sessions[game_id] = GameSession(logic, depth)
+        return 201, self.sessions[game_id].state(game_id)
+
+    async def play(self, game_id: str, body: dict) -> tuple:
+        """Play a move and the engine's reply for POST /games/<id>/moves."""
+        session = self.session(game_id)
+        column = body.get('column')
+        if not isinstance(column, int) or not 0 <= column <= 6:
+            raise HTTPError(400, "The column must be a whole number from 0 to 6")
+        deadline = self.request_deadline(body)
+
+        async with session.lock:
+            if session.logic.check_last_move():
+                raise HTTPError(400, "The game is already over")
+
+            # Work on a copy, so the game is unchanged if the search fails
+            logic = session.logic.copy()
+            if not logic.make_move(column):
+                raise HTTPError(400, f"Column {column} is full")
+
+            reply = None
+            if not logic.check_last_move():
+                response = await self.search({'moves': [c for _, c in logic.moves], 'depth': session.depth},
+                                             deadline)
+                reply = response['move']
+                logic.make_move(reply)
+
+            session.logic = logic
+            state = session.state(int(game_id))
+            state['reply'] = reply
+            return 200, state
+
+    async def route(self, method: str, path: str, body: dict) -> tuple:
+        """Answer a request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path of the request, without the query string.
+            body (dict): The JSON body, or an empty dictionary.
+
+        Returns:
+            tuple: The HTTP status and the JSON response.
+        """
+        parts = [part for part in path.split('/') if part]
+        if parts == ['games'] and method == 'POST':
+            return self.new_game(body)
+        if len(parts) == 2 and parts[0] == 'games':
+            if method == 'GET':
+                return 200, self.session(parts[1]).state(int(parts[1]))
+            if method == 'DELETE':
+                self.session(parts[1])
+                del self.sessions[int(parts[1])]
+                return 200, {'id': int(parts[1])}
+        if len(parts) == 3 and parts[0] == 'games' and parts[2] == 'moves' and method == 'POST':
+            return await self.play(parts[1], body)
+        if parts == ['analyse'] and method == 'POST':
+            if body.get('solve') and 'nodes' not in body:
+                raise HTTPError(400, "A solve request needs a node limit")
+            depth = body.get('depth', 0)
+            if type(depth) is not int or depth < 0:
+                raise HTTPError(400, "The depth must be a whole number of at least 0")
+            time_limit = body.get('time', 0)
+            if not isinstance(time_limit, (int, float)) or isinstance(time_limit, bool) or time_limit < 0:
+                raise HTTPError(400, "The time must be a number of seconds")
+            nodes = body.get('nodes', 0)
+            if not isinstance(nodes, int) or isinstance(nodes, bool) or nodes < 0:
+                raise HTTPError(400, "The nodes must be a whole number")
+            if depth > MAX_DEPTH and 'time' not in body and 'nodes' not in body:
+                raise HTTPError(400, f"A search without a time or node limit may be at most {MAX_DEPTH} deep")
+            response = await self.search(body, self.request_deadline(body))
+            return (400 if 'error' in response else 200), response
+        if parts == ['status'] and method == 'GET':
+            return 200, {'games': len(self.sessions), 'pending': self.pending, 'max_pending': self.max_pending,
+                         'workers': self.workers}
+        if parts and parts[0] in ('games', 'analyse', 'status'):
+            raise HTTPError(405, f"{method} is not supported for {path}")
+        raise HTTPError(404, f"There is nothing at {path}")
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer the HTTP/1.1 requests of one connection until the client closes it.
+
+        Args:
+            reader (asyncio.StreamReader): The incoming stream.
+            writer (asyncio.StreamWriter): The outgoing stream.
+
+        Returns:
+            None
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                    length = int(headers.get('content-length', 0))
+                except ValueError:
+                    status, response, version = 400, {'error': "Malformed request"}, 'HTTP/1.0'
+                else:
+                    if length > MAX_BODY:
+                        status, response, version = 413, {'error': "The request body is too large"}, 'HTTP/1.0'
+                    else:
+                        body = await reader.readexactly(length) if length else b''
+                        status, response = await self.dispatch(method, target.split('?')[0], body)
+
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write(encode_response(status, response, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> tuple:
+        """Decode the body of a request, answer it and turn errors into error responses.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path of the request.
+            body (bytes): The raw body.
+
+        Returns:
+            tuple: The HTTP status and the JSON response.
+        """
+        try:
+            body = json.loads(body) if body.strip() else {}
+            if not isinstance(body, dict):
+                raise HTTPError(400, "The request body must be a JSON object")
+            return await self.route(method, path, body)
+        except HTTPError as e:
+            return e.status, {'error': e.message}
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            return 500, {'error': f"Internal error: {str(e) or type(e).__name__}"}
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765):
+        """Accept connections until the task is cancelled.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The port to listen on.
+
+        Returns:
+            None
+        """
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(args):
+    """Run the game server from the command line.
+
+    Usage: python -m engine serve-http [--host HOST] [--port PORT] [--workers N] [--max-pending N] [--deadline S]
+
+    Args:
+        args (list): The command line arguments after the command name.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(prog='python -m engine serve-http',
+                                     description="Serve many Connect Four games over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=8765, help="port to listen on")
+    parser.add_argument('--workers', type=int, default=2, help="search processes")
+    parser.add_argument('--max-pending', type=int, help="searches waiting or running before 503 (default 4 per worker)")
+    parser.add_argument('--deadline', type=float, default=10.0, help="maximum seconds per search before 504")
+    parser.add_argument('--book', help="path of an opening book to use")
+    parser.add_argument('--shared-tt', type=float, default=0, help="megabytes of a transposition table shared by "
+                                                                   "the workers (default: one table per worker)")
+    parser.add_argument('--tt-file', help="file the shared table is loaded from at start and saved to at exit")
+    args = parser.parse_args(args)
+
+    server = GameServer(args.workers, args.max_pending, args.deadline, book=args.book, shared_tt_mb=args.shared_tt,
+                        tt_file=args.tt_file)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
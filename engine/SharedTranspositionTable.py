@@ -0,0 +1,253 @@
+import os
+import struct
+from multiprocessing import shared_memory
+from .TranspositionTable import TranspositionTable
+
+# File header of a saved table: magic, version, number of slots
+FILE_HEADER = struct.Struct('<4sHQ')
+MAGIC = b'C4TT'
+VERSION = 1
+
+# Bit layout of the data word of a record (the other word is key ^ data)
+VALUE_OFFSET = 2 ** 31
+DEPTH_SHIFT = 32
+FLAG_SHIFT = 40
+MOVE_SHIFT = 42
+GENERATION_SHIFT = 45
+
+
+class SharedTranspositionTable:
+    """A transposition table in shared memory that several processes search with at the same time.
+
+    It has the same interface as TranspositionTable, but the slots are fixed-width records in a flat buffer:
+    two little-endian 64-bit words per slot. The second word packs depth, flag, value, move and generation; the
+    first is the key XOR the second. Processes read and write the buffer without locks. A record that another
+    process was writing at the same moment fails the key check on the next probe and counts as empty.
+
+    Create the table in one process and attach to it by name in the processes it starts with multiprocessing (they
+    share its resource tracker, which frees the block if the creator ends without calling unlink()):
+
+        table = SharedTranspositionTable(64)
+        other = SharedTranspositionTable.attach(table.name)
+
+    Values must fit in 32 bits and depths in 8 bits. The generation is kept per process, so with 'depth'
+    replacement an entry written by another process is treated like an entry of an earlier search.
+
+    Attributes:
+        size (int): The number of slots.
+        replacement (str): The replacement policy, 'depth' or 'always' (see TranspositionTable).
+        generation (int): The number of the current search of this process.
+        name (str): The name of the shared memory block, used by attach().
+        owner (bool): Whether this object created the block and frees it in unlink().
+    """
+
+    RECORD = struct.Struct('<QQ')
+
+    def __init__(self, max_mb: float = 32, replacement: str = 'depth', name: str = None):
+        """Create a new table in shared memory, or attach to an existing one.
+
+        Args:
+            max_mb (float): The size of the table in megabytes; ignored when attaching.
+            replacement (str): The replacement policy, 'depth' or 'always'.
+            name (str): The name of an existing table to attach to, or None to create one.
+
+        Returns:
+            None
+        """
+        if replacement not in TranspositionTable.REPLACEMENT_POLICIES:
+            raise ValueError("Replacement policy must be one of " +
+                             ", ".join(TranspositionTable.REPLACEMENT_POLICIES))
+
+        self.replacement = replacement
+        self.generation = 0
+        self.owner = name is None
+        if self.owner:
+            size = max(1, int(max_mb * 2 ** 20) // self.RECORD.size)
+            self.memory = shared_memory.SharedMemory(create=True, size=size * self.RECORD.size)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.size = self.memory.size // self.RECORD.size
+        self.name = self.memory.name
+        self.buffer = self.memory.buf
+        if self.owner:
+            self.clear()
+
+    @classmethod
+    def attach(cls, name: str, replacement: str = 'depth'):
+        """Attach to a table created by another process.
+
+        Args:
+            name (str): The name of the table.
+            replacement (str): The replacement policy of this process.
+
+        Returns:
+            SharedTranspositionTable: The table.
+        """
+        return cls(replacement=replacement, name=name)
+
+    @classmethod
+    def create(cls, max_mb: float, replacement: str = 'depth', path: str = None):
+        """Create a table and warm-load it from a file saved by an earlier run, if there is one.
+
+        Args:
+            max_mb (float): The size of the table in megabytes.
+            replacement (str): The replacement policy, 'depth' or 'always'.
+            path (str): The file to load, or None.
+
+        Returns:
+            SharedTranspositionTable: The table.
+        """
+        table = cls(max_mb, replacement)
+        if path is not None and os.path.exists(path):
+            table.load(path)
+        return table
+
+    def clear(self):
+        """Remove all entries from the table, for every process attached to it.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.buffer[:self.size * self.RECORD.size] = bytes(self.size * self.RECORD.size)
+
+    def new_search(self):
+        """Mark the start of a new search of this process, so entries of earlier searches become replaceable.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.generation += 1
+
+    def probe(self, key: int):
+        """Look up the entry of a position.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            tuple: The entry (key, depth, flag, value, move, generation), or None if the position is not stored.
+        """
+        check, data = self.RECORD.unpack_from(self.buffer, (key % self.size) * self.RECORD.size)
+        if data == 0 or check ^ data != key:
+            return None
+        move = (data >> MOVE_SHIFT) & 7
+        return (key, (data >> DEPTH_SHIFT) & 0xFF, (data >> FLAG_SHIFT) & 3, (data & 0xFFFFFFFF) - VALUE_OFFSET,
+                move if move < 7 else -1, data >> GENERATION_SHIFT)
+
+    def store(self, key: int, depth: int, flag: int, value, move: int):
+        """Store the search result of a position.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            depth (int): The remaining search depth of the result.
+            flag (int): EXACT, LOWER or UPPER.
+            value (int): The value found by the search.
+            move (int): The best column found, or -1 if unknown.
+
+        Returns:
+            None
+        """
+        offset = (key % self.size) * self.RECORD.size
+        generation = self.generation & 0xFF
+
+        # Keep a deeper entry of another position from the current search
+        if self.replacement == 'depth':
+            check, data = self.RECORD.unpack_from(self.buffer, offset)
+            if (data != 0 and check ^ data != key and data >> GENERATION_SHIFT == generation
+                    and (data >> DEPTH_SHIFT) & 0xFF > depth):
+                return
+
+        data = ((int(value) + VALUE_OFFSET) | depth << DEPTH_SHIFT | flag << FLAG_SHIFT | (move & 7) << MOVE_SHIFT
+                | generation << GENERATION_SHIFT)
+        self.RECORD.pack_into(self.buffer, offset, key ^ data, data)
+
+    def save(self, path: str):
+        """Write the table to a file, e.g. to warm-load it with load() when the workers start again.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            None
+        """
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(FILE_HEADER.pack(MAGIC, VERSION, self.size))
+            f.write(self.buffer[:self.size * self.RECORD.size])
+        os.replace(temp_path, path)
+
+    def load(self, path: str) -> int:
+        """Add the entries of a table saved with save().
+
+        A file of the same size is copied as a whole; otherwise every valid entry is stored again, which may drop
+        entries that collide in a smaller table.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            int: The number of entries in the file.
+        """
+        with open(path, 'rb') as f:
+            magic, version, size = FILE_HEADER.unpack(f.read(FILE_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a saved transposition table")
+            data = f.read(size * self.RECORD.size)
+
+        if size == self.size:
+            self.buffer[:len(data)] = data
+            return sum(1 for _, word in self.RECORD.iter_unpack(data) if word != 0)
+
+        count = 0
+        for check, word in self.RECORD.iter_unpack(data):
+            if word != 0:
+                key = check ^ word
+                move = (word >> MOVE_SHIFT) & 7
+                self.store(key, (word >> DEPTH_SHIFT) & 0xFF, (word >> FLAG_SHIFT) & 3,
+                           (word & 0xFFFFFFFF) - VALUE_OFFSET, move if move < 7 else -1)
+                count += 1
+        return count
+
+    def close(self):
+        """Detach this process from the table.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.buffer.release()
+        self.memory.close()
+
+    def shutdown(self, path: str = None):
+        """Save the table if a path is given, detach from it and free it if this object created it.
+
+        Args:
+            path (str): The file to save the table to, or None.
+
+        Returns:
+            None
+        """
+        if path is not None:
+            self.save(path)
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def unlink(self):
+        """Free the shared memory block; call this once, from the process that created the table, after close().
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.memory.unlink()
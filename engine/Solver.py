@@ -0,0 +1,297 @@
+import math
+import sys
+import time
+from .BitLogic import BitLogic
+from .Logic import Logic
+from .MiniMax import SearchTimeout
+from .MoveOrdering import CENTER_ORDER, CENTER_RANK
+from .TranspositionTable import TranspositionTable, LOWER, UPPER
+
+# Bit masks in the BitLogic layout (7 bits per column, bottom row first)
+BOTTOM_MASK = BitLogic.BOTTOM
+BOARD_MASK = BitLogic.BOARD
+COLUMN_MASKS = [0x3F << (column * 7) for column in range(7)]
+
+# The empty cells that would complete a line of four for a player (see BitLogic.winning_cells)
+winning_cells = BitLogic.winning_cells
+
+
+class Solver:
+    """An exact solver that computes the game-theoretic value of a position.
+
+    MiniMax stops at a fixed depth and guesses the rest with a heuristic. The solver searches to the end of the game
+    instead, with negamax, null-window searches and a transposition table, so it can tell how many moves a forced
+    win or loss takes.
+
+    A score is seen from the player to move. It is 0 for a draw, positive if the player to move can force a win and
+    negative if the opponent can. Its size is the number of empty cells the winner has left once they have won,
+    counted in the winner's own moves (22 minus the number of pieces of the winner at the end of the game), so a
+    faster win scores higher.
+
+    Attributes:
+        tt (TranspositionTable): Bounds on scores, keyed by BitLogic.position_key().
+        nodes (int): The number of positions visited by the last call to solve().
+        deadline (float): The time.perf_counter() at which a solve raises SearchTimeout, math.inf for none. It is
+            checked every TIME_CHECK_INTERVAL nodes and kept until the caller changes it.
+    """
+
+    # Number of nodes visited between two looks at the clock
+    TIME_CHECK_INTERVAL = 1024
+
+    def __init__(self, tt_mb: float = 64):
+        """Initialize the solver with an empty transposition table.
+
+        Args:
+            tt_mb (float): The memory cap of the transposition table in megabytes.
+
+        Returns:
+            None
+        """
+        self.tt = TranspositionTable(tt_mb, 'always')
+        self.nodes = 0
+        self.node_limit = None
+        self.deadline = math.inf
+
+    def solve(self, logic, node_limit: int = None) -> int:
+        """Compute the exact score of a position.
+
+        Args:
+            logic (Logic): The position, with the game not decided yet.
+            node_limit (int): Raise SearchTimeout after visiting this many positions, or None for no limit.
+
+        Returns:
+            int: The score for the player to move.
+        """
+        board = BitLogic.from_logic(logic)
+        self.nodes = 0
+        self.node_limit = node_limit
+        return self.solve_bits(board.bitboards[board.player - 1], board.bitboards[0] | board.bitboards[1],
+                               board.move_count)
+
+    def solve_bits(self, position: int, mask: int, moves: int) -> int:
+        """Compute the exact score of a position given as bitboards.
+
+        Args:
+            position (int): The pieces of the player to move.
+            mask (int): All pieces on the board.
+            moves (int): The number of pieces on the board.
+
+        Returns:
+            int: The score for the player to move.
+        """
+        # An immediate win is not handled by negamax
+        if winning_cells(position, mask) & (mask + BOTTOM_MASK):
+            return (43 - moves) // 2
+
+        # Narrow the score down with null-window searches
+        low = -((42 - moves) // 2)
+        high = (43 - moves) // 2
+        while low < high:
+            middle = low + (high - low) // 2
+            if middle <= 0 and int(low / 2) < middle:
+                middle = int(low / 2)
+            elif middle >= 0 and int(high / 2) > middle:
+                middle = int(high / 2)
+            result = self.negamax(position, mask, moves, middle, middle + 1)
+            if result <= middle:
+                high = result
+            else:
+                low = result
+        return low
+
+    def negamax(self, position: int, mask: int, moves: int, alpha: int, beta: int) -> int:
+        """Search a position whose player to move cannot win immediately.
+
+        Args:
+            position (int): The pieces of the player to move.
+            mask (int): All pieces on the board.
+            moves (int): The number of pieces on the board.
+            alpha (int): The lower end of the search window.
+            beta (int): The upper end of the search window.
+
+        Returns:
+            int: The exact score if it lies between alpha and beta, otherwise a bound on the side of the window it
+            fell out of.
+        """
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise SearchTimeout()
+        if self.nodes % self.TIME_CHECK_INTERVAL == 0 and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+
+        # Moves that do not hand the opponent an immediate win
+        possible = (mask + BOTTOM_MASK) & BOARD_MASK
+        opponent_wins = winning_cells(position ^ mask, mask)
+        forced = possible & opponent_wins
+        if forced:
+            # Two threats cannot both be blocked
+            if forced & (forced - 1):
+                return -((42 - moves) // 2)
+            possible = forced
+        playable = possible & ~(opponent_wins >> 1)
+        if not playable:
+            return -((42 - moves) // 2)
+
+        # The opponent plays one of the last two cells and cannot win with it
+        if moves >= 40:
+            return 0
+
+        # The opponent cannot win with their next move, so the score is at least this
+        low = -((40 - moves) // 2)
+        if alpha < low:
+            alpha = low
+            if alpha >= beta:
+                return alpha
+
+        # We cannot win with our next move, so the score is at most this
+        high = (41 - moves) // 2
+        key = position + mask + BOTTOM_MASK
+        entry = self.tt.probe(key)
+        if entry is not None:
+            if entry[2] == UPPER:
+                high = min(high, entry[3])
+            elif entry[3] > alpha:
+                alpha = entry[3]
+                if alpha >= beta:
+                    return alpha
+        if beta > high:
+            beta = high
+            if alpha >= beta:
+                return beta
+
+        # Try moves that create the most new threats first, central columns first among equals
+        candidates = []
+        for column in CENTER_ORDER:
+            move = playable & COLUMN_MASKS[column]
+            if move:
+                threats = (winning_cells(position | move, mask) & BOARD_MASK).bit_count()
+                candidates.append((-threats, CENTER_RANK[column], move))
+        candidates.sort()
+
+        for _, _, move in candidates:
+            score = -self.negamax(position ^ mask, mask | move, moves + 1, -beta, -alpha)
+            if score >= beta:
+                self.tt.store(key, 0, LOWER, score, -1)
+                return score
+            if score > alpha:
+                alpha = score
+
+        self.tt.store(key, 0, UPPER, alpha, -1)
+        return alpha
+
+    def analyze(self, logic, node_limit: int = None) -> list:
+        """Compute the exact score of every column of a position.
+
+        Args:
+            logic (Logic): The position, with the game not decided yet.
+            node_limit (int): Raise SearchTimeout after visiting this many positions in total, or None for no limit.
+
+        Returns:
+            list: For each column, the score for the player to move after playing it, or None if the column is full.
+            If the player to move can win at once, only the winning columns are scored, as no other move can be
+            better, and the others are None as well.
+
+        Raises:
+            ValueError: If the game is already decided or the board is full.
+        """
+        board = BitLogic.from_logic(logic)
+        position = board.bitboards[board.player - 1]
+        mask = board.bitboards[0] | board.bitboards[1]
+        if BitLogic.has_four(position ^ mask) or mask == BOARD_MASK:
+            raise ValueError("The game is already over")
+        self.nodes = 0
+        self.node_limit = node_limit
+
+        scores = [None] * 7
+
+        # Check if the player to move can win at once, then the other columns need not be solved
+        wins = winning_cells(position, mask) & (mask + BOTTOM_MASK)
+        if wins:
+            for column in range(7):
+                if wins & COLUMN_MASKS[column]:
+                    scores[column] = (43 - board.move_count) // 2
+            return scores
+
+        for column in range(7):
+            move = (mask + BOTTOM_MASK) & COLUMN_MASKS[column]
+            if move:
+                scores[column] = -self.solve_bits(position ^ mask, mask | move, board.move_count + 1)
+        return scores
+
+    def best_move(self, logic, node_limit: int = None) -> tuple:
+        """Find a move with the best exact score, preferring central columns among equals.
+
+        Args:
+            logic (Logic): The position, with the game not decided yet.
+            node_limit (int): Raise SearchTimeout after visiting this many positions in total, or None for no limit.
+
+        Returns:
+            tuple: The best column and its score for the player to move.
+
+        Raises:
+            ValueError: If the game is already decided or the board is full.
+        """
+        scores = self.analyze(logic, node_limit)
+        column = min((column for column in range(7) if scores[column] is not None),
+                     key=lambda column: (-scores[column], CENTER_RANK[column]))
+        return column, scores[column]
+
+    def solve_many(self, positions, node_limit: int = None) -> list:
+        """Solve a batch of positions, sharing the transposition table between them.
+
+        Args:
+            positions (iterable): Logic objects, or strings of column digits (0-6) played from the empty board.
+            node_limit (int): The node limit for each position, or None for no limit.
+
+        Returns:
+            list: The score of each position for its player to move.
+        """
+        scores = []
+        for position in positions:
+            if isinstance(position, str):
+                logic = Logic()
+                for column in position:
+                    logic.make_move(int(column))
+                position = logic
+            scores.append(self.solve(position, node_limit))
+        return scores
+
+
+def outcome(score: int, moves: int) -> tuple:
+    """Translate a score into the result of the game with perfect play.
+
+    Args:
+        score (int): A score returned by the solver.
+        moves (int): The number of pieces on the board of the position the score belongs to.
+
+    Returns:
+        tuple: ('win', n) if the player to move wins with their n-th move from now, ('loss', n) if the opponent wins
+        with their n-th move from now, or ('draw', 0).
+    """
+    if score > 0:
+        return 'win', 22 - score - moves // 2
+    if score < 0:
+        return 'loss', 22 + score - (moves + 1) // 2
+    return 'draw', 0
+
+
+def main(args):
+    """Solve positions and print the best move, score, outcome and node count of each.
+
+    Usage: python -m engine solve 3342... solves each line of column digits (0-6) read from the arguments or stdin
+
+    Args:
+        args (list): The command line arguments after the command name.
+
+    Returns:
+        None
+    """
+    solver = Solver()
+    for line in args or sys.stdin:
+        line = line.strip()
+        logic = Logic()
+        for column in line:
+            logic.make_move(int(column))
+        column, score = solver.best_move(logic)
+        result, n = outcome(score, logic.move_count)
+        print(line, column, score, result, n, solver.nodes)
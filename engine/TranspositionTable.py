@@ -0,0 +1,102 @@
+# Flags telling how a stored value relates to the true minimax value
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+
+class TranspositionTable:
+    """A bounded table of search results keyed by Zobrist key.
+
+    The table is a fixed number of slots; a position is stored in slot key % size. Each entry is a tuple
+    (key, depth, flag, value, move, generation), where the full key is kept to detect collisions between
+    positions sharing a slot.
+
+    Attributes:
+        size (int): The number of slots, derived from the memory cap.
+        replacement (str): 'depth' keeps the deeper of two colliding entries from the current search,
+            'always' lets the newest entry replace the old one.
+        slots (list): The stored entries, or None for empty slots.
+        generation (int): The number of the current search; entries from older searches are always replaced.
+    """
+
+    # Approximate number of bytes used by one stored entry (slot pointer, tuple and its integers)
+    ENTRY_BYTES = 160
+
+    REPLACEMENT_POLICIES = ('depth', 'always')
+
+    def __init__(self, max_mb: float = 32, replacement: str = 'depth'):
+        """Initialize an empty transposition table.
+
+        Args:
+            max_mb (float): The memory cap of the table in megabytes.
+            replacement (str): The replacement policy, 'depth' or 'always'.
+
+        Returns:
+            None
+        """
+        if replacement not in self.REPLACEMENT_POLICIES:
+            raise ValueError("Replacement policy must be one of " + ", ".join(self.REPLACEMENT_POLICIES))
+
+        self.size = max(1, int(max_mb * 2 ** 20) // self.ENTRY_BYTES)
+        self.replacement = replacement
+        self.generation = 0
+        self.clear()
+
+    def clear(self):
+        """Remove all entries from the table.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.slots = [None] * self.size
+
+    def new_search(self):
+        """Mark the start of a new search, so entries of earlier searches become replaceable.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.generation += 1
+
+    def probe(self, key: int):
+        """Look up the entry of a position.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            tuple: The entry (key, depth, flag, value, move, generation), or None if the position is not stored.
+        """
+        entry = self.slots[key % self.size]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, flag: int, value, move: int):
+        """Store the search result of a position.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            depth (int): The remaining search depth of the result.
+            flag (int): EXACT, LOWER or UPPER.
+            value (int): The value found by the search.
+            move (int): The best column found, or -1 if unknown.
+
+        Returns:
+            None
+        """
+        index = key % self.size
+        entry = self.slots[index]
+
+        # Keep a deeper entry of another position from the current search
+        if (self.replacement == 'depth' and entry is not None and entry[0] != key
+                and entry[5] == self.generation and entry[1] > depth):
+            return
+
+        self.slots[index] = (key, depth, flag, value, move, self.generation)
@@ -0,0 +1,16 @@
+"""The Connect Four engine: game logic, search, opening book and solver, without any GUI dependencies.
+
+Run 'python -m engine' for a command line interface that answers JSON requests read from stdin (see Protocol.py).
+BatchEval needs NumPy and is therefore not imported here; import it as engine.BatchEval. Neither is
+SharedTranspositionTable, which loads multiprocessing.
+"""
+from .Logic import Logic
+from .BitLogic import BitLogic
+from .TranspositionTable import TranspositionTable, EXACT, LOWER, UPPER
+from .MoveOrdering import MoveOrdering, CENTER_ORDER, CENTER_RANK
+from .SearchStats import SearchStats
+from .MiniMax import MiniMax, SearchTimeout
+from .OpeningBook import OpeningBook
+from .Solver import Solver, outcome
+from .AnalysisCache import AnalysisCache
+from .SearchWorker import SearchWorker
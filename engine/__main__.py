@@ -0,0 +1,65 @@
+import argparse
+import importlib
+import json
+import sys
+from .MiniMax import MiniMax
+from .OpeningBook import OpeningBook
+from .Protocol import handle_request
+from .Solver import Solver
+
+# Commands that run a tool of the engine instead of answering requests, with the module whose main() runs it.
+# The modules are imported only when their command is run, so answering requests starts without loading asyncio,
+# multiprocessing and the other modules the tools need.
+COMMANDS = {
+    'build-book': 'OpeningBook',
+    'solve': 'Solver',
+    'ordering': 'MoveOrdering',
+    'nodes': 'Positions',
+    'serve-http': 'Server',
+    'load': 'LoadGenerator',
+    'analyse-file': 'BatchAnalysis',
+    'records': 'GameRecords',
+    'bench': 'Benchmark',
+}
+
+def serve(args):
+    """Answer JSON requests read from stdin, one per line, with one JSON response per line on stdout.
+
+    Usage: python -m engine [--book PATH] [--tt-mb MB] < requests, for example
+        {"id": 1, "moves": "3342", "depth": 6}  ->  {"id": 1, "move": 3, "score": 13, "depth": 6, "nodes": 16328}
+    See Protocol.handle_request for the keys of a request.
+
+    Args:
+        args (list): The command line arguments.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(prog='python -m engine',
+                                     description="Answer Connect Four move requests, one JSON object per line. "
+                                                 f"Other commands: {', '.join(COMMANDS)}.")
+    parser.add_argument('--book', help="path of an opening book to use")
+    parser.add_argument('--tt-mb', type=float, default=32, help="memory cap of the transposition table in megabytes")
+    args = parser.parse_args(args)
+
+    mm = MiniMax(tt_mb=args.tt_mb, book=OpeningBook(args.book) if args.book else None)
+    solver = Solver()
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("A request must be a JSON object")
+        except ValueError as e:
+            response = {'error': str(e)}
+        else:
+            response = handle_request(request, mm, solver)
+        print(json.dumps(response), flush=True)
+
+
+if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+    importlib.import_module(f'.{COMMANDS[sys.argv[1]]}', __package__).main(sys.argv[2:])
+else:
+    serve(sys.argv[1:])
@@ -0,0 +1,52 @@
+from engine.AnalysisCache import AnalysisCache
+from engine.Logic import Logic
+from engine.MiniMax import MiniMax
+from engine.Positions import load_suite
+
+# Positions in which the best move at depth 3 is left of the centre and its mirror column scores the same
+TIES = load_suite(['03012442', '26115415630', '56321135', '0115'])
+
+POSITIONS = load_suite('opening') + load_suite('midgame') + load_suite('tactical') + TIES
+
+
+def mirrored(logic):
+    """Return the left-right mirror image of a position."""
+    mirror = Logic()
+    for _, column in logic.moves:
+        mirror.make_move(6 - column)
+    return mirror
+
+
+def children(logic):
+    """Yield the positions after each move that does not end the game, and their mirror images."""
+    for column in range(7):
+        child = logic.copy()
+        if child.make_move(column) and child.check_last_move() is None:
+            yield child
+            yield mirrored(child)
+
+
+def test_cached_positions_are_answered_like_a_search():
+    for logic in POSITIONS:
+        cache = AnalysisCache(MiniMax())
+        move = cache.get_best_move(logic, 3)
+        assert cache.get_best_move(logic, 3) == move
+        mirror = mirrored(logic)
+        assert cache.get_best_move(mirror, 3) == MiniMax().get_best_move(mirror, 3)
+        assert cache.hits == 2 and cache.misses == 1
+
+
+def test_table_entries_are_answered_like_a_search():
+    answered = 0
+    for logic in POSITIONS:
+        mm = MiniMax()
+        cache = AnalysisCache(mm)
+        mm.get_best_move(logic, 4)
+
+        # The moves of the root were searched to depth 4, which answers get_best_move to depth 3
+        for child in children(logic):
+            answer = cache.lookup(child, 3)
+            if answer is not None:
+                answered += 1
+                assert answer == MiniMax().get_best_move(child, 3)
+    assert answered > len(POSITIONS)
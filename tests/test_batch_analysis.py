@@ -0,0 +1,53 @@
+import json
+
+from engine.BatchAnalysis import analyse_lines, resume_point
+from engine.MiniMax import MiniMax
+from engine.Protocol import handle_request
+
+# The first position takes longest, so the later ones finish before it
+LINES = ['', '3342', '01234', '3332224', '33', '4443332']
+
+
+def read_results(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_results_are_written_in_input_order(tmp_path):
+    path = tmp_path / 'out.jsonl'
+    with open(path, 'w') as out:
+        assert analyse_lines([line + '\n' for line in LINES], out, depth=5, workers=2, window=4) == len(LINES)
+
+    results = read_results(path)
+    assert [(result['line'], result['moves']) for result in results] == list(enumerate(LINES, 1))
+    for result in results:
+        expected = handle_request({'moves': result['moves'], 'depth': 5}, MiniMax())
+        assert (result['move'], result['score']) == (expected['move'], expected['score'])
+
+
+def test_run_resumes_after_a_truncated_last_line(tmp_path):
+    path = tmp_path / 'out.jsonl'
+    with open(path, 'w') as out:
+        analyse_lines(LINES, out, depth=3, workers=2)
+    complete = read_results(path)
+
+    # Keep two results and half of the third, as if the run had been killed while writing it
+    with open(path, 'rb') as f:
+        data = f.read().splitlines(keepends=True)
+    with open(path, 'wb') as f:
+        f.write(b''.join(data[:2]) + data[2][:len(data[2]) // 2])
+
+    skip = resume_point(str(path))
+    assert skip == 2
+    assert read_results(path) == complete[:2]
+    with open(path, 'a') as out:
+        assert analyse_lines(LINES, out, depth=3, workers=2, skip=skip) == len(LINES) - 2
+
+    results = read_results(path)
+    assert [(result['line'], result['moves']) for result in results] == list(enumerate(LINES, 1))
+    assert [(result['move'], result['score']) for result in results] == [(result['move'], result['score'])
+                                                                          for result in complete]
+
+
+def test_resume_point_of_a_missing_file(tmp_path):
+    assert resume_point(str(tmp_path / 'out.jsonl')) == 0
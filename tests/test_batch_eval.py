@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from engine.Logic import Logic
+from engine.MiniMax import MiniMax
+from engine.Protocol import parse_moves
+
+np = pytest.importorskip('numpy')
+from engine.BatchEval import DRAW, NOT_OVER, RED_WINS, YELLOW_WINS, boards_from_logic, evaluate_batch
+
+RESULTS = {None: NOT_OVER, 'red': RED_WINS, 'yellow': YELLOW_WINS, 'draw': DRAW}
+
+
+def random_positions(games: int, seed: int) -> list:
+    """Return every position of random games played until they end, so won and full boards are included."""
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(games):
+        logic = Logic()
+        while logic.check_last_move() is None:
+            logic.make_move(rng.choice([j for j in range(7) if logic.board[0][j] == ' ']))
+            positions.append(logic.copy())
+    return positions
+
+
+def test_batch_matches_scan_board_and_check_win():
+    # A full board without a four, and one that the last piece fills with a four for yellow
+    positions = random_positions(200, 1) + [parse_moves('330254564223355224331121550404466660106011'),
+                                            parse_moves('622540464400611545423155216206211605033333')]
+
+    scores, terminal = evaluate_batch(boards_from_logic(positions), chunk_size=1000)
+    mm = MiniMax(tt_mb=0)
+    assert scores.tolist() == [mm.scan_board(logic) for logic in positions]
+    assert terminal.tolist() == [RESULTS[logic.check_win()] for logic in positions]
+    assert terminal[-2:].tolist() == [DRAW, YELLOW_WINS]
+    assert {RED_WINS, YELLOW_WINS, NOT_OVER} <= set(terminal.tolist())
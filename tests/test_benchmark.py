@@ -0,0 +1,44 @@
+import copy
+import json
+
+import pytest
+
+from engine.Benchmark import compare, main, run_benchmarks
+
+SEARCH = 'get_best_move/midgame/2'
+
+
+@pytest.fixture(scope='module')
+def report():
+    return run_benchmarks([2], repeat=1)
+
+
+def slow_baseline(report):
+    """Return a copy of a report whose times no new run can exceed, so only node counts can regress."""
+    baseline = copy.deepcopy(report)
+    for result in baseline['results'].values():
+        result['seconds'] = 3600.0
+    return baseline
+
+
+def test_changed_node_count_is_a_regression(report):
+    baseline = slow_baseline(report)
+    assert compare(report, baseline) == []
+
+    baseline['results'][SEARCH]['nodes'] = report['results'][SEARCH]['nodes'] // 2
+    assert [(name, key) for name, key, *_ in compare(report, baseline)] == [(SEARCH, 'nodes')]
+
+
+def test_bench_fails_against_a_baseline_with_fewer_nodes(report, tmp_path, capsys):
+    baseline = slow_baseline(report)
+    path = tmp_path / 'baseline.json'
+    path.write_text(json.dumps(baseline))
+    main(['--depths', '2', '--repeat', '1', '--out', str(tmp_path / 'same.json'), '--baseline', str(path)])
+    assert "No regressions" in capsys.readouterr().err
+
+    baseline['results'][SEARCH]['nodes'] = report['results'][SEARCH]['nodes'] // 2
+    path.write_text(json.dumps(baseline))
+    with pytest.raises(SystemExit) as error:
+        main(['--depths', '2', '--repeat', '1', '--out', str(tmp_path / 'worse.json'), '--baseline', str(path)])
+    assert error.value.code == 1
+    assert f"Regression: {SEARCH}" in capsys.readouterr().err
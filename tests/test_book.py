@@ -0,0 +1,39 @@
+from engine.Logic import Logic
+from engine.MiniMax import MiniMax
+from engine.OpeningBook import OpeningBook, book_positions, build_book
+
+
+def test_book_is_only_used_at_its_own_depths(tmp_path):
+    path = str(tmp_path / 'opening.book')
+    build_book(path, 1, range(2, 4))
+    mm = MiniMax(book=OpeningBook(path))
+
+    for depth in (2, 3):
+        mm.get_best_move(Logic(), depth)
+        assert mm.nodes == 0
+
+    # A shallower search must not play the book's stronger moves, nor a deeper one their weaker moves
+    for depth in (1, 4):
+        mm.get_best_move(Logic(), depth)
+        assert mm.nodes > 0
+
+    assert mm.search(Logic(), max_depth=3)[2] == 3 and mm.nodes == 0
+    assert mm.search(Logic(), max_depth=10)[2] == 3 and mm.nodes == 0
+    assert mm.search(Logic(), max_depth=1)[2] == 1 and mm.nodes > 0
+
+
+def test_book_moves_are_the_searched_moves(tmp_path):
+    path = str(tmp_path / 'opening.book')
+    build_book(path, 5, range(3, 4))
+    book = OpeningBook(path)
+    assert len(book) == len(book_positions(5))
+
+    # Every position and its mirror image, which shares its records
+    mm = MiniMax()
+    for moves in book_positions(5):
+        for mirror in (False, True):
+            logic = Logic()
+            for column in moves:
+                logic.make_move(6 - column if mirror else column)
+            for depth in book.depths:
+                assert book.lookup(logic, depth) == mm.get_best_move(logic, depth)
@@ -0,0 +1,23 @@
+import pytest
+
+from engine.GameRecords import GameReader, GameWriter, RED_WINS, import_games
+
+
+def test_games_round_trip(tmp_path):
+    path = str(tmp_path / 'games.c4gr')
+    assert import_games(['3344556', '', '0123456'], path) == 2
+    with GameReader(path) as reader:
+        assert [record.moves for record in reader] == [[3, 3, 4, 4, 5, 5, 6], [0, 1, 2, 3, 4, 5, 6]]
+        assert reader[0].result == RED_WINS
+
+
+@pytest.mark.parametrize('moves', [[3, 7], [-1], [3] * 43])
+def test_write_rejects_what_a_record_cannot_hold(tmp_path, moves):
+    with GameWriter(str(tmp_path / 'games.c4gr')) as writer:
+        with pytest.raises(ValueError):
+            writer.write(moves)
+
+
+def test_import_without_check_rejects_bad_columns(tmp_path):
+    with pytest.raises(ValueError, match="Line 2"):
+        import_games(['3344', '3389'], str(tmp_path / 'games.c4gr'), check=False)
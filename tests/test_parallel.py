@@ -0,0 +1,30 @@
+import pytest
+
+from engine.MiniMax import MiniMax
+from engine.Positions import load_suite
+from engine.SharedTranspositionTable import SharedTranspositionTable
+
+POSITIONS = load_suite('opening') + load_suite('midgame') + load_suite('endgame')
+
+
+@pytest.fixture(params=[False, True], ids=['own-tables', 'shared-table'])
+def parallel(request):
+    table = SharedTranspositionTable(4) if request.param else None
+    mm = MiniMax(workers=2, tt=table)
+    yield mm
+    mm.close()
+    if table is not None:
+        table.shutdown()
+
+
+def test_parallel_search_matches_serial_search(parallel):
+    serial = MiniMax()
+    for depth in (3, 4):
+        assert ([parallel.get_best_move(logic, depth) for logic in POSITIONS] ==
+                [serial.get_best_move(logic, depth) for logic in POSITIONS])
+
+
+def test_parallel_deepening_matches_serial_deepening(parallel):
+    serial = MiniMax()
+    for logic in POSITIONS:
+        assert parallel.search(logic, max_depth=4) == serial.search(logic, max_depth=4)
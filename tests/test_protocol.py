@@ -0,0 +1,16 @@
+import pytest
+
+from engine.MiniMax import MiniMax
+from engine.Protocol import handle_request
+
+
+@pytest.mark.parametrize('depth', [-1, True, 2.5, '3', None])
+def test_bad_depth_is_an_error(depth):
+    mm = MiniMax()
+    assert 'error' in handle_request({'moves': '33', 'depth': depth}, mm)
+    assert 'error' in handle_request({'moves': '33', 'depth': depth, 'nodes': 1000}, mm)
+
+
+def test_request_is_answered():
+    response = handle_request({'id': 7, 'moves': '3342', 'depth': 0}, MiniMax())
+    assert response['id'] == 7 and 0 <= response['move'] <= 6 and response['depth'] == 0
@@ -0,0 +1,84 @@
+import pytest
+
+from engine.BitLogic import BitLogic
+from engine.MiniMax import MiniMax
+from engine.MoveOrdering import CENTER_RANK
+from engine.Positions import SUITES, load_suite
+
+# Every position of the suites in Positions.py
+POSITIONS = [logic for suite in SUITES for logic in load_suite(suite)]
+
+# The search variants that must give the same move and value as plain minimax
+VARIANTS = {
+    'alphabeta': {},
+    'pvs': {'algorithm': 'pvs'},
+    'bitlogic': {'backend': BitLogic},
+    'bitlogic-pvs': {'backend': BitLogic, 'algorithm': 'pvs'},
+    'no-tt': {'tt_mb': 0},
+    'always-replace': {'tt_replacement': 'always'},
+}
+
+
+def plain_minimax(board, depth: int, mm: MiniMax) -> int:
+    """Search without pruning, table or move ordering, with the same values as MiniMax.minimax."""
+    result = board.check_last_move()
+    if result == 'red':
+        return 200000
+    if result == 'yellow':
+        return -200000
+    if result == 'draw':
+        return 0
+    if depth == 0:
+        return mm.scan_board(board)
+
+    values = []
+    for column in range(7):
+        if board.make_move(column):
+            values.append(plain_minimax(board, depth - 1, mm))
+            board.unmake_move(column)
+    return max(values) if board.player == 1 else min(values)
+
+
+def plain_best_move(logic, depth: int, mm: MiniMax) -> tuple:
+    """Return the move and value get_best_move should give, breaking ties like MiniMax.search_root."""
+    board = logic.copy()
+    sign = 1 if board.player == 1 else -1
+    best = None
+    for column in range(7):
+        if board.make_move(column):
+            value = plain_minimax(board, depth, mm)
+            board.unmake_move(column)
+            if best is None or (sign * value, -CENTER_RANK[column]) > (sign * best[1], -CENTER_RANK[best[0]]):
+                best = (column, value)
+    return best
+
+
+@pytest.fixture(scope='module')
+def expected():
+    mm = MiniMax(tt_mb=0)
+    return {depth: [plain_best_move(logic, depth, mm) for logic in POSITIONS] for depth in (1, 2, 3)}
+
+
+@pytest.mark.parametrize('variant', VARIANTS)
+def test_variants_match_plain_minimax(variant, expected):
+    # One engine for all searches, so a result may not depend on what the table holds from earlier searches
+    mm = MiniMax(**VARIANTS[variant])
+    for depth, moves in expected.items():
+        assert [mm.get_best_move(logic, depth) for logic in POSITIONS] == moves
+
+
+@pytest.mark.parametrize('variant', [name for name in VARIANTS if name != 'alphabeta'])
+def test_variants_match_alphabeta(variant):
+    baseline = MiniMax()
+    mm = MiniMax(**VARIANTS[variant])
+    for depth in (3, 4):
+        assert ([mm.get_best_move(logic, depth) for logic in POSITIONS] ==
+                [baseline.get_best_move(logic, depth) for logic in POSITIONS])
+
+
+@pytest.mark.parametrize('algorithm', MiniMax.ALGORITHMS)
+def test_iterative_deepening_matches_fixed_depth(algorithm):
+    mm = MiniMax(algorithm=algorithm)
+    for logic in POSITIONS:
+        # A forced win or loss may end the deepening early, with the same move and value
+        assert mm.search(logic, max_depth=4)[:2] == MiniMax().get_best_move(logic, 4)
@@ -0,0 +1,101 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from engine import Server
+
+
+def test_search_stops_at_deadline_after_longer_search():
+    Server._init_worker(32, None)
+
+    # A search with many nodes first, so a stale budget check of the engine would come too late
+    assert Server._search({'moves': '', 'depth': 7}, time.time() + 60) is not None
+
+    started = time.perf_counter()
+    assert Server._search({'moves': '', 'depth': 12}, time.time() + 0.1) is None
+    assert time.perf_counter() - started < 0.25
+
+
+def test_timed_search_returns_within_deadline():
+    Server._init_worker(32, None)
+    Server._search({'moves': '', 'depth': 7}, time.time() + 60)
+
+    started = time.perf_counter()
+    response = Server._search({'moves': '', 'time': 5}, time.time() + 0.1)
+    assert time.perf_counter() - started < 0.25
+    assert response is not None and 0 <= response['move'] <= 6
+
+
+def test_solve_stops_at_deadline():
+    Server._init_worker(32, None)
+
+    started = time.perf_counter()
+    assert Server._search({'moves': '', 'solve': True, 'nodes': 10 ** 9}, time.time() + 0.1) is None
+    assert time.perf_counter() - started < 0.25
+
+
+def run_dispatch(server, method, path, body):
+    return asyncio.run(server.dispatch(method, path, json.dumps(body).encode()))
+
+
+@pytest.fixture
+def server():
+    server = Server.GameServer(workers=1, max_pending=2, deadline=0.2)
+    server.pool.shutdown()
+
+    # Searches run in a thread of this process, so _search can be replaced
+    server.pool = ThreadPoolExecutor(1)
+    yield server
+    server.pool.shutdown()
+
+
+def test_bad_time_and_nodes_are_rejected(server):
+    assert run_dispatch(server, 'POST', '/analyse', {'time': 'x'})[0] == 400
+    assert run_dispatch(server, 'POST', '/analyse', {'nodes': 1.5})[0] == 400
+    assert run_dispatch(server, 'POST', '/games', {'moves': 5})[0] == 400
+
+
+@pytest.mark.parametrize('depth', [-1, True, 2.5, '3'])
+def test_bad_depth_is_rejected(server, monkeypatch, depth):
+    # The request must be rejected before it takes a worker
+    monkeypatch.setattr(Server, '_search', None)
+    assert run_dispatch(server, 'POST', '/analyse', {'depth': depth})[0] == 400
+    assert run_dispatch(server, 'POST', '/analyse', {'depth': depth, 'time': 0.1})[0] == 400
+    assert run_dispatch(server, 'POST', '/games', {'depth': depth})[0] == 400
+
+
+def test_unexpected_error_is_answered_with_500(server, monkeypatch):
+    def fail(request, deadline):
+        raise RuntimeError("broken")
+
+    monkeypatch.setattr(Server, '_search', fail)
+    status, response = run_dispatch(server, 'POST', '/analyse', {'depth': 1})
+    assert status == 500 and 'broken' in response['error']
+
+
+def test_abandoned_search_stays_pending_until_it_finishes(server, monkeypatch):
+    finish = threading.Event()
+
+    def slow(request, deadline):
+        finish.wait(5)
+        return {'move': 3}
+
+    monkeypatch.setattr(Server, '_search', slow)
+    monkeypatch.setattr(Server, 'DEADLINE_GRACE', 0)
+
+    async def scenario():
+        status, _ = await server.dispatch('POST', '/analyse', b'{"depth": 1}')
+        assert status == 504
+        assert server.pending == 1
+        finish.set()
+        for _ in range(100):
+            if server.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert server.pending == 0
+
+    asyncio.run(scenario())
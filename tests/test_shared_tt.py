@@ -0,0 +1,98 @@
+import multiprocessing
+
+import pytest
+
+from engine.MiniMax import MiniMax
+from engine.Positions import load_suite
+from engine.SharedTranspositionTable import SharedTranspositionTable
+from engine.TranspositionTable import EXACT, LOWER, UPPER
+
+
+@pytest.fixture
+def table():
+    table = SharedTranspositionTable(1)
+    yield table
+    table.shutdown()
+
+
+def store_entries(name: str):
+    """Attach to a table and store entries in it. This runs in a child process."""
+    table = SharedTranspositionTable.attach(name)
+    table.store(12345, 7, LOWER, -250, 2)
+    table.store(2 ** 63 + 99, 3, UPPER, 200000, -1)
+    table.close()
+
+
+def test_entries_round_trip(table):
+    table.store(12345, 7, EXACT, -250, 2)
+    table.store(2 ** 63 + 99, 3, UPPER, -200000, -1)
+    assert table.probe(12345)[:5] == (12345, 7, EXACT, -250, 2)
+    assert table.probe(2 ** 63 + 99)[:5] == (2 ** 63 + 99, 3, UPPER, -200000, -1)
+    assert table.probe(777) is None
+
+
+def test_torn_record_is_rejected(table):
+    table.store(12345, 7, EXACT, -250, 2)
+
+    # Change the data word without the check word, as a write of another process that is only half done would
+    offset = (12345 % table.size) * table.RECORD.size
+    check, data = table.RECORD.unpack_from(table.buffer, offset)
+    table.RECORD.pack_into(table.buffer, offset, check, data ^ (1 << 33))
+    assert table.probe(12345) is None
+
+
+def test_deeper_entry_is_kept_until_the_next_search(table):
+    other = 12345 + table.size
+    table.store(12345, 7, EXACT, 10, 2)
+    table.store(other, 3, EXACT, 20, 4)
+    assert table.probe(12345) is not None and table.probe(other) is None
+
+    table.new_search()
+    table.store(other, 3, EXACT, 20, 4)
+    assert table.probe(12345) is None and table.probe(other)[3] == 20
+
+
+def test_entries_are_shared_saved_and_warm_loaded(table, tmp_path):
+    process = multiprocessing.Process(target=store_entries, args=(table.name,))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    assert table.probe(12345)[:5] == (12345, 7, LOWER, -250, 2)
+
+    path = str(tmp_path / 'table.tt')
+    table.save(path)
+
+    # A table of the same size is copied as a whole, a smaller one stores every entry again
+    for max_mb in (1, 0.5):
+        loaded = SharedTranspositionTable.create(max_mb, path=path)
+        try:
+            assert loaded.probe(12345)[:5] == (12345, 7, LOWER, -250, 2)
+            assert loaded.probe(2 ** 63 + 99)[:5] == (2 ** 63 + 99, 3, UPPER, 200000, -1)
+        finally:
+            loaded.shutdown()
+
+
+def test_parallel_search_with_warm_loaded_table_matches_serial_search(tmp_path):
+    positions = load_suite('midgame') + load_suite('tactical')
+    path = str(tmp_path / 'table.tt')
+
+    # Fill a table with the searches of one run and save it, like the server does when it stops
+    table = SharedTranspositionTable(4)
+    mm = MiniMax(workers=2, tt=table)
+    try:
+        for logic in positions:
+            mm.get_best_move(logic, 3)
+    finally:
+        mm.close()
+        table.shutdown(path)
+
+    table = SharedTranspositionTable.create(4, path=path)
+    mm = MiniMax(workers=2, tt=table)
+    serial = MiniMax()
+    try:
+        for depth in (3, 4):
+            assert ([mm.get_best_move(logic, depth) for logic in positions] ==
+                    [serial.get_best_move(logic, depth) for logic in positions])
+    finally:
+        mm.close()
+        table.shutdown()
@@ -0,0 +1,24 @@
+import pytest
+
+from engine.Protocol import parse_moves
+from engine.Solver import Solver
+
+
+def test_immediate_win_is_found_without_search():
+    solver = Solver()
+    scores = solver.analyze(parse_moves('010101'))
+    assert scores == [18, None, None, None, None, None, None]
+    assert solver.nodes == 0
+    assert solver.best_move(parse_moves('010101')) == (0, 18)
+
+
+def test_finished_game_is_rejected():
+    with pytest.raises(ValueError):
+        Solver().best_move(parse_moves('330254564223355224331121550404466660106011'))
+    with pytest.raises(ValueError):
+        Solver().best_move(parse_moves('0101010'))
+
+
+def test_best_move_scores_the_position():
+    solver = Solver()
+    assert solver.solve(parse_moves('33435455')) == solver.best_move(parse_moves('33435455'))[1]
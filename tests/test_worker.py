@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from engine.Logic import Logic
+from engine.MiniMax import MiniMax
+from engine.SearchWorker import SearchWorker
+
+
+def wait_for(worker, condition, timeout=5):
+    """Poll the worker like the GUI does until the condition holds."""
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < deadline
+        worker.poll()
+        time.sleep(0.01)
+
+
+def fail():
+    raise ValueError("no move")
+
+
+def test_failing_job_goes_to_errback_and_worker_goes_on():
+    worker = SearchWorker(MiniMax())
+    errors, results = [], []
+
+    worker.submit(results.append, fail, errback=errors.append)
+    worker.submit(results.append, worker.mm.get_best_move, Logic(), 2)
+    wait_for(worker, lambda: results)
+
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
+    assert 0 <= results[0][0] <= 6
+
+
+def test_failing_job_without_errback_is_raised_from_poll():
+    worker = SearchWorker(MiniMax())
+    results = []
+
+    worker.submit(results.append, fail)
+    worker.submit(results.append, lambda: 'next')
+    with pytest.raises(ValueError):
+        wait_for(worker, lambda: results)
+    wait_for(worker, lambda: results)
+    assert results == ['next']